@@ -69,16 +69,11 @@ class Bank(commands.Cog):
     async def bankset(self, ctx: commands.Context):
         """Base command for bank settings."""
         if ctx.invoked_subcommand is None:
-            if await bank.is_global():
-                bank_name = await bank._conf.bank_name()
-                currency_name = await bank._conf.currency()
-                default_balance = await bank._conf.default_balance()
-            else:
-                if not ctx.guild:
-                    return
-                bank_name = await bank._conf.guild(ctx.guild).bank_name()
-                currency_name = await bank._conf.guild(ctx.guild).currency()
-                default_balance = await bank._conf.guild(ctx.guild).default_balance()
+            if not ctx.guild and not await bank.is_global():
+                return
+            bank_name = await bank.get_bank_name(ctx.guild)
+            currency_name = await bank.get_currency_name(ctx.guild)
+            default_balance = await bank.get_default_balance(ctx.guild)
 
             settings = _(
                 "Bank settings:\n\nBank name: {bank_name}\nCurrency: {currency_name}\n"
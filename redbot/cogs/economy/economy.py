@@ -271,8 +271,11 @@ class Economy(commands.Cog):
                         ).format(currency=credits_name, new_balance=exc.max_balance)
                     )
                     return
-                next_payday = cur_time + await self.config.PAYDAY_TIME()
-                await self.config.user(author).next_payday.set(next_payday)
+                payday_time = await self.config.PAYDAY_TIME()
+                next_payday = cur_time + payday_time
+                await self.config.user(author).next_payday.set(
+                    next_payday, expire_after=payday_time
+                )
 
                 pos = await bank.get_leaderboard_position(author)
                 await ctx.send(
@@ -319,8 +322,11 @@ class Economy(commands.Cog):
                         ).format(currency=credits_name, new_balance=exc.max_balance)
                     )
                     return
-                next_payday = cur_time + await self.config.guild(guild).PAYDAY_TIME()
-                await self.config.member(author).next_payday.set(next_payday)
+                payday_time = await self.config.guild(guild).PAYDAY_TIME()
+                next_payday = cur_time + payday_time
+                await self.config.member(author).next_payday.set(
+                    next_payday, expire_after=payday_time
+                )
                 pos = await bank.get_leaderboard_position(author)
                 await ctx.send(
                     _(
@@ -1,6 +1,6 @@
 import discord
 import re
-from typing import Union, Set
+from typing import Dict, FrozenSet, Set, Tuple, Union
 
 from redbot.core import checks, Config, modlog, commands
 from redbot.core.bot import Red
@@ -32,9 +32,37 @@ class Filter(commands.Cog):
         self.settings.register_member(**default_member_settings)
         self.settings.register_channel(**default_channel_settings)
         self.register_task = self.bot.loop.create_task(self.register_filterban())
+        # Maps a (scope, ID) pair to its filtered phrases and words
+        self._word_lists: Dict[Tuple[str, str], Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        for scope in (Config.GUILD, Config.CHANNEL):
+            self.settings.on_change(scope, [], self._invalidate_word_list)
 
     def __unload(self):
         self.register_task.cancel()
+        for scope in (Config.GUILD, Config.CHANNEL):
+            self.settings.remove_change_listener(scope, [], self._invalidate_word_list)
+
+    def _invalidate_word_list(self, identifiers: Tuple[str, ...]):
+        if len(identifiers) > 1:
+            self._word_lists.pop(identifiers[:2], None)
+        else:
+            self._word_lists.clear()
+
+    async def _get_word_list(
+        self, scope: str, obj: Union[discord.Guild, discord.TextChannel]
+    ) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        key = (scope, str(obj.id))
+        try:
+            return self._word_lists[key]
+        except KeyError:
+            pass
+        if scope == Config.GUILD:
+            word_list = set(await self.settings.guild(obj).filter())
+        else:
+            word_list = set(await self.settings.channel(obj).filter())
+        phrases = frozenset(x for x in word_list if len(RE_WORD_SPLIT.split(x)) > 1)
+        ret = self._word_lists[key] = (phrases, frozenset(word_list - phrases))
+        return ret
 
     @staticmethod
     async def register_filterban():
@@ -323,21 +351,24 @@ class Filter(commands.Cog):
         self, text: str, server_or_channel: Union[discord.Guild, discord.TextChannel]
     ) -> Set[str]:
         if isinstance(server_or_channel, discord.Guild):
-            word_list = set(await self.settings.guild(server_or_channel).filter())
+            filtered_phrases, filtered_words = await self._get_word_list(
+                Config.GUILD, server_or_channel
+            )
         elif isinstance(server_or_channel, discord.TextChannel):
-            word_list = set(
-                await self.settings.guild(server_or_channel.guild).filter()
-                + await self.settings.channel(server_or_channel).filter()
+            guild_phrases, guild_words = await self._get_word_list(
+                Config.GUILD, server_or_channel.guild
+            )
+            channel_phrases, channel_words = await self._get_word_list(
+                Config.CHANNEL, server_or_channel
             )
+            filtered_phrases = guild_phrases | channel_phrases
+            filtered_words = guild_words | channel_words
         else:
             raise TypeError("%r should be Guild or TextChannel" % server_or_channel)
 
         content = text.lower()
         msg_words = set(RE_WORD_SPLIT.split(content))
 
-        filtered_phrases = {x for x in word_list if len(RE_WORD_SPLIT.split(x)) > 1}
-        filtered_words = word_list - filtered_phrases
-
         hits = {p for p in filtered_phrases if p in content}
         hits |= filtered_words & msg_words
         return hits
@@ -354,10 +385,14 @@ class Filter(commands.Cog):
         if filter_count > 0 and filter_time > 0:
             if message.created_at.timestamp() >= next_reset_time:
                 next_reset_time = message.created_at.timestamp() + filter_time
-                await self.settings.member(author).next_reset_time.set(next_reset_time)
+                # Both values are cleared once the period is over, so
+                # members who stop being filtered don't keep any data.
+                await self.settings.member(author).next_reset_time.set(
+                    next_reset_time, expire_after=filter_time
+                )
                 if user_count > 0:
                     user_count = 0
-                    await self.settings.member(author).filter_count.set(user_count)
+                    await self.settings.member(author).filter_count.clear()
 
         hits = await self.filter_hits(message.content, message.channel)
 
@@ -369,7 +404,9 @@ class Filter(commands.Cog):
             else:
                 if filter_count > 0 and filter_time > 0:
                     user_count += 1
-                    await self.settings.member(author).filter_count.set(user_count)
+                    await self.settings.member(author).filter_count.set(
+                        user_count, expire_after=next_reset_time - message.created_at.timestamp()
+                    )
                     if (
                         user_count >= filter_count
                         and message.created_at.timestamp() < next_reset_time
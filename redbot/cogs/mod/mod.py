@@ -1559,10 +1559,15 @@ class Mod(commands.Cog):
         while self == self.bot.get_cog("Mod"):
             for guild in self.bot.guilds:
                 async with self.settings.guild(guild).current_tempbans() as guild_tempbans:
-                    for uid in guild_tempbans.copy():
-                        unban_time = datetime.utcfromtimestamp(
-                            await self.settings.member(member(uid, guild)).banned_until()
+                    tempbans = guild_tempbans.copy()
+                    banned_until = await self.settings.get_many(
+                        *(
+                            self.settings.member(member(uid, guild)).banned_until
+                            for uid in tempbans
                         )
+                    )
+                    for uid, timestamp in zip(tempbans, banned_until):
+                        unban_time = datetime.utcfromtimestamp(timestamp)
                         now = datetime.utcnow()
                         if now > unban_time:  # Time to unban the user
                             user = await self.bot.get_user_info(uid)
@@ -167,8 +167,7 @@ class Reports(commands.Cog):
 
         files: List[discord.File] = await Tunnel.files_from_attatch(msg)
 
-        ticket_number = await self.config.guild(guild).next_ticket()
-        await self.config.guild(guild).next_ticket.set(ticket_number + 1)
+        ticket_number = await self.config.guild(guild).next_ticket.inc() - 1
 
         if await self.bot.embed_requested(channel, author):
             em = discord.Embed(description=report)
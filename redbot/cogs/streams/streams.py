@@ -567,8 +567,10 @@ class Streams(commands.Cog):
         if await settings.mention_here():
             mentions.append("@here")
         can_manage_roles = guild.me.guild_permissions.manage_roles
-        for role in guild.roles:
-            if await self.db.role(role).mention():
+        roles = guild.roles
+        mention_roles = await self.db.get_many(*(self.db.role(role).mention for role in roles))
+        for role, mention in zip(roles, mention_roles):
+            if mention:
                 if can_manage_roles and not role.mentionable:
                     try:
                         await role.edit(mentionable=True)
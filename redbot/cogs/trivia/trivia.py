@@ -333,20 +333,18 @@ class Trivia(commands.Cog):
                 ).format(field_name=sort_by, prefix=ctx.prefix)
             )
             return
-        data = await self.conf.all_members()
         collated_data = {}
-        for guild_id, guild_data in data.items():
+        async for guild_id, member_id, member_data in self.conf.iter_members():
             guild = ctx.bot.get_guild(guild_id)
             if guild is None:
                 continue
-            for member_id, member_data in guild_data.items():
-                member = guild.get_member(member_id)
-                if member is None:
-                    continue
-                collated_member_data = collated_data.get(member, Counter())
-                for v_key, value in member_data.items():
-                    collated_member_data[v_key] += value
-                collated_data[member] = collated_member_data
+            member = guild.get_member(member_id)
+            if member is None:
+                continue
+            collated_member_data = collated_data.get(member, Counter())
+            for v_key, value in member_data.items():
+                collated_member_data[v_key] += value
+            collated_data[member] = collated_member_data
         await self.send_leaderboard(ctx, collated_data, key, top)
 
     @staticmethod
@@ -473,15 +471,16 @@ class Trivia(commands.Cog):
 
         """
         max_score = session.settings["max_score"]
-        for member, score in session.scores.items():
-            if member.id == session.ctx.bot.user.id:
-                continue
-            stats = await self.conf.member(member).all()
-            if score == max_score:
-                stats["wins"] += 1
-            stats["total_score"] += score
-            stats["games"] += 1
-            await self.conf.member(member).set(stats)
+        # Every player's stats are saved together
+        async with self.conf.transaction():
+            for member, score in session.scores.items():
+                if member.id == session.ctx.bot.user.id:
+                    continue
+                stats = self.conf.member(member)
+                if score == max_score:
+                    await stats.wins.inc()
+                await stats.total_score.inc(score)
+                await stats.games.inc()
 
     def get_trivia_list(self, category: str) -> dict:
         """Get the trivia list corresponding to the given category.
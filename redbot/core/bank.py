@@ -1,9 +1,32 @@
+import asyncio
+import bisect
+import contextlib
 import datetime
-from typing import Union, List, Optional
+import functools
+import itertools
+import logging
+import os
+import weakref
+from pathlib import Path
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Union,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import discord
 
 from . import Config, errors
+from .data_manager import core_data_path
+from .json_io import MINIFIED, dumps, loads
 
 __all__ = [
     "MAX_BALANCE",
@@ -14,6 +37,8 @@ __all__ = [
     "deposit_credits",
     "can_spend",
     "transfer_credits",
+    "bulk_deposit",
+    "bulk_set_balance",
     "wipe_bank",
     "get_account",
     "is_global",
@@ -33,6 +58,7 @@ _DEFAULT_GLOBAL = {
     "bank_name": "Twentysix bank",
     "currency": "credits",
     "default_balance": 100,
+    "ledger_checkpoint": 0,
 }
 
 _DEFAULT_GUILD = {"bank_name": "Twentysix bank", "currency": "credits", "default_balance": 100}
@@ -41,16 +67,80 @@ _DEFAULT_MEMBER = {"name": "", "balance": 0, "created_at": 0}
 
 _DEFAULT_USER = _DEFAULT_MEMBER
 
+log = logging.getLogger("red.bank")
+
 _conf: Config = None
 
+_ledger: "_Ledger" = None
+
+# An account's guild ID (or None in the global bank) and user ID
+_AccountKey = Tuple[Optional[int], int]
+
+# Whether the bank is global, or None if it hasn't been read from Config
+_is_global: Optional[bool] = None
+
+# Maps each bank scope (a guild ID, or None for the global bank) to its
+# settings
+_settings: Dict[Optional[int], dict] = {}
+
+# Incremented whenever the settings change, so settings read from Config
+# before a change aren't cached after it
+_settings_version = 0
+
+# Maps each bank scope (a guild ID, or None for the global bank) to its
+# accounts sorted by balance
+_leaderboards: Dict[Optional[int], "_Leaderboard"] = {}
+
 
 def _init():
-    global _conf
+    global _conf, _ledger
+    _leaderboards.clear()
+    _ledger = _Ledger()
+    if _conf is not None:
+        for scope in (Config.GLOBAL, Config.GUILD):
+            _conf.remove_change_listener(scope, [], _invalidate_settings)
+    _invalidate_settings(())
     _conf = Config.get_conf(None, 384734293238749, cog_name="Bank", force_registration=True)
     _conf.register_global(**_DEFAULT_GLOBAL)
     _conf.register_guild(**_DEFAULT_GUILD)
     _conf.register_member(**_DEFAULT_MEMBER)
     _conf.register_user(**_DEFAULT_USER)
+    for scope in (Config.GLOBAL, Config.GUILD):
+        _conf.on_change(scope, [], _invalidate_settings)
+
+
+def _invalidate_settings(identifiers: Tuple[str, ...]):
+    global _is_global, _settings_version
+    if identifiers[1:2] == ("ledger_checkpoint",):
+        return
+    _settings_version += 1
+    if identifiers[:1] == (Config.GUILD,) and len(identifiers) > 1:
+        _settings.pop(int(identifiers[1]), None)
+    else:
+        _is_global = None
+        _settings.clear()
+
+
+async def _get_settings(guild: Optional[discord.Guild]) -> Optional[dict]:
+    """Get the settings of the bank used in ``guild``.
+
+    Returns :code:`None` if the bank is guild-specific and no guild was given.
+    """
+    if await is_global():
+        key = None
+    elif guild is None:
+        return None
+    else:
+        key = guild.id
+    try:
+        return _settings[key]
+    except KeyError:
+        pass
+    version = _settings_version
+    settings = await (_conf if key is None else _conf.guild(guild)).all()
+    if version == _settings_version:
+        _settings[key] = settings
+    return settings
 
 
 class Account:
@@ -64,6 +154,433 @@ class Account:
         self.created_at = created_at
 
 
+class _Leaderboard:
+    """The accounts in one bank scope, kept sorted by balance.
+
+    The accounts are loaded from Config the first time they are needed,
+    and then kept up to date by the ledger, so a member's position can
+    be found with a binary search instead of sorting every account.
+    Accounts which are updated before the others are loaded are kept.
+    """
+
+    def __init__(self):
+        self.accounts: Dict[int, dict] = {}
+        # (negated balance, ID) pairs in ascending order
+        self._order: List[Tuple[int, int]] = []
+        self.loaded = False
+        self.lock = asyncio.Lock()
+
+    def load(self, accounts: Dict[int, dict]):
+        for user_id, account in accounts.items():
+            self.accounts.setdefault(user_id, account)
+        self._order = sorted((-acc["balance"], user_id) for user_id, acc in self.accounts.items())
+        self.loaded = True
+
+    def update(self, user_id: int, account: dict):
+        old = self.accounts.get(user_id)
+        if old is not None:
+            del self._order[bisect.bisect_left(self._order, (-old["balance"], user_id))]
+        self.accounts[user_id] = account
+        bisect.insort(self._order, (-account["balance"], user_id))
+
+    def position(self, user_id: int) -> Optional[int]:
+        account = self.accounts.get(user_id)
+        if account is None:
+            return None
+        return bisect.bisect_left(self._order, (-account["balance"], user_id)) + 1
+
+    def __iter__(self) -> Iterator[Tuple[int, dict]]:
+        for _, user_id in self._order:
+            yield user_id, self.accounts[user_id]
+
+
+async def _get_leaderboard(guild: Optional[discord.Guild]) -> _Leaderboard:
+    """Get the sorted accounts of the global bank, or of a guild's bank."""
+    await _ledger.recover()
+    if _ledger.write_through:
+        # Other processes' changes wouldn't be seen, so nothing is kept
+        leaderboard = _Leaderboard()
+        if guild is None:
+            leaderboard.load(await _conf.all_users())
+        else:
+            leaderboard.load(await _conf.all_members(guild))
+        return leaderboard
+    key = None if guild is None else guild.id
+    leaderboard = _leaderboards.get(key)
+    if leaderboard is None:
+        leaderboard = _leaderboards[key] = _Leaderboard()
+    if not leaderboard.loaded:
+        async with leaderboard.lock:
+            if not leaderboard.loaded:
+                if guild is None:
+                    leaderboard.load(await _conf.all_users())
+                else:
+                    leaderboard.load(await _conf.all_members(guild))
+    return leaderboard
+
+
+class _Ledger:
+    """Holds the bank's accounts in memory, and saves them in the background.
+
+    Every change to one or more accounts is first appended to a journal
+    file, as a single record holding the new state of each account it
+    changed, and only then applied in memory. Changed accounts are saved to
+    Config together at most ``FLUSH_INTERVAL`` seconds later, along with the
+    sequence number of the last record which has been saved. If Red stops
+    before then, the records after that number are applied to Config the
+    next time the ledger is used.
+
+    Each account has a lock which is held while it is read and changed, so
+    concurrent changes to an account can't overwrite each other, and a
+    transfer changes both of its accounts in one record. Wiping accounts
+    waits for every account's lock to be released, and holds back new
+    changes until it is done, so changes to accounts read before a wipe
+    can't be made after it.
+
+    The journal doubles as an audit log of every change made to the bank.
+    Once it grows past ``MAX_JOURNAL_SIZE`` bytes and all of its records
+    have been saved, it is moved to ``bank_ledger.jsonl.<seq>.old``, where
+    ``<seq>`` is the sequence number of its last record.
+
+    When the bank's data is shared with other processes, such as with the
+    JSON driver's ``multiprocess`` option, accounts held in memory would
+    go stale and overwrite the other processes' changes when saved. The
+    ledger then writes through to Config instead: accounts are read from
+    Config every time, and each change is saved straight away without
+    being journaled.
+    """
+
+    FLUSH_INTERVAL = 5.0
+    MAX_JOURNAL_SIZE = 4 * 1024 * 1024
+
+    def __init__(self):
+        # Maps each account's key to its data, or to None if it doesn't exist
+        self.accounts: Dict[_AccountKey, Optional[dict]] = {}
+        self.dirty: Set[_AccountKey] = set()
+        self.seq = 0
+        self.path: Optional[Path] = None
+        self.write_through = False
+        self._in_flight: Set[int] = set()
+        self._locks = weakref.WeakValueDictionary()
+        # Incremented by every wipe, so accounts read before it aren't kept
+        self.generation = 0
+        # The number of tasks holding, or waiting for, account locks
+        self._active = 0
+        self._wiping = False
+        self._wipe_condition = None
+        self._recover_lock = None
+        self._timer = None
+        self._flush_task = None
+
+    @staticmethod
+    def _group(key: _AccountKey):
+        guild_id, user_id = key
+        if guild_id is None:
+            return _conf.user_from_id(user_id)
+        return _conf.member_from_ids(guild_id, user_id)
+
+    @staticmethod
+    def _scope_group(guild_id: Optional[int]):
+        if guild_id is None:
+            return _conf._get_base_group(Config.USER)
+        return _conf._get_base_group(Config.MEMBER, str(guild_id))
+
+    @staticmethod
+    def _read_journal(path: Path) -> List[dict]:
+        records = []
+        try:
+            f = path.open(encoding="utf-8", mode="r")
+        except FileNotFoundError:
+            return records
+        with f:
+            for line in f:
+                try:
+                    records.append(loads(line))
+                except ValueError:
+                    # Red stopped part way through appending this record
+                    break
+        return records
+
+    def _append(self, line: str):
+        with self.path.open(encoding="utf-8", mode="a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def recover(self):
+        """Save the changes which were journaled but not saved before Red last stopped."""
+        if self.path is not None:
+            return
+        if self._recover_lock is None:
+            self._recover_lock = asyncio.Lock()
+        async with self._recover_lock:
+            if self.path is not None:
+                return
+            self.write_through = getattr(_conf.driver, "multiprocess", False)
+            path = core_data_path() / "bank_ledger.jsonl"
+            loop = asyncio.get_event_loop()
+            records = await loop.run_in_executor(None, self._read_journal, path)
+            checkpoint = await _conf.ledger_checkpoint()
+            pending = sorted((r for r in records if r["seq"] > checkpoint), key=lambda r: r["seq"])
+            self.seq = max([checkpoint, *(r["seq"] for r in records)])
+            if pending:
+                async with _conf.transaction():
+                    for record in pending:
+                        for guild_id, user_id, account in record["accounts"]:
+                            await self._group((guild_id, user_id)).set(account)
+                    await _conf.ledger_checkpoint.set(self.seq)
+                log.info("Recovered %s unsaved bank transactions", len(pending))
+            self.path = path
+
+    def _condition(self) -> asyncio.Condition:
+        if self._wipe_condition is None:
+            self._wipe_condition = asyncio.Condition()
+        return self._wipe_condition
+
+    @contextlib.asynccontextmanager
+    async def locked(self, *members: Union[discord.Member, discord.User]):
+        """Hold the locks for the given members' accounts, and get their keys.
+
+        The locks are always taken in the same order, so holding several
+        at once can't deadlock. They can't be taken while accounts are
+        being wiped, and the keys are only worked out once no wipe can
+        happen, since `set_global` changes which accounts members have.
+        """
+        condition = self._condition()
+        async with condition:
+            await condition.wait_for(lambda: not self._wiping)
+            self._active += 1
+        try:
+            keys = await _account_keys(members)
+            async with self._account_locks(keys):
+                yield keys
+        finally:
+            async with condition:
+                self._active -= 1
+                condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def _account_locks(self, keys: Iterable[_AccountKey]):
+        locks = []
+        for key in sorted(set(keys), key=lambda k: (k[0] or 0, k[1])):
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = asyncio.Lock()
+            locks.append(lock)
+        acquired = []
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    async def get(self, key: _AccountKey) -> Optional[dict]:
+        """Get an account's data, or :code:`None` if it doesn't exist."""
+        return (await self.get_many((key,)))[key]
+
+    async def get_many(self, keys: Iterable[_AccountKey]) -> Dict[_AccountKey, Optional[dict]]:
+        """Get the data of several accounts, reading the ones not in memory all at once."""
+        await self.recover()
+        keys = list(keys)
+        generation = self.generation
+        ret = {}
+        missing: Dict[Optional[int], List[int]] = {}
+        for key in keys:
+            if key in self.accounts:
+                ret[key] = self.accounts[key]
+            else:
+                missing.setdefault(key[0], []).append(key[1])
+        for guild_id, user_ids in missing.items():
+            group = self._scope_group(guild_id)
+            raws = await group.get_many_raw(*((user_id,) for user_id in user_ids), default=None)
+            for user_id, raw in zip(user_ids, raws):
+                key = (guild_id, user_id)
+                account = None if raw is None else {**_DEFAULT_MEMBER, **raw}
+                if self.write_through:
+                    ret[key] = account
+                    continue
+                if generation != self.generation:
+                    # The account may have been wiped while it was being read
+                    self.accounts.pop(key, None)
+                # The account may have been changed while it was being read
+                ret[key] = self.accounts.setdefault(key, account)
+        return {key: ret[key] for key in keys}
+
+    async def commit(self, operation: str, changes: Dict[_AccountKey, dict]):
+        """Journal and apply new data for some accounts.
+
+        The locks for the accounts must be held.
+        """
+        if self.write_through:
+            async with _conf.transaction():
+                for key, account in changes.items():
+                    await self._group(key).set(account)
+            return
+        self.seq += 1
+        seq = self.seq
+        record = {
+            "seq": seq,
+            "time": _encoded_current_time(),
+            "op": operation,
+            "accounts": [[guild_id, user_id, acc] for (guild_id, user_id), acc in changes.items()],
+        }
+        line = dumps(record, MINIFIED) + "\n"
+        loop = asyncio.get_event_loop()
+        self._in_flight.add(seq)
+        try:
+            await loop.run_in_executor(None, self._append, line)
+        finally:
+            self._in_flight.discard(seq)
+        for key, account in changes.items():
+            self.accounts[key] = account
+            self.dirty.add(key)
+            guild_id, user_id = key
+            leaderboard = _leaderboards.get(guild_id)
+            if leaderboard is None:
+                leaderboard = _leaderboards[guild_id] = _Leaderboard()
+            leaderboard.update(user_id, account)
+        if self._timer is None:
+            self._timer = loop.call_later(self.FLUSH_INTERVAL, self._schedule_flush)
+
+    def _schedule_flush(self):
+        self._timer = None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        try:
+            await self.flush()
+        except Exception:
+            log.exception("Error saving bank accounts")
+            if self._timer is None:
+                loop = asyncio.get_event_loop()
+                self._timer = loop.call_later(self.FLUSH_INTERVAL, self._schedule_flush)
+
+    async def flush(self):
+        """Save the changed accounts to Config."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, set()
+        # Records still being appended haven't been applied, so they must
+        # be replayed if Red stops.
+        checkpoint = min(self._in_flight) - 1 if self._in_flight else self.seq
+        try:
+            async with _conf.transaction():
+                for key in dirty:
+                    account = self.accounts.get(key)
+                    if account is not None:
+                        await self._group(key).set(dict(account))
+                await _conf.ledger_checkpoint.set(checkpoint)
+        except BaseException:
+            self.dirty |= dirty
+            raise
+        if checkpoint == self.seq and not self.dirty and not self._in_flight:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size > self.MAX_JOURNAL_SIZE:
+                # Each archive is named after its last record, so older
+                # archives are kept
+                archive = "{}.{}.old".format(self.path.name, self.seq)
+                self.path.replace(self.path.with_name(archive))
+
+    async def wipe(
+        self,
+        clear: Callable[[], Awaitable[None]],
+        guild_id: Optional[int] = None,
+        *,
+        all_guilds: bool = False,
+    ):
+        """Wipe the accounts of the global bank, of a guild's bank or of every guild's bank.
+
+        ``clear`` is called to clear the accounts from Config, within the
+        same transaction which saves the ledger's checkpoint, so journaled
+        changes made before the wipe are never replayed after it. Other
+        accounts' changes are saved first.
+        """
+        await self.recover()
+        condition = self._condition()
+        async with condition:
+            await condition.wait_for(lambda: not self._wiping)
+            self._wiping = True
+            try:
+                await condition.wait_for(lambda: not self._active)
+                await self.flush()
+                async with _conf.transaction():
+                    await clear()
+                    await _conf.ledger_checkpoint.set(self.seq)
+                self.generation += 1
+                for key in list(self.accounts):
+                    if key[0] == guild_id or (all_guilds and key[0] is not None):
+                        del self.accounts[key]
+                        self.dirty.discard(key)
+                if all_guilds:
+                    _leaderboards.clear()
+                else:
+                    _leaderboards.pop(guild_id, None)
+            finally:
+                self._wiping = False
+                condition.notify_all()
+
+
+async def _flush():
+    """Save the bank's changed accounts straight away."""
+    if _ledger is not None:
+        await _ledger.flush()
+
+
+async def _account_key(member: Union[discord.Member, discord.User]) -> _AccountKey:
+    if await is_global():
+        return None, member.id
+    return member.guild.id, member.id
+
+
+async def _account_keys(
+    members: Iterable[Union[discord.Member, discord.User]]
+) -> List[_AccountKey]:
+    if await is_global():
+        return [(None, member.id) for member in members]
+    return [(member.guild.id, member.id) for member in members]
+
+
+def _updated_account(member: discord.Member, account: Optional[dict], balance: int) -> dict:
+    """Get a copy of an account with a new balance, filling in a new account's details."""
+    ret = {**(account or _DEFAULT_MEMBER), "balance": balance}
+    if ret["created_at"] == 0:
+        ret["created_at"] = _encoded_current_time()
+    if ret["name"] == "":
+        ret["name"] = member.display_name
+    return ret
+
+
+async def _check_max_balance(member: discord.Member, amount: int):
+    if amount > MAX_BALANCE:
+        currency = (
+            await get_currency_name()
+            if await is_global()
+            else await get_currency_name(member.guild)
+        )
+        raise errors.BalanceTooHigh(
+            user=member.display_name, max_balance=MAX_BALANCE, currency_name=currency
+        )
+
+
+async def _current_balance(member: discord.Member, account: Optional[dict]) -> int:
+    if account is not None:
+        return account["balance"]
+    try:
+        return await get_default_balance(member.guild)
+    except AttributeError:
+        return await get_default_balance()
+
+
 def _encoded_current_time() -> int:
     """Get the current UTC time as a timestamp.
     
@@ -178,28 +695,10 @@ async def set_balance(member: discord.Member, amount: int) -> int:
     """
     if amount < 0:
         raise ValueError("Not allowed to have negative balance.")
-    if amount > MAX_BALANCE:
-        currency = (
-            await get_currency_name()
-            if await is_global()
-            else await get_currency_name(member.guild)
-        )
-        raise errors.BalanceTooHigh(
-            user=member.display_name, max_balance=MAX_BALANCE, currency_name=currency
-        )
-    if await is_global():
-        group = _conf.user(member)
-    else:
-        group = _conf.member(member)
-    await group.balance.set(amount)
-
-    if await group.created_at() == 0:
-        time = _encoded_current_time()
-        await group.created_at.set(time)
-
-    if await group.name() == "":
-        await group.name.set(member.display_name)
-
+    await _check_max_balance(member, amount)
+    async with _ledger.locked(member) as (key,):
+        account = await _ledger.get(key)
+        await _ledger.commit("set_balance", {key: _updated_account(member, account, amount)})
     return amount
 
 
@@ -236,11 +735,13 @@ async def withdraw_credits(member: discord.Member, amount: int) -> int:
     if _invalid_amount(amount):
         raise ValueError("Invalid withdrawal amount {} < 0".format(amount))
 
-    bal = await get_balance(member)
-    if amount > bal:
-        raise ValueError("Insufficient funds {} > {}".format(amount, bal))
-
-    return await set_balance(member, bal - amount)
+    async with _ledger.locked(member) as (key,):
+        account = await _ledger.get(key)
+        bal = await _current_balance(member, account)
+        if amount > bal:
+            raise ValueError("Insufficient funds {} > {}".format(amount, bal))
+        await _ledger.commit("withdraw", {key: _updated_account(member, account, bal - amount)})
+    return bal - amount
 
 
 async def deposit_credits(member: discord.Member, amount: int) -> int:
@@ -264,6 +765,8 @@ async def deposit_credits(member: discord.Member, amount: int) -> int:
         If the deposit amount is invalid.
     TypeError
         If the deposit amount is not an `int`.
+    BalanceTooHigh
+        If the new balance would be greater than ``bank.MAX_BALANCE``
 
     """
     if not isinstance(amount, int):
@@ -271,8 +774,12 @@ async def deposit_credits(member: discord.Member, amount: int) -> int:
     if _invalid_amount(amount):
         raise ValueError("Invalid deposit amount {} <= 0".format(amount))
 
-    bal = await get_balance(member)
-    return await set_balance(member, amount + bal)
+    async with _ledger.locked(member) as (key,):
+        account = await _ledger.get(key)
+        bal = await _current_balance(member, account) + amount
+        await _check_max_balance(member, bal)
+        await _ledger.commit("deposit", {key: _updated_account(member, account, bal)})
+    return bal
 
 
 async def transfer_credits(from_: discord.Member, to: discord.Member, amount: int):
@@ -287,6 +794,9 @@ async def transfer_credits(from_: discord.Member, to: discord.Member, amount: in
     amount : int
         The amount to transfer.
 
+    Both balances are changed together, so the credits can't be lost or
+    duplicated if Red stops part way through the transfer.
+
     Returns
     -------
     int
@@ -298,6 +808,9 @@ async def transfer_credits(from_: discord.Member, to: discord.Member, amount: in
         If the amount is invalid or if ``from_`` has insufficient funds.
     TypeError
         If the amount is not an `int`.
+    BalanceTooHigh
+        If the new balance of ``to`` would be greater than
+        ``bank.MAX_BALANCE``
 
     """
     if not isinstance(amount, int):
@@ -305,8 +818,121 @@ async def transfer_credits(from_: discord.Member, to: discord.Member, amount: in
     if _invalid_amount(amount):
         raise ValueError("Invalid transfer amount {} <= 0".format(amount))
 
-    await withdraw_credits(from_, amount)
-    return await deposit_credits(to, amount)
+    async with _ledger.locked(from_, to) as (from_key, to_key):
+        from_account = await _ledger.get(from_key)
+        from_bal = await _current_balance(from_, from_account)
+        if amount > from_bal:
+            raise ValueError("Insufficient funds {} > {}".format(amount, from_bal))
+        if from_key == to_key:
+            await _ledger.commit(
+                "transfer", {to_key: _updated_account(to, from_account, from_bal)}
+            )
+            return from_bal
+        to_account = await _ledger.get(to_key)
+        to_bal = await _current_balance(to, to_account) + amount
+        await _check_max_balance(to, to_bal)
+        await _ledger.commit(
+            "transfer",
+            {
+                from_key: _updated_account(from_, from_account, from_bal - amount),
+                to_key: _updated_account(to, to_account, to_bal),
+            },
+        )
+    return to_bal
+
+
+async def bulk_deposit(amounts: Mapping[discord.Member, int]) -> Dict[discord.Member, int]:
+    """Add credits to several accounts at once.
+
+    This is the same as calling `deposit_credits` for each member, except
+    the accounts are read and saved together, and either every deposit is
+    made or none of them are.
+
+    Parameters
+    ----------
+    amounts : Mapping[discord.Member, int]
+        The amount to deposit to each member.
+
+    Returns
+    -------
+    Dict[discord.Member, int]
+        The new balance of each member.
+
+    Raises
+    ------
+    ValueError
+        If any of the deposit amounts are invalid.
+    TypeError
+        If any of the deposit amounts are not an `int`.
+    BalanceTooHigh
+        If any of the new balances would be greater than
+        ``bank.MAX_BALANCE``
+
+    """
+    for amount in amounts.values():
+        if not isinstance(amount, int):
+            raise TypeError("Deposit amount must be of type int, not {}.".format(type(amount)))
+        if _invalid_amount(amount):
+            raise ValueError("Invalid deposit amount {} <= 0".format(amount))
+    if not amounts:
+        return {}
+
+    async with _ledger.locked(*amounts) as key_list:
+        keys = dict(zip(amounts, key_list))
+        accounts = await _ledger.get_many(keys.values())
+        changes = {}
+        for member, amount in amounts.items():
+            key = keys[member]
+            account = changes.get(key, accounts[key])
+            bal = await _current_balance(member, account) + amount
+            await _check_max_balance(member, bal)
+            changes[key] = _updated_account(member, account, bal)
+        await _ledger.commit("bulk_deposit", changes)
+    return {member: changes[key]["balance"] for member, key in keys.items()}
+
+
+async def bulk_set_balance(balances: Mapping[discord.Member, int]) -> Dict[discord.Member, int]:
+    """Set the balances of several accounts at once.
+
+    This is the same as calling `set_balance` for each member, except the
+    accounts are read and saved together, and either every balance is set
+    or none of them are.
+
+    Parameters
+    ----------
+    balances : Mapping[discord.Member, int]
+        The amount to set each member's balance to.
+
+    Returns
+    -------
+    Dict[discord.Member, int]
+        The new balance of each member.
+
+    Raises
+    ------
+    ValueError
+        If attempting to set any balance to a negative number.
+    BalanceTooHigh
+        If attempting to set any balance to a value greater than
+        ``bank.MAX_BALANCE``
+
+    """
+    for member, amount in balances.items():
+        if amount < 0:
+            raise ValueError("Not allowed to have negative balance.")
+        await _check_max_balance(member, amount)
+    if not balances:
+        return {}
+
+    async with _ledger.locked(*balances) as key_list:
+        keys = dict(zip(balances, key_list))
+        accounts = await _ledger.get_many(keys.values())
+        changes = {}
+        for member, amount in balances.items():
+            key = keys[member]
+            changes[key] = _updated_account(member, changes.get(key, accounts[key]), amount)
+        await _ledger.commit("bulk_set_balance", changes)
+    return {member: changes[key]["balance"] for member, key in keys.items()}
 
 
 async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
@@ -320,9 +946,11 @@ async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
 
     """
     if await is_global():
-        await _conf.clear_all_users()
+        await _ledger.wipe(_conf.clear_all_users)
+    elif guild is None:
+        await _ledger.wipe(_conf.clear_all_members, all_guilds=True)
     else:
-        await _conf.clear_all_members(guild)
+        await _ledger.wipe(functools.partial(_conf.clear_all_members, guild), guild.id)
 
 
 async def get_leaderboard(positions: int = None, guild: discord.Guild = None) -> List[tuple]:
@@ -340,7 +968,8 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
     Returns
     -------
     `list` of `tuple`
-        The sorted leaderboard in the form of :code:`(user_id, raw_account)`
+        The sorted leaderboard in the form of :code:`(user_id, raw_account)`.
+        Accounts with the same balance are sorted by ID.
 
     Raises
     ------
@@ -349,21 +978,16 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
 
     """
     if await is_global():
-        raw_accounts = await _conf.all_users()
+        accounts = iter(await _get_leaderboard(None))
         if guild is not None:
-            tmp = raw_accounts.copy()
-            for acc in tmp:
-                if not guild.get_member(acc):
-                    del raw_accounts[acc]
+            accounts = (acc for acc in accounts if guild.get_member(acc[0]))
     else:
         if guild is None:
             raise TypeError("Expected a guild, got NoneType object instead!")
-        raw_accounts = await _conf.all_members(guild)
-    sorted_acc = sorted(raw_accounts.items(), key=lambda x: x[1]["balance"], reverse=True)
-    if positions is None:
-        return sorted_acc
-    else:
-        return sorted_acc[:positions]
+        accounts = iter(await _get_leaderboard(guild))
+    if positions is not None:
+        accounts = itertools.islice(accounts, positions)
+    return [(user_id, account.copy()) for user_id, account in accounts]
 
 
 async def get_leaderboard_position(
@@ -392,16 +1016,10 @@ async def get_leaderboard_position(
         guild = None
     else:
         guild = member.guild if hasattr(member, "guild") else None
-    try:
-        leaderboard = await get_leaderboard(None, guild)
-    except TypeError:
-        raise
-    else:
-        pos = discord.utils.find(lambda x: x[1][0] == member.id, enumerate(leaderboard, 1))
-        if pos is None:
-            return None
-        else:
-            return pos[0]
+        if guild is None:
+            raise TypeError("Expected a guild, got NoneType object instead!")
+    leaderboard = await _get_leaderboard(guild)
+    return leaderboard.position(member.id)
 
 
 async def get_account(member: Union[discord.Member, discord.User]) -> Account:
@@ -420,19 +1038,18 @@ async def get_account(member: Union[discord.Member, discord.User]) -> Account:
         The user's account.
 
     """
-    if await is_global():
-        all_accounts = await _conf.all_users()
-    else:
-        all_accounts = await _conf.all_members(member.guild)
-
-    if member.id not in all_accounts:
-        acc_data = {"name": member.display_name, "created_at": _DEFAULT_MEMBER["created_at"]}
-        try:
-            acc_data["balance"] = await get_default_balance(member.guild)
-        except AttributeError:
-            acc_data["balance"] = await get_default_balance()
+    # Only this account's data is read, so the cost doesn't depend on the
+    # number of accounts in the bank.
+    account = await _ledger.get(await _account_key(member))
+
+    if account is None:
+        acc_data = {
+            "name": member.display_name,
+            "created_at": _DEFAULT_MEMBER["created_at"],
+            "balance": await _current_balance(member, None),
+        }
     else:
-        acc_data = all_accounts[member.id]
+        acc_data = account.copy()
 
     acc_data["created_at"] = _decode_time(acc_data["created_at"])
     return Account(**acc_data)
@@ -447,7 +1064,14 @@ async def is_global() -> bool:
         :code:`True` if the bank is global, otherwise :code:`False`.
 
     """
-    return await _conf.is_global()
+    global _is_global
+    if _is_global is not None:
+        return _is_global
+    version = _settings_version
+    ret = await _conf.is_global()
+    if version == _settings_version:
+        _is_global = ret
+    return ret
 
 
 async def set_global(global_: bool) -> bool:
@@ -477,11 +1101,15 @@ async def set_global(global_: bool) -> bool:
         return global_
 
     if await is_global():
-        await _conf.clear_all_users()
+        clear = _conf.clear_all_users
     else:
-        await _conf.clear_all_members()
+        clear = _conf.clear_all_members
 
-    await _conf.is_global.set(global_)
+    async def clear_and_switch():
+        await clear()
+        await _conf.is_global.set(global_)
+
+    await _ledger.wipe(clear_and_switch, all_guilds=True)
     return global_
 
 
@@ -505,12 +1133,10 @@ async def get_bank_name(guild: discord.Guild = None) -> str:
         If the bank is guild-specific and guild was not provided.
 
     """
-    if await is_global():
-        return await _conf.bank_name()
-    elif guild is not None:
-        return await _conf.guild(guild).bank_name()
-    else:
+    settings = await _get_settings(guild)
+    if settings is None:
         raise RuntimeError("Guild parameter is required and missing.")
+    return settings["bank_name"]
 
 
 async def set_bank_name(name: str, guild: discord.Guild = None) -> str:
@@ -564,12 +1190,10 @@ async def get_currency_name(guild: discord.Guild = None) -> str:
         If the bank is guild-specific and guild was not provided.
 
     """
-    if await is_global():
-        return await _conf.currency()
-    elif guild is not None:
-        return await _conf.guild(guild).currency()
-    else:
+    settings = await _get_settings(guild)
+    if settings is None:
         raise RuntimeError("Guild must be provided.")
+    return settings["currency"]
 
 
 async def set_currency_name(name: str, guild: discord.Guild = None) -> str:
@@ -625,12 +1249,10 @@ async def get_default_balance(guild: discord.Guild = None) -> int:
         If the bank is guild-specific and guild was not provided.
 
     """
-    if await is_global():
-        return await _conf.default_balance()
-    elif guild is not None:
-        return await _conf.guild(guild).default_balance()
-    else:
+    settings = await _get_settings(guild)
+    if settings is None:
         raise RuntimeError("Guild is missing and required!")
+    return settings["default_balance"]
 
 
 async def set_default_balance(amount: int, guild: discord.Guild = None) -> int:
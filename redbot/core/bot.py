@@ -2,22 +2,26 @@ import asyncio
 import inspect
 import os
 import logging
+import time
 from collections import Counter
 from enum import Enum
 from importlib.machinery import ModuleSpec
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Dict, Optional, Union, List, Set
 
 import discord
 import sys
 from discord.ext.commands import when_mentioned_or
 
-from . import Config, i18n, commands, errors
+from . import Config, bank, i18n, commands, errors
 from .cog_manager import CogManager
+from .drivers import flush_pending_writes
 from .help_formatter import Help, help as help_
 from .rpc import RPCMixin
 from .utils import common_filters
 
+log = logging.getLogger("red")
+
 
 def _is_submodule(parent, child):
     return parent == child or child.startswith(parent + ".")
@@ -105,6 +109,10 @@ class RedBase(commands.GroupMixin, commands.bot.BotBase, RPCMixin):
 
         self.counter = Counter()
         self.uptime = None
+        # The time each package's setup took when it was last loaded, in seconds
+        self.load_times: Dict[str, float] = {}
+        # Flushes of removed cogs' data, which must finish before cogs are loaded again
+        self._unload_flushes: Set[asyncio.Task] = set()
         self.checked_time_accuracy = None
         self.color = discord.Embed.Empty  # This is needed or color ends up 0x000000
 
@@ -214,15 +222,22 @@ class RedBase(commands.GroupMixin, commands.bot.BotBase, RPCMixin):
         if name in self.extensions:
             raise errors.PackageAlreadyLoaded(spec)
 
+        if self._unload_flushes:
+            # The cog may read its data back as soon as it's set up
+            await asyncio.wait(set(self._unload_flushes))
+
         lib = spec.loader.load_module()
         if not hasattr(lib, "setup"):
             del lib
             raise discord.ClientException(f"extension {name} does not have a setup function")
 
+        start = time.perf_counter()
         if asyncio.iscoroutinefunction(lib.setup):
             await lib.setup(self)
         else:
             lib.setup(self)
+        self.load_times[name] = elapsed = time.perf_counter() - start
+        log.debug("Loaded package %s in %.1f ms", name, elapsed * 1000)
 
         self.extensions[name] = lib
 
@@ -244,6 +259,17 @@ class RedBase(commands.GroupMixin, commands.bot.BotBase, RPCMixin):
         for meth in self.rpc_handlers.pop(cogname.upper(), ()):
             self.unregister_rpc_handler(meth)
 
+        task = self.loop.create_task(self._flush_cog_data(cogname))
+        self._unload_flushes.add(task)
+        task.add_done_callback(self._unload_flushes.discard)
+
+    @staticmethod
+    async def _flush_cog_data(cogname: str):
+        try:
+            await flush_pending_writes(cogname)
+        except Exception:
+            log.exception("Failed to save data for removed cog %s", cogname)
+
     def unload_extension(self, name):
         lib = self.extensions.get(name)
 
@@ -501,6 +527,8 @@ class Red(RedBase, discord.AutoShardedClient):
         """Logs out of Discord and closes all connections."""
 
         await super().logout()
+        await bank._flush()
+        await flush_pending_writes()
 
     async def shutdown(self, *, restart: bool = False):
         """Gracefully quit Red.
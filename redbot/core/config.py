@@ -1,12 +1,37 @@
+import asyncio
+import datetime
+import functools
+import heapq
+import inspect
+import json
 import logging
+import math
 import collections
+import time
+import weakref
+from contextvars import ContextVar
 from copy import deepcopy
-from typing import Any, Union, Tuple, Dict, Awaitable, AsyncContextManager, TypeVar, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Union,
+    Tuple,
+    Dict,
+    Awaitable,
+    AsyncContextManager,
+    AsyncIterator,
+    List,
+    Sequence,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
 import discord
 
 from .data_manager import cog_data_path, core_data_path
-from .drivers import get_driver
+from .drivers import get_driver, stats as storage_stats
+from .drivers.red_base import FrozenDict, bounded, freeze, thaw
 
 if TYPE_CHECKING:
     from .drivers.red_base import BaseDriver
@@ -15,6 +40,101 @@ log = logging.getLogger("red.config")
 
 _T = TypeVar("_T")
 
+# Maps each driver to the transaction which is buffering its changes in the
+# current context.
+_transactions: ContextVar[Dict["BaseDriver", "_Transaction"]] = ContextVar(
+    "red_config_transactions", default={}
+)
+
+_CLEARED = object()
+
+# The scope in which the times that values expire at are saved
+_EXPIRY_SCOPE = "__EXPIRY__"
+
+# Maps each cog's (name, unique identifier) pair to its expiring values
+_expiries: Dict[Tuple[str, str], "_Expiries"] = {}
+
+# Maps each cog's (name, unique identifier) pair to its change listeners,
+# as (path, callback) pairs.
+_change_listeners: Dict[Tuple[str, str], List[Tuple[Tuple[str, ...], Callable]]] = {}
+
+# Default values of these types can be handed out without being copied
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+_SHARED, _COPIED, _GROUP = range(3)
+
+# The defaults of scopes with none registered. This is shared, so that
+# their precompiled plan can be reused, and must never be modified.
+_NO_DEFAULTS: Dict[str, Any] = {}
+
+
+class _DefaultsPlan:
+    """A compiled form of a group's registered defaults.
+
+    Each default is sorted into one of three kinds when the defaults are
+    registered: immutable values which can be shared, mutable values which
+    have to be copied when handed out, and nested groups with their own
+    plan. Merging then only has to fill in the keys which the stored data
+    is missing, copying just the mutable defaults it adds.
+
+    The registered defaults are never modified through a plan.
+    """
+
+    __slots__ = ("defaults", "_steps", "_index")
+
+    def __init__(self, defaults: dict):
+        self.defaults = defaults
+        self._steps = []
+        for key, value in defaults.items():
+            if isinstance(value, dict):
+                self._steps.append((key, _GROUP, _DefaultsPlan(value)))
+            elif isinstance(value, _IMMUTABLE_TYPES):
+                self._steps.append((key, _SHARED, value))
+            else:
+                self._steps.append((key, _COPIED, value))
+        self._index = {key: (kind, value) for key, kind, value in self._steps}
+
+    @staticmethod
+    def copy_default(kind: int, value):
+        """Get a copy of a default (or a plan's defaults) which is safe to modify."""
+        if kind is _GROUP:
+            return value.build()
+        if kind is _COPIED:
+            return deepcopy(value)
+        return value
+
+    def build(self) -> dict:
+        """Get a new dict holding all of the defaults."""
+        return {key: self.copy_default(kind, value) for key, kind, value in self._steps}
+
+    def merge(self, data: dict, nested: bool = True) -> dict:
+        """Fill in the defaults which ``data`` is missing, in place.
+
+        When ``nested`` is :code:`False`, nested groups which are present
+        in ``data`` are left as they are.
+        """
+        for key, kind, value in self._steps:
+            if key not in data:
+                data[key] = self.copy_default(kind, value)
+            elif nested and kind is _GROUP and isinstance(data[key], dict):
+                value.merge(data[key])
+        return data
+
+    def lookup(self, path) -> Tuple[int, Any]:
+        """Get the kind of default and the default (or plan) at ``path``.
+
+        Raises
+        ------
+        KeyError
+            If there is no default registered at ``path``.
+
+        """
+        kind, value = _GROUP, self
+        for key in path:
+            if kind is not _GROUP:
+                raise KeyError(key)
+            kind, value = value._index[key]
+        return kind, value
+
 
 class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):
     """Context manager implementation of config values.
@@ -25,7 +145,8 @@ class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):
     The context manager can only be used to get and set a mutable data type,
     i.e. `dict`s or `list`s. This is because this class's ``raw_value``
     attribute must contain a reference to the object being modified within the
-    context manager.
+    context manager. Values read in frozen mode are thawed into a mutable
+    copy on entry.
     """
 
     def __init__(self, value_obj, coro):
@@ -39,6 +160,8 @@ class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):
 
     async def __aenter__(self):
         self.raw_value = await self
+        if isinstance(self.raw_value, (FrozenDict, tuple)):
+            self.raw_value = thaw(self.raw_value)
         if not isinstance(self.raw_value, (list, dict)):
             raise TypeError(
                 "Type of retrieved value must be mutable (i.e. "
@@ -57,6 +180,506 @@ class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):
             await self.value_obj.set(self.raw_value)
 
 
+class _Transaction(AsyncContextManager["_Transaction"]):
+    """Buffers the changes made to a driver's data and commits them at once.
+
+    While the transaction is active, every set and clear made through
+    Config with this driver is held back, and reads within the same task
+    include the held back changes. On a clean exit, the changes are
+    committed with a single call to the driver's ``apply_changes``. If an
+    exception is raised, or the changes fail to be committed, they are
+    discarded and the callbacks given to `on_abort` are called.
+
+    Changes are kept as a set of non-overlapping paths, so a change to a
+    value below a path which has already been changed is folded into that
+    path's new value. Increments are kept separately, as the amounts to
+    add, and are made with the driver's ``inc`` once the other changes
+    have been committed, so increments made by other tasks in the meantime
+    aren't lost.
+    """
+
+    def __init__(self, driver: "BaseDriver"):
+        self.driver = driver
+        self._changes: Dict[Tuple[str, ...], Any] = {}
+        # Maps each incremented path to its increments, as (amount,
+        # default, minimum, maximum) tuples
+        self._incs: Dict[Tuple[str, ...], List[Tuple[Any, Any, Any, Any]]] = {}
+        self._aborts: List[Callable[[], None]] = []
+        self._token = None
+
+    async def __aenter__(self):
+        transactions = _transactions.get()
+        if self.driver in transactions:
+            # Nested transactions are merged into the outermost one
+            return transactions[self.driver]
+        self._token = _transactions.set({**transactions, self.driver: self})
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._token is None:
+            return
+        _transactions.reset(self._token)
+        self._token = None
+        changes, self._changes = self._changes, {}
+        incs, self._incs = self._incs, {}
+        aborts, self._aborts = self._aborts, []
+        if exc_type is not None:
+            self._abort(aborts)
+            return
+        sets = {path: value for path, value in changes.items() if value is not _CLEARED}
+        clears = [path for path, value in changes.items() if value is _CLEARED]
+        if sets or clears:
+            try:
+                await self.driver.apply_changes(sets, clears)
+            except Exception:
+                self._abort(aborts)
+                raise
+        for path, path_incs in incs.items():
+            for amount, default, minimum, maximum in path_incs:
+                await self.driver.inc(
+                    *path, amount=amount, default=default, minimum=minimum, maximum=maximum
+                )
+        if changes or incs:
+            await _fire_change_listeners(self.driver, [*changes, *incs])
+
+    def on_abort(self, callback: Callable[[], None]):
+        """Call ``callback`` if this transaction's changes are discarded.
+
+        This is for undoing in-memory state which was changed along with
+        the buffered changes. Callbacks are called in reverse order.
+        """
+        self._aborts.append(callback)
+
+    @staticmethod
+    def _abort(aborts: List[Callable[[], None]]):
+        for callback in reversed(aborts):
+            try:
+                callback()
+            except Exception:
+                log.exception("Error undoing a discarded Config transaction")
+
+    def _record(self, path: Tuple[str, ...], value):
+        # A new value replaces any increments to it
+        for incremented in list(self._incs):
+            if _overlaps(incremented, path):
+                del self._incs[incremented]
+        for changed in list(self._changes):
+            if changed[: len(path)] == path:
+                del self._changes[changed]
+        for i in range(len(path)):
+            ancestor = path[:i]
+            if ancestor in self._changes:
+                current = self._changes[ancestor]
+                if current is _CLEARED:
+                    if value is _CLEARED:
+                        return
+                    current = {}
+                self._changes[ancestor] = _change_path(current, path[i:], value)
+                return
+        self._changes[path] = value
+
+    async def get(self, *identifiers: str):
+        n = len(identifiers)
+        incs = [path for path in self._incs if path[:n] == identifiers]
+        try:
+            value = await self._get(*identifiers)
+        except KeyError:
+            if not incs:
+                raise
+            value = _CLEARED
+        for path in incs:
+            current = _CLEARED if value is _CLEARED else _find_path(value, path[n:])
+            for amount, default, minimum, maximum in self._incs[path]:
+                if current is _CLEARED:
+                    current = default
+                current = bounded(current + amount, minimum, maximum)
+            value = _change_path({} if value is _CLEARED else value, path[n:], current)
+        return value
+
+    async def _get(self, *identifiers: str):
+        for i in range(len(identifiers) + 1):
+            ancestor = identifiers[:i]
+            if ancestor in self._changes:
+                value = self._changes[ancestor]
+                for key in identifiers[i:]:
+                    if not isinstance(value, dict):
+                        raise KeyError(identifiers)
+                    value = value[key]
+                if value is _CLEARED:
+                    raise KeyError(identifiers)
+                return deepcopy(value)
+
+        n = len(identifiers)
+        below = [path for path in self._changes if path[:n] == identifiers]
+        if not below:
+            return await self.driver.get(*identifiers)
+        try:
+            value = await self.driver.get(*identifiers)
+        except KeyError:
+            value = _CLEARED
+        for path in below:
+            change = self._changes[path]
+            if change is not _CLEARED:
+                change = deepcopy(change)
+            elif value is _CLEARED:
+                continue
+            if value is _CLEARED:
+                value = {}
+            value = _change_path(value, path[n:], change)
+        if value is _CLEARED:
+            raise KeyError(identifiers)
+        return value
+
+    def _is_changed(self, identifiers: Tuple[str, ...]) -> bool:
+        return any(_overlaps(path, identifiers) for path in (*self._changes, *self._incs))
+
+    async def get_frozen(self, *identifiers: str):
+        if self._is_changed(identifiers):
+            return freeze(await self.get(*identifiers))
+        return await self.driver.get_frozen(*identifiers)
+
+    async def get_many(self, paths, frozen: bool = False):
+        ret = {}
+        unchanged = []
+        for identifiers in paths:
+            if not self._is_changed(identifiers):
+                unchanged.append(identifiers)
+                continue
+            try:
+                value = await self.get(*identifiers)
+            except KeyError:
+                continue
+            ret[identifiers] = freeze(value) if frozen else value
+        if unchanged:
+            ret.update(await self.driver.get_many(unchanged, frozen=frozen))
+        return ret
+
+    async def iter_children(self, *identifiers: str, frozen: bool = False):
+        if not self._is_changed(identifiers):
+            async for item in self.driver.iter_children(*identifiers, frozen=frozen):
+                yield item
+            return
+        try:
+            data = await self.get(*identifiers)
+        except KeyError:
+            return
+        for key, value in data.items():
+            yield key, freeze(value) if frozen else value
+
+    async def set(self, *identifiers: str, value=None):
+        self._record(identifiers, deepcopy(value))
+
+    async def clear(self, *identifiers: str):
+        self._record(identifiers, _CLEARED)
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
+        try:
+            value = await self.get(*identifiers)
+        except KeyError:
+            value = default
+        incs = self._incs.setdefault(identifiers, [])
+        if incs and minimum is maximum is None and incs[-1][2] is incs[-1][3] is None:
+            incs[-1] = (incs[-1][0] + amount, default, None, None)
+        else:
+            incs.append((amount, default, minimum, maximum))
+        # Other tasks' increments may be made before this one is committed,
+        # so this is only the value as far as this transaction knows
+        return bounded(value + amount, minimum, maximum)
+
+
+def _overlaps(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+    """Whether one path is equal to or below the other."""
+    n = min(len(a), len(b))
+    return a[:n] == b[:n]
+
+
+def _find_path(data, path: Tuple[str, ...]):
+    """Get the value at ``path`` in ``data``, or ``_CLEARED`` if there is none."""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return _CLEARED
+        data = data[key]
+    return data
+
+
+def _change_path(data, path: Tuple[str, ...], value):
+    """Set or clear (if ``value`` is ``_CLEARED``) the value at ``path`` in ``data``.
+
+    ``data`` is modified in place where possible, and the result is returned.
+    """
+    if not path:
+        return value
+    if not isinstance(data, dict):
+        if value is _CLEARED:
+            return data
+        data = {}
+    partial = data
+    for key in path[:-1]:
+        nested = partial.get(key)
+        if not isinstance(nested, dict):
+            if value is _CLEARED:
+                return data
+            nested = partial[key] = {}
+        partial = nested
+    if value is _CLEARED:
+        partial.pop(path[-1], None)
+    else:
+        partial[path[-1]] = value
+    return data
+
+
+def _driver_for(driver: "BaseDriver"):
+    """Get the transaction buffering ``driver``'s changes, or the driver itself."""
+    return _transactions.get().get(driver, driver)
+
+
+def _listener_key(driver: "BaseDriver") -> Tuple[str, str]:
+    return driver.cog_name, driver.unique_cog_identifier
+
+
+async def _fire_change_listeners(driver: "BaseDriver", paths: Iterable[Tuple[str, ...]]):
+    """Call the listeners for every changed path which overlaps their own path."""
+    listeners = _change_listeners.get(_listener_key(driver))
+    if not listeners:
+        return
+    for identifiers in paths:
+        for path, callback in list(listeners):
+            n = min(len(path), len(identifiers))
+            if path[:n] != identifiers[:n]:
+                continue
+            try:
+                ret = callback(identifiers)
+                if inspect.isawaitable(ret):
+                    await ret
+            except Exception:
+                log.exception("Error in Config change listener %r", callback)
+
+
+async def _notify_change(driver: "BaseDriver", identifiers: Tuple[str, ...]):
+    """Tell the listeners that the data at ``identifiers`` has changed.
+
+    Within a transaction, the listeners are told once it has been committed.
+    """
+    if _listener_key(driver) not in _change_listeners or driver in _transactions.get():
+        return
+    await _fire_change_listeners(driver, (identifiers,))
+
+
+class _Expiries:
+    """Tracks when the expiring values in one cog's data are due to expire.
+
+    The time at which each value expires is saved with the rest of the
+    cog's data, in the ``__EXPIRY__`` scope, and loaded the first time the
+    cog's data is accessed. The scope is carried over on purpose by backups
+    and by conversions between storage backends, so values keep expiring
+    after their data has been moved. Expired values are cleared before data is next
+    read, or by a timer set for the next value to expire, whichever comes
+    first.
+    """
+
+    def __init__(self):
+        self.due: Dict[Tuple[str, ...], float] = {}
+        self.loaded = False
+        # Counts the expiring values below each path
+        self._below = collections.Counter()
+        self._heap: List[Tuple[float, Tuple[str, ...]]] = []
+        # The driver which the timer clears expired values with
+        self._driver = None
+        self._timer = None
+        self._timer_due = math.inf
+
+    @staticmethod
+    def record_path(identifiers: Tuple[str, ...]) -> Tuple[str, ...]:
+        return (_EXPIRY_SCOPE, identifiers[0], json.dumps(identifiers[1:]))
+
+    @property
+    def next_due(self) -> float:
+        heap = self._heap
+        # Values which were changed or cleared since being pushed are skipped
+        while heap and self.due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else math.inf
+
+    async def load(self, driver: "BaseDriver"):
+        try:
+            records = await driver.get(_EXPIRY_SCOPE)
+        except KeyError:
+            records = {}
+        if not self.loaded:
+            self.loaded = True
+            for scope, entries in records.items():
+                for key, expires_at in entries.items():
+                    self._add((scope, *json.loads(key)), expires_at)
+            self._schedule(driver)
+
+    def _add(self, identifiers: Tuple[str, ...], expires_at: float):
+        if identifiers not in self.due:
+            for i in range(len(identifiers)):
+                self._below[identifiers[:i]] += 1
+        self.due[identifiers] = expires_at
+        heapq.heappush(self._heap, (expires_at, identifiers))
+
+    def _remove(self, identifiers: Tuple[str, ...]):
+        del self.due[identifiers]
+        for i in range(len(identifiers)):
+            prefix = identifiers[:i]
+            self._below[prefix] -= 1
+            if not self._below[prefix]:
+                del self._below[prefix]
+
+    def overlapping(self, identifiers: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+        """Get the expiring values at or below ``identifiers``."""
+        ret = [identifiers] if identifiers in self.due else []
+        if identifiers in self._below:
+            n = len(identifiers)
+            ret.extend(p for p in self.due if len(p) > n and p[:n] == identifiers)
+        return ret
+
+    async def update(self, driver: "BaseDriver", identifiers: Tuple[str, ...], expire_after):
+        """Change when the value at ``identifiers`` expires, after it was set or cleared.
+
+        Values below ``identifiers`` no longer expire, and neither does the
+        value itself when ``expire_after`` is :code:`None`. This should be
+        called within the same transaction as the change to the value.
+        """
+        target = _driver_for(driver)
+        removed = self.overlapping(identifiers)
+        previous = [(path, self.due[path]) for path in removed]
+        for path in removed:
+            self._remove(path)
+        if expire_after is not None:
+            if isinstance(expire_after, datetime.timedelta):
+                expire_after = expire_after.total_seconds()
+            expires_at = time.time() + expire_after
+            self._add(identifiers, expires_at)
+        if isinstance(target, _Transaction):
+            # If the change is discarded, the values must keep expiring
+            # as they did before, and not expire as though it were made.
+            target.on_abort(
+                functools.partial(
+                    self._undo, driver, identifiers, expire_after is not None, previous
+                )
+            )
+        if expire_after is not None:
+            await target.set(*self.record_path(identifiers), value=expires_at)
+            self._schedule(driver)
+        if not identifiers:
+            # Clearing all of the cog's data also clears the records
+            return
+        if len(identifiers) == 1 and removed and expire_after is None:
+            await target.clear(_EXPIRY_SCOPE, identifiers[0])
+            return
+        for path in removed:
+            if path != identifiers or expire_after is None:
+                await target.clear(*self.record_path(path))
+
+    def _undo(
+        self,
+        driver: "BaseDriver",
+        identifiers: Tuple[str, ...],
+        added: bool,
+        previous: List[Tuple[Tuple[str, ...], float]],
+    ):
+        if added and identifiers in self.due:
+            self._remove(identifiers)
+        for path, expires_at in previous:
+            self._add(path, expires_at)
+        self._schedule(driver)
+
+    async def sweep(self, driver: "BaseDriver"):
+        """Clear the values which have expired."""
+        now = time.time()
+        expired = []
+        while self.next_due <= now:
+            expires_at, identifiers = heapq.heappop(self._heap)
+            self._remove(identifiers)
+            expired.append((identifiers, expires_at))
+        if not expired:
+            return
+        paths = {identifiers for identifiers, _ in expired}
+        # The driver needs the cleared paths not to overlap
+        clears = [p for p in paths if not any(p[:i] in paths for i in range(1, len(p)))]
+        clears.extend(self.record_path(p) for p in paths)
+        try:
+            await driver.apply_changes({}, clears)
+        except Exception:
+            for identifiers, expires_at in expired:
+                self._add(identifiers, expires_at)
+            raise
+        await _fire_change_listeners(driver, paths)
+
+    def _schedule(self, driver: "BaseDriver"):
+        self._driver = weakref.ref(driver)
+        due = self.next_due
+        if due >= self._timer_due:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = asyncio.get_event_loop()
+        self._timer = loop.call_later(max(due - time.time(), 0), self._on_timer)
+        self._timer_due = due
+
+    def _on_timer(self):
+        self._timer = None
+        self._timer_due = math.inf
+        asyncio.ensure_future(self._sweep_later())
+
+    async def _sweep_later(self):
+        driver = self._driver and self._driver()
+        if driver is None:
+            return
+        try:
+            await self.sweep(driver)
+        except Exception:
+            log.exception("Error clearing expired values for cog %s", driver.cog_name)
+        self._schedule(driver)
+
+
+async def _load_expiries(driver: "BaseDriver") -> _Expiries:
+    """Get the expiring values in ``driver``'s data, clearing those which have expired."""
+    key = _listener_key(driver)
+    expiries = _expiries.get(key)
+    if expiries is None:
+        expiries = _expiries[key] = _Expiries()
+    if not expiries.loaded:
+        await expiries.load(driver)
+    if expiries.next_due <= time.time():
+        await expiries.sweep(driver)
+    return expiries
+
+
+async def _set_or_clear(driver: "BaseDriver", identifiers: Tuple[str, ...], value):
+    if value is _CLEARED:
+        await _driver_for(driver).clear(*identifiers)
+    else:
+        await _driver_for(driver).set(*identifiers, value=value)
+
+
+async def _change(driver: "BaseDriver", identifiers: Tuple[str, ...], value, expire_after=None):
+    """Set the value at ``identifiers``, or clear it if ``value`` is ``_CLEARED``.
+
+    This also updates when the value and the values below it expire.
+    """
+    expiries = await _load_expiries(driver)
+    if expire_after is None and not expiries.overlapping(identifiers):
+        await _set_or_clear(driver, identifiers, value)
+        return
+    async with _Transaction(driver):
+        await _set_or_clear(driver, identifiers, value)
+        await expiries.update(driver, identifiers, expire_after)
+
+
+async def _inc(driver: "BaseDriver", identifiers: Tuple[str, ...], expire_after=None, **kwargs):
+    """Add to the number at ``identifiers``, and update when it expires like `_change`."""
+    expiries = await _load_expiries(driver)
+    if expire_after is None and not expiries.overlapping(identifiers):
+        return await _driver_for(driver).inc(*identifiers, **kwargs)
+    async with _Transaction(driver):
+        ret = await _driver_for(driver).inc(*identifiers, **kwargs)
+        await expiries.update(driver, identifiers, expire_after)
+    return ret
+
+
 class Value:
     """A singular "value" of data.
 
@@ -69,21 +692,45 @@ class Value:
         The default value for the data element that `identifiers` points at.
     driver : `redbot.core.drivers.red_base.BaseDriver`
         A reference to `Config.driver`.
+    frozen_reads : `bool`
+        Same as `Config.frozen_reads`.
 
     """
 
-    def __init__(self, identifiers: Tuple[str], default_value, driver):
+    __slots__ = ("identifiers", "default", "driver", "frozen_reads", "__weakref__")
+
+    def __init__(self, identifiers: Tuple[str], default_value, driver, frozen_reads: bool = False):
         self.identifiers = identifiers
         self.default = default_value
         self.driver = driver
+        self.frozen_reads = frozen_reads
 
     async def _get(self, default=...):
         try:
-            ret = await self.driver.get(*self.identifiers)
+            with storage_stats.timed(self.driver.cog_name, self.identifiers, "get"):
+                await _load_expiries(self.driver)
+                if self.frozen_reads:
+                    ret = await _driver_for(self.driver).get_frozen(*self.identifiers)
+                else:
+                    ret = await _driver_for(self.driver).get(*self.identifiers)
         except KeyError:
-            return default if default is not ... else self.default
+            if default is not ...:
+                return default
+            return self._default_value()
         return ret
 
+    def _default_value(self):
+        if self.frozen_reads:
+            return freeze(self.default)
+        # The registered default is shared, so it must not be handed out
+        # to be modified.
+        if isinstance(self.default, _IMMUTABLE_TYPES):
+            return self.default
+        return deepcopy(self.default)
+
+    def _with_defaults(self, raw):
+        return raw
+
     def __call__(self, default=...) -> _ValueCtxManager[Any]:
         """Get the literal value of this data element.
 
@@ -129,7 +776,7 @@ class Value:
         """
         return _ValueCtxManager(self, self._get(default))
 
-    async def set(self, value):
+    async def set(self, value, *, expire_after: Union[float, datetime.timedelta] = None):
         """Set the value of the data elements pointed to by `identifiers`.
 
         Example
@@ -142,21 +789,115 @@ class Value:
             # Sets guild specific value of "bar" to True
             await conf.guild(some_guild).bar.set(True)
 
+            # Resets the member's "cooldown" to its default in an hour
+            await conf.member(member).cooldown.set(True, expire_after=3600)
+
         Parameters
         ----------
         value
             The new literal value of this attribute.
+        expire_after : `float` or `datetime.timedelta`, optional
+            If given, the value is cleared (and so reset to its default)
+            after this many seconds. Expired values are cleared before the
+            cog's data is next read, or in the background, whichever comes
+            first. Without this, the value never expires, even if it was
+            previously set to. Values below this one stop expiring either
+            way.
 
         """
+        if isinstance(value, (FrozenDict, tuple)):
+            value = thaw(value)
         if isinstance(value, dict):
             value = _str_key_dict(value)
-        await self.driver.set(*self.identifiers, value=value)
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "set"):
+            await _change(self.driver, self.identifiers, value, expire_after)
+        await _notify_change(self.driver, self.identifiers)
 
     async def clear(self):
         """
         Clears the value from record for the data element pointed to by `identifiers`.
         """
-        await self.driver.clear(*self.identifiers)
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "clear"):
+            await _change(self.driver, self.identifiers, _CLEARED)
+        await _notify_change(self.driver, self.identifiers)
+
+    async def inc(
+        self, amount=1, *, maximum=None, expire_after: Union[float, datetime.timedelta] = None
+    ):
+        """Add to the number pointed to by `identifiers`.
+
+        Unlike getting the value and then setting it, this is a single
+        operation which can't lose changes made at the same time, and it
+        only takes one trip to storage. Within a transaction, the increment
+        is made when the transaction is committed, and the value returned
+        doesn't include increments made by other tasks in the meantime.
+
+        Example
+        -------
+        ::
+
+            ticket_number = await conf.guild(guild).next_ticket.inc()
+
+        Parameters
+        ----------
+        amount : int or float
+            The number to add.
+        maximum : int or float, optional
+            If given, the new value is lowered to this if it would be higher.
+        expire_after : `float` or `datetime.timedelta`, optional
+            Same as for `set`. Without this, the value stops expiring.
+
+        Returns
+        -------
+        int or float
+            The new value.
+
+        """
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "set"):
+            ret = await _inc(
+                self.driver,
+                self.identifiers,
+                expire_after,
+                amount=amount,
+                default=self.default,
+                maximum=maximum,
+            )
+        await _notify_change(self.driver, self.identifiers)
+        return ret
+
+    async def dec(
+        self, amount=1, *, minimum=None, expire_after: Union[float, datetime.timedelta] = None
+    ):
+        """Subtract from the number pointed to by `identifiers`.
+
+        This is the same as `inc`, but subtracts ``amount`` instead.
+
+        Parameters
+        ----------
+        amount : int or float
+            The number to subtract.
+        minimum : int or float, optional
+            If given, the new value is raised to this if it would be lower.
+        expire_after : `float` or `datetime.timedelta`, optional
+            Same as for `set`. Without this, the value stops expiring.
+
+        Returns
+        -------
+        int or float
+            The new value.
+
+        """
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "set"):
+            ret = await _inc(
+                self.driver,
+                self.identifiers,
+                expire_after,
+                amount=-amount,
+                default=self.default,
+                minimum=minimum,
+            )
+        await _notify_change(self.driver, self.identifiers)
+        return ret
 
 
 class Group(Value):
@@ -174,29 +915,67 @@ class Group(Value):
         Same as `Config.force_registration`.
     driver : `redbot.core.drivers.red_base.BaseDriver`
         A reference to `Config.driver`.
+    frozen_reads : `bool`
+        Same as `Config.frozen_reads`.
 
     """
 
+    __slots__ = ("_defaults", "_default_plan", "force_registration", "_children")
+
     def __init__(
-        self, identifiers: Tuple[str], defaults: dict, driver, force_registration: bool = False
+        self,
+        identifiers: Tuple[str],
+        defaults: dict,
+        driver,
+        force_registration: bool = False,
+        frozen_reads: bool = False,
+        default_plan: _DefaultsPlan = None,
     ):
+        # Registered children are created once and reused
+        self._children = {}
         self._defaults = defaults
+        self._default_plan = default_plan or _DefaultsPlan(defaults)
         self.force_registration = force_registration
         self.driver = driver
 
-        super().__init__(identifiers, {}, self.driver)
+        super().__init__(identifiers, {}, self.driver, frozen_reads)
 
     @property
     def defaults(self):
-        return deepcopy(self._defaults)
+        return self._default_plan.build()
 
     async def _get(self, default: Dict[str, Any] = ...) -> Dict[str, Any]:
-        default = default if default is not ... else self.defaults
-        raw = await super()._get(default)
-        if isinstance(raw, dict):
-            return self.nested_update(raw, default)
-        else:
+        if self.frozen_reads:
+            default = default if default is not ... else self._defaults
+            raw = await super()._get(default)
+            if isinstance(raw, FrozenDict):
+                return raw.with_defaults(default)
+            return freeze(raw)
+        if default is not ...:
+            raw = await super()._get(default)
+            if isinstance(raw, dict):
+                return self.nested_update(raw, default)
             return raw
+        try:
+            with storage_stats.timed(self.driver.cog_name, self.identifiers, "get"):
+                await _load_expiries(self.driver)
+                raw = await _driver_for(self.driver).get(*self.identifiers)
+        except KeyError:
+            return self._default_plan.build()
+        return self._with_defaults(raw)
+
+    def _default_value(self):
+        if self.frozen_reads:
+            return freeze(self._defaults)
+        return self._default_plan.build()
+
+    def _with_defaults(self, raw):
+        if isinstance(raw, FrozenDict):
+            return raw.with_defaults(self._defaults)
+        if isinstance(raw, dict):
+            # Drivers hand out copies, so the defaults can be merged in place
+            return self._default_plan.merge(raw)
+        return raw
 
     # noinspection PyTypeChecker
     def __getattr__(self, item: str) -> Union["Group", Value]:
@@ -223,24 +1002,41 @@ class Group(Value):
             is set to :code:`True`.
 
         """
+        try:
+            return self._children[item]
+        except KeyError:
+            pass
         is_group = self.is_group(item)
         is_value = not is_group and self.is_value(item)
         new_identifiers = self.identifiers + (item,)
         if is_group:
-            return Group(
+            _, plan = self._default_plan.lookup((item,))
+            child = self._children[item] = Group(
                 identifiers=new_identifiers,
                 defaults=self._defaults[item],
                 driver=self.driver,
                 force_registration=self.force_registration,
+                frozen_reads=self.frozen_reads,
+                default_plan=plan,
             )
+            return child
         elif is_value:
-            return Value(
-                identifiers=new_identifiers, default_value=self._defaults[item], driver=self.driver
+            child = self._children[item] = Value(
+                identifiers=new_identifiers,
+                default_value=self._defaults[item],
+                driver=self.driver,
+                frozen_reads=self.frozen_reads,
             )
+            return child
         elif self.force_registration:
             raise AttributeError("'{}' is not a valid registered Group or value.".format(item))
         else:
-            return Value(identifiers=new_identifiers, default_value=None, driver=self.driver)
+            return Value(
+                identifiers=new_identifiers,
+                default_value=None,
+                driver=self.driver,
+                frozen_reads=self.frozen_reads,
+            )
 
     async def clear_raw(self, *nested_path: Any):
         """
@@ -263,7 +1059,9 @@ class Group(Value):
             dict access. These are casted to `str` for you.
         """
         path = [str(p) for p in nested_path]
-        await self.driver.clear(*self.identifiers, *path)
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "clear"):
+            await _change(self.driver, (*self.identifiers, *path), _CLEARED)
+        await _notify_change(self.driver, (*self.identifiers, *path))
 
     def is_group(self, item: Any) -> bool:
         """A helper method for `__getattr__`. Most developers will have no need
@@ -369,27 +1167,121 @@ class Group(Value):
 
         """
         path = [str(p) for p in nested_path]
+        registered = self._registered_default(path, default)
+
+        try:
+            with storage_stats.timed(self.driver.cog_name, self.identifiers, "get"):
+                await _load_expiries(self.driver)
+                if self.frozen_reads:
+                    raw = await _driver_for(self.driver).get_frozen(*self.identifiers, *path)
+                else:
+                    raw = await _driver_for(self.driver).get(*self.identifiers, *path)
+        except KeyError:
+            return self._missing_raw(path, default, registered)
+        return self._with_raw_defaults(raw, default, registered)
+
+    async def get_many_raw(self, *paths: Sequence[Any], default=...) -> List[Any]:
+        """Get the values at several nested paths at once.
+
+        This is the same as calling `get_raw` for each path, except all of
+        the values are read from storage in a single operation.
+
+        Example
+        -------
+        ::
+
+            foo, bar = await conf.get_many_raw(("foo",), ("bar", "baz"))
+
+        Parameters
+        ----------
+        paths : Sequence[Any]
+            Each path, as a sequence of keys. These are casted to `str` for
+            you.
+        default
+            Default argument for any values which do not exist.
+
+        Returns
+        -------
+        List[Any]
+            The value at each path, in the same order as ``paths``.
+
+        Raises
+        ------
+        KeyError
+            If a value does not exist yet in Config's internal storage, and
+            has no default.
 
-        if default is ...:
-            poss_default = self.defaults
-            for ident in path:
-                try:
-                    poss_default = poss_default[ident]
-                except KeyError:
-                    break
+        """
+        paths = [tuple(str(p) for p in path) for path in paths]
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "get"):
+            await _load_expiries(self.driver)
+            found = await _driver_for(self.driver).get_many(
+                [(*self.identifiers, *path) for path in paths], frozen=self.frozen_reads
+            )
+        ret = []
+        for path in paths:
+            registered = self._registered_default(path, default)
+            try:
+                raw = found[(*self.identifiers, *path)]
+            except KeyError:
+                ret.append(self._missing_raw(path, default, registered))
             else:
-                default = poss_default
+                ret.append(self._with_raw_defaults(raw, default, registered))
+        return ret
 
+    def _registered_default(self, path, default):
+        if default is not ...:
+            return None
         try:
-            raw = await self.driver.get(*self.identifiers, *path)
+            return self._default_plan.lookup(path)
         except KeyError:
-            if default is not ...:
-                return default
-            raise
-        else:
-            if isinstance(default, dict):
-                return self.nested_update(raw, default)
-            return raw
+            return None
+
+    def _missing_raw(self, path, default, registered):
+        if default is not ...:
+            return freeze(default) if self.frozen_reads else default
+        if registered is None:
+            raise KeyError((*self.identifiers, *path))
+        kind, value = registered
+        if self.frozen_reads:
+            return freeze(value.defaults if kind is _GROUP else value)
+        return _DefaultsPlan.copy_default(kind, value)
+
+    def _with_raw_defaults(self, raw, default, registered):
+        if registered is not None:
+            kind, plan = registered
+            if kind is _GROUP and isinstance(raw, FrozenDict):
+                return raw.with_defaults(plan.defaults)
+            if kind is _GROUP and isinstance(raw, dict):
+                return plan.merge(raw)
+        elif isinstance(default, dict):
+            if isinstance(raw, FrozenDict):
+                return raw.with_defaults(default)
+            return self.nested_update(raw, default)
+        return raw
+
+    def batch(self) -> _Transaction:
+        """Buffer changes to this group's data and save them all at once.
+
+        This is the same as `Config.transaction`, and covers changes made
+        to any of the data sharing this group's driver, not just this
+        group.
+
+        Example
+        -------
+        ::
+
+            async with conf.member(member).batch():
+                await conf.member(member).balance.set(100)
+                await conf.member(member).name.set(member.display_name)
+
+        Returns
+        -------
+        `asynchronous context manager`
+            The transaction.
+
+        """
+        return _Transaction(self.driver)
 
     def all(self) -> _ValueCtxManager[Dict[str, Any]]:
         """Get a dictionary representation of this group's data.
@@ -429,12 +1321,14 @@ class Group(Value):
                 defaults[key] = deepcopy(current[key])
         return defaults
 
-    async def set(self, value):
+    async def set(self, value, *, expire_after: Union[float, datetime.timedelta] = None):
         if not isinstance(value, dict):
             raise ValueError("You may only set the value of a group to be a dict.")
-        await super().set(value)
+        await super().set(value, expire_after=expire_after)
 
-    async def set_raw(self, *nested_path: Any, value):
+    async def set_raw(
+        self, *nested_path: Any, value, expire_after: Union[float, datetime.timedelta] = None
+    ):
         """
         Allows a developer to set data as if it was stored in a standard
         Python dictionary.
@@ -455,11 +1349,41 @@ class Group(Value):
             `dict` access. These are casted to `str` for you.
         value
             The value to store.
+        expire_after : `float` or `datetime.timedelta`, optional
+            If given, the value is cleared after this many seconds. See
+            `Value.set`.
         """
         path = [str(p) for p in nested_path]
+        if isinstance(value, (FrozenDict, tuple)):
+            value = thaw(value)
         if isinstance(value, dict):
             value = _str_key_dict(value)
-        await self.driver.set(*self.identifiers, *path, value=value)
+        with storage_stats.timed(self.driver.cog_name, self.identifiers, "set"):
+            await _change(self.driver, (*self.identifiers, *path), value, expire_after)
+        await _notify_change(self.driver, (*self.identifiers, *path))
+
+    async def set_many_raw(self, values: Dict[Sequence[Any], Any]):
+        """Set the values at several nested paths at once.
+
+        This is the same as calling `set_raw` for each path within a
+        `batch`, so all of the values are saved in a single operation.
+
+        Example
+        -------
+        ::
+
+            await conf.set_many_raw({("foo",): 1, ("bar", "baz"): 2})
+
+        Parameters
+        ----------
+        values : Dict[Sequence[Any], Any]
+            A dict mapping each path, as a sequence of keys, to the value
+            to store there. The keys are casted to `str` for you.
+
+        """
+        async with self.batch():
+            for path, value in values.items():
+                await self.set_raw(*path, value=value)
 
 
 class Config:
@@ -495,6 +1419,14 @@ class Config:
         **You should use this.** By enabling force registration you give Config
         the ability to alert you instantly if you've made a typo when
         attempting to access data.
+    frozen_reads : `bool`
+        Determines if Config should return read-only views of the stored data
+        instead of copies. Dicts are returned as a read-only
+        `collections.abc.Mapping` and lists are returned as tuples. This is
+        much cheaper for frequently read data, such as data read on every
+        message, since nothing needs to be copied.
+
+        Values used as an async context manager are still mutable copies.
 
     """
 
@@ -505,6 +1437,9 @@ class Config:
     USER = "USER"
     MEMBER = "MEMBER"
 
+    # The number of recently used groups which are kept alive for reuse
+    GROUP_CACHE_SIZE = 256
+
     def __init__(
         self,
         cog_name: str,
@@ -512,20 +1447,34 @@ class Config:
         driver: "BaseDriver",
         force_registration: bool = False,
         defaults: dict = None,
+        frozen_reads: bool = False,
     ):
         self.cog_name = cog_name
         self.unique_identifier = unique_identifier
 
         self.driver = driver
         self.force_registration = force_registration
+        self.frozen_reads = frozen_reads
         self._defaults = defaults or {}
+        self._default_plans = {}
+        # Groups are handed out again while anything still references them,
+        # and the most recently used ones are kept alive.
+        self._groups = weakref.WeakValueDictionary()
+        self._recent_groups = collections.OrderedDict()
 
     @property
     def defaults(self):
         return deepcopy(self._defaults)
 
     @classmethod
-    def get_conf(cls, cog_instance, identifier: int, force_registration=False, cog_name=None):
+    def get_conf(
+        cls,
+        cog_instance,
+        identifier: int,
+        force_registration=False,
+        cog_name=None,
+        frozen_reads=False,
+    ):
         """Get a Config instance for your cog.
 
         .. warning::
@@ -551,6 +1500,9 @@ class Config:
             Config normally uses ``cog_instance`` to determine tha name of your cog.
             If you wish you may pass ``None`` to ``cog_instance`` and directly specify
             the name of your cog here.
+        frozen_reads : `bool`, optional
+            Should config return read-only views instead of copies when
+            getting values? See `frozen_reads`.
 
         Returns
         -------
@@ -584,6 +1536,7 @@ class Config:
             unique_identifier=uuid,
             force_registration=force_registration,
             driver=driver,
+            frozen_reads=frozen_reads,
         )
         return conf
 
@@ -693,6 +1646,18 @@ class Config:
             to_add = self._get_defaults_dict(k, v)
             self._update_defaults(to_add, self._defaults[key])
 
+        self._default_plans[key] = _DefaultsPlan(self._defaults[key])
+        self._groups.clear()
+        self._recent_groups.clear()
+
+    def _get_default_plan(self, key: str) -> _DefaultsPlan:
+        defaults = self._defaults.get(key, _NO_DEFAULTS)
+        plan = self._default_plans.get(key)
+        # The defaults may have been replaced without being registered
+        if plan is None or plan.defaults is not defaults:
+            plan = self._default_plans[key] = _DefaultsPlan(defaults)
+        return plan
+
     def register_global(self, **kwargs):
         """Register default values for attributes you wish to store in `Config`
         at a global level.
@@ -783,14 +1748,177 @@ class Config:
         """
         self._register_default(group_identifier, **kwargs)
 
-    def _get_base_group(self, key: str, *identifiers: str) -> Group:
-        # noinspection PyTypeChecker
-        return Group(
-            identifiers=(key, *identifiers),
-            defaults=self.defaults.get(key, {}),
-            driver=self.driver,
-            force_registration=self.force_registration,
+    def transaction(self) -> _Transaction:
+        """Buffer changes to this Config's data and save them all at once.
+
+        Within the :code:`async with` block, sets and clears are held back
+        instead of being written to storage, and reads made within the
+        block include the held back changes. When the block exits, all of
+        the changes are saved in a single driver operation, such as a
+        single file write for JSON or a single update for MongoDB. If the
+        block raises an exception, the changes are discarded.
+
+        Nested transactions are merged into the outermost one. Changes made
+        from other tasks are not held back, and do not see the held back
+        changes.
+
+        Example
+        -------
+        ::
+
+            async with conf.transaction():
+                await conf.user(user).balance.set(100)
+                await conf.user(user).created_at.set(timestamp)
+
+        Returns
+        -------
+        `asynchronous context manager`
+            The transaction.
+
+        """
+        return _Transaction(self.driver)
+
+    async def get_many(self, *values: Value) -> List[Any]:
+        """Get the data of several values or groups at once.
+
+        This is the same as awaiting each of them, except all of the data
+        is read from storage in a single operation. The values can be from
+        any scope, but must all belong to this Config.
+
+        Example
+        -------
+        ::
+
+            banned_until = await conf.get_many(
+                *(conf.member(m).banned_until for m in guild.members)
+            )
+
+        Parameters
+        ----------
+        *values : Value
+            The values (or groups) to get.
+
+        Returns
+        -------
+        List[Any]
+            The data of each value, in the same order as ``values``.
+
+        """
+        with storage_stats.timed(self.cog_name, (), "get"):
+            await _load_expiries(self.driver)
+            found = await _driver_for(self.driver).get_many(
+                [value.identifiers for value in values], frozen=self.frozen_reads
+            )
+        ret = []
+        for value in values:
+            try:
+                raw = found[value.identifiers]
+            except KeyError:
+                ret.append(value._default_value())
+            else:
+                ret.append(value._with_defaults(raw))
+        return ret
+
+    async def set_many(self, values: Dict[Value, Any]):
+        """Set the data of several values at once.
+
+        This is the same as setting each of them within a `transaction`,
+        so all of the values are saved in a single operation.
+
+        Parameters
+        ----------
+        values : Dict[Value, Any]
+            A dict mapping each value (or group) to its new data.
+
+        """
+        async with self.transaction():
+            for value_obj, value in values.items():
+                await value_obj.set(value)
+
+    def on_change(self, scope: str, path: Sequence[Any], callback: Callable) -> Callable:
+        """Call ``callback`` whenever data in part of this Config changes.
+
+        The callback is called after each successful set or clear of data
+        at, above or below ``path`` within ``scope``, with the changed path
+        of identifiers (starting with the scope) as its only argument. It
+        may be a coroutine function. Changes made within a `transaction`
+        are reported once it has been committed. Exceptions raised by the
+        callback are logged and otherwise ignored.
+
+        This lets cogs keep data derived from Config, such as compiled
+        patterns or indexes, and only rebuild it when the data changes.
+        Listeners should be removed with `remove_change_listener` when the
+        cog is unloaded.
+
+        Example
+        -------
+        ::
+
+            conf.on_change(Config.GUILD, [guild.id, "filter"], invalidate)
+
+        Parameters
+        ----------
+        scope : str
+            The scope to watch, such as `Config.GUILD`.
+        path : Sequence[Any]
+            The identifiers below the scope to watch, such as a guild's ID
+            followed by the name of a value. This may be empty to watch
+            the whole scope.
+        callback : Callable
+            The function to call.
+
+        Returns
+        -------
+        Callable
+            The callback.
+
+        """
+        identifiers = (str(scope), *map(str, path))
+        _change_listeners.setdefault(_listener_key(self.driver), []).append(
+            (identifiers, callback)
         )
+        return callback
+
+    def remove_change_listener(self, scope: str, path: Sequence[Any], callback: Callable):
+        """Stop calling a callback registered with `on_change`.
+
+        Does nothing if the callback was not registered with this scope
+        and path.
+        """
+        key = _listener_key(self.driver)
+        listeners = _change_listeners.get(key, [])
+        try:
+            listeners.remove(((str(scope), *map(str, path)), callback))
+        except ValueError:
+            return
+        if not listeners:
+            del _change_listeners[key]
+
+    def _get_base_group(self, key: str, *identifiers: str) -> Group:
+        plan = self._get_default_plan(key)
+        identifiers = (key, *identifiers)
+        group = self._groups.get(identifiers)
+        if (
+            group is None
+            or group._default_plan is not plan
+            or group.force_registration != self.force_registration
+            or group.frozen_reads != self.frozen_reads
+        ):
+            # noinspection PyTypeChecker
+            group = self._groups[identifiers] = Group(
+                identifiers=identifiers,
+                defaults=plan.defaults,
+                driver=self.driver,
+                force_registration=self.force_registration,
+                frozen_reads=self.frozen_reads,
+                default_plan=plan,
+            )
+        recent = self._recent_groups
+        recent[identifiers] = group
+        recent.move_to_end(identifiers)
+        if len(recent) > self.GROUP_CACHE_SIZE:
+            recent.popitem(last=False)
+        return group
 
     def guild(self, guild: discord.Guild) -> Group:
         """Returns a `Group` for the given guild.
@@ -874,6 +2002,44 @@ class Config:
         """
         return self._get_base_group(self.MEMBER, str(member.guild.id), str(member.id))
 
+    def user_from_id(self, user_id: int) -> Group:
+        """Returns a `Group` for the user with the given ID.
+
+        This is the same as `user`, for when only the user's ID is known.
+
+        Parameters
+        ----------
+        user_id : int
+            The user's ID.
+
+        Returns
+        -------
+        `Group <redbot.core.config.Group>`
+            The user's Group object.
+
+        """
+        return self._get_base_group(self.USER, str(user_id))
+
+    def member_from_ids(self, guild_id: int, member_id: int) -> Group:
+        """Returns a `Group` for the member with the given IDs.
+
+        This is the same as `member`, for when only the IDs are known.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the member's guild.
+        member_id : int
+            The member's ID.
+
+        Returns
+        -------
+        `Group <redbot.core.config.Group>`
+            The member's Group object.
+
+        """
+        return self._get_base_group(self.MEMBER, str(guild_id), str(member_id))
+
     def custom(self, group_identifier: str, *identifiers: str):
         """Returns a `Group` for the given custom group.
 
@@ -908,17 +2074,27 @@ class Config:
         ret = {}
 
         try:
-            dict_ = await self.driver.get(*group.identifiers)
+            dict_ = await self._get_scope_data(group)
         except KeyError:
             pass
         else:
             for k, v in dict_.items():
-                data = group.defaults
-                data.update(v)
-                ret[int(k)] = data
+                ret[int(k)] = self._fill_scope_defaults(group, v)
 
         return ret
 
+    async def _get_scope_data(self, group: Group):
+        with storage_stats.timed(self.cog_name, group.identifiers, "get"):
+            await _load_expiries(self.driver)
+            if self.frozen_reads:
+                return await _driver_for(self.driver).get_frozen(*group.identifiers)
+            return await _driver_for(self.driver).get(*group.identifiers)
+
+    def _fill_scope_defaults(self, group: Group, data):
+        if isinstance(data, FrozenDict):
+            return data.with_defaults(group._defaults)
+        return group._default_plan.merge(data, nested=False)
+
     async def all_guilds(self) -> dict:
         """Get all guild data as a dict.
 
@@ -987,13 +2163,10 @@ class Config:
         """
         return await self._all_from_scope(self.USER)
 
-    @staticmethod
-    def _all_members_from_guild(group: Group, guild_data: dict) -> dict:
+    def _all_members_from_guild(self, group: Group, guild_data: dict) -> dict:
         ret = {}
         for member_id, member_data in guild_data.items():
-            new_member_data = group.defaults
-            new_member_data.update(member_data)
-            ret[int(member_id)] = new_member_data
+            ret[int(member_id)] = self._fill_scope_defaults(group, member_data)
         return ret
 
     async def all_members(self, guild: discord.Guild = None) -> dict:
@@ -1025,7 +2198,7 @@ class Config:
         if guild is None:
             group = self._get_base_group(self.MEMBER)
             try:
-                dict_ = await self.driver.get(*group.identifiers)
+                dict_ = await self._get_scope_data(group)
             except KeyError:
                 pass
             else:
@@ -1034,13 +2207,127 @@ class Config:
         else:
             group = self._get_base_group(self.MEMBER, str(guild.id))
             try:
-                guild_data = await self.driver.get(*group.identifiers)
+                guild_data = await self._get_scope_data(group)
             except KeyError:
                 pass
             else:
                 ret = self._all_members_from_guild(group, guild_data)
         return ret
 
+    async def _iter_scope(self, group: Group) -> AsyncIterator[Tuple[int, Any]]:
+        await _load_expiries(self.driver)
+        driver = _driver_for(self.driver)
+        async for key, data in driver.iter_children(*group.identifiers, frozen=self.frozen_reads):
+            yield int(key), self._fill_scope_defaults(group, data)
+
+    def iter_guilds(self) -> AsyncIterator[Tuple[int, Any]]:
+        """Iterate over the data for every guild.
+
+        This is the streaming version of `all_guilds`. Entries are read from
+        storage as they are needed, so the data for every guild never needs
+        to be held in memory at once.
+
+        Example
+        -------
+        ::
+
+            async for guild_id, data in conf.iter_guilds():
+                ...
+
+        Note
+        ----
+        The yielded data will include registered defaults for values which
+        have not yet been set.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            Each guild's ID and its data.
+
+        """
+        return self._iter_scope(self._get_base_group(self.GUILD))
+
+    def iter_channels(self) -> AsyncIterator[Tuple[int, Any]]:
+        """Iterate over the data for every channel.
+
+        This is the streaming version of `all_channels`. See `iter_guilds`.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            Each channel's ID and its data.
+
+        """
+        return self._iter_scope(self._get_base_group(self.CHANNEL))
+
+    def iter_roles(self) -> AsyncIterator[Tuple[int, Any]]:
+        """Iterate over the data for every role.
+
+        This is the streaming version of `all_roles`. See `iter_guilds`.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            Each role's ID and its data.
+
+        """
+        return self._iter_scope(self._get_base_group(self.ROLE))
+
+    def iter_users(self) -> AsyncIterator[Tuple[int, Any]]:
+        """Iterate over the data for every user.
+
+        This is the streaming version of `all_users`. See `iter_guilds`.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            Each user's ID and its data.
+
+        """
+        return self._iter_scope(self._get_base_group(self.USER))
+
+    async def iter_members(self, guild: discord.Guild = None) -> AsyncIterator[Tuple[int, ...]]:
+        """Iterate over the data for every member.
+
+        This is the streaming version of `all_members`. See `iter_guilds`.
+
+        If :code:`guild` is specified, this yields :code:`(MEMBER_ID, data)`
+        for each member of that guild. Otherwise, this yields
+        :code:`(GUILD_ID, MEMBER_ID, data)` for each member of every guild,
+        reading one guild's members at a time.
+
+        Example
+        -------
+        ::
+
+            async for member_id, data in conf.iter_members(guild):
+                ...
+
+        Parameters
+        ----------
+        guild : `discord.Guild`, optional
+            The guild to get the member data from. Can be omitted if data
+            from every member of all guilds is desired.
+
+        Yields
+        ------
+        tuple
+            Each member's IDs and data.
+
+        """
+        if guild is not None:
+            async for item in self._iter_scope(self._get_base_group(self.MEMBER, str(guild.id))):
+                yield item
+            return
+        group = self._get_base_group(self.MEMBER)
+        await _load_expiries(self.driver)
+        driver = _driver_for(self.driver)
+        async for guild_id, guild_data in driver.iter_children(
+            *group.identifiers, frozen=self.frozen_reads
+        ):
+            for member_id, member_data in guild_data.items():
+                yield int(guild_id), int(member_id), self._fill_scope_defaults(group, member_data)
+
     async def _clear_scope(self, *scopes: str):
         """Clear all data in a particular scope.
 
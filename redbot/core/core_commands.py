@@ -28,6 +28,7 @@ from redbot.core import (
     errors,
     i18n,
 )
+from .drivers import stats as storage_stats
 from .utils.predicates import MessagePredicate
 from .utils.chat_formatting import pagify, box, inline
 
@@ -59,6 +60,7 @@ class CoreLogic:
         self.bot.register_rpc_handler(self._prefixes)
         self.bot.register_rpc_handler(self._version_info)
         self.bot.register_rpc_handler(self._invite_url)
+        self.bot.register_rpc_handler(self._storage_stats)
 
     async def _load(
         self, cog_names: Iterable[str]
@@ -268,6 +270,22 @@ class CoreLogic:
         app_info = await self.bot.application_info()
         return discord.utils.oauth_url(app_info.id)
 
+    async def _storage_stats(self, cog_name: Optional[str] = None) -> Dict[str, Dict[str, dict]]:
+        """
+        Gets the storage statistics recorded by Config and its drivers.
+
+        Parameters
+        ----------
+        cog_name : str, optional
+            Only get the statistics for this cog.
+
+        Returns
+        -------
+        dict
+            The statistics for each scope, keyed by cog name and then scope.
+        """
+        return storage_stats.snapshot(cog_name)
+
 
 @i18n.cog_i18n(_)
 class Core(commands.Cog, CoreLogic):
@@ -456,6 +474,51 @@ class Core(commands.Cog, CoreLogic):
         else:
             await ctx.send("No exception has occurred yet")
 
+    @commands.command()
+    @checks.is_owner()
+    async def storagestats(self, ctx: commands.Context, cog_name: str = None):
+        """Shows which cogs are making the most use of storage
+
+        Scopes are sorted by the number of bytes they caused to be written.
+        Each operation is shown as its count and its 99th percentile time in
+        milliseconds. Lock is the 99th percentile time spent waiting to save,
+        and Load is the total time spent loading data, in milliseconds.
+        """
+        stats = await self._storage_stats(cog_name)
+        rows = []
+        for name, scopes in stats.items():
+            for scope, scope_stats in scopes.items():
+                rows.append((name, scope, scope_stats))
+        if not rows:
+            await ctx.send(_("No storage statistics have been recorded yet."))
+            return
+        rows.sort(key=lambda r: r[2]["bytes_serialized"], reverse=True)
+
+        def p99(histogram):
+            return "{}/{:.1f}".format(histogram["count"], histogram["p99"] * 1000)
+
+        lines = [
+            "{:<20} {:<12} {:>12} {:>12} {:>12} {:>12} {:>10} {:>8} {:>8}".format(
+                "Cog", "Scope", "Gets", "Sets", "Clears", "Saves", "Bytes", "Lock", "Load"
+            )
+        ]
+        for name, scope, scope_stats in rows:
+            lines.append(
+                "{:<20} {:<12} {:>12} {:>12} {:>12} {:>12} {:>10} {:>8.1f} {:>8.1f}".format(
+                    name[:20],
+                    scope[:12],
+                    p99(scope_stats["get"]),
+                    p99(scope_stats["set"]),
+                    p99(scope_stats["clear"]),
+                    p99(scope_stats["save"]),
+                    scope_stats["bytes_serialized"],
+                    scope_stats["lock_wait"]["p99"] * 1000,
+                    scope_stats["load"]["total"] * 1000,
+                )
+            )
+        for page in pagify("\n".join(lines), shorten_by=10):
+            await ctx.send(box(page))
+
     @commands.command()
     @checks.is_owner()
     async def invite(self, ctx: commands.Context):
@@ -1128,11 +1191,12 @@ class Core(commands.Cog, CoreLogic):
     async def backup(self, ctx: commands.Context, *, backup_path: str = None):
         """Creates a backup of all data for the instance."""
         from redbot.core.data_manager import basic_config, instance_name
-        from redbot.core.drivers.red_json import JSON
+        from redbot.core.drivers import flush_pending_writes
+        from redbot.core.json_io import JsonIO
 
         data_dir = Path(basic_config["DATA_PATH"])
         if basic_config["STORAGE_TYPE"] == "MongoDB":
-            from redbot.core.drivers.red_mongo import Mongo
+            from redbot.core.drivers.red_mongo import Mongo, read_collection
 
             m = Mongo("Core", "0", **basic_config["STORAGE_DETAILS"])
             db = m.db
@@ -1142,12 +1206,14 @@ class Core(commands.Cog, CoreLogic):
                     c_data_path = data_dir / basic_config["CORE_PATH_APPEND"]
                 else:
                     c_data_path = data_dir / basic_config["COG_PATH_APPEND"] / c_name
-                docs = await db[c_name].find().to_list(None)
-                for item in docs:
-                    item_id = str(item.pop("_id"))
-                    output = item
-                    target = JSON(c_name, item_id, data_path_override=c_data_path)
-                    await target.jsonIO._threadsafe_save_json(output)
+                c_data_path.mkdir(parents=True, exist_ok=True)
+                # Each cog identifier's data is saved in the same file, as the
+                # JSON driver would save it, whichever layout it is kept in
+                output = await read_collection(db[c_name])
+                target = JsonIO(c_data_path / "settings.json")
+                await target._threadsafe_save_json(output, snapshot=True)
+        # Changes which are held back from storage would be missed
+        await flush_pending_writes()
         backup_filename = "redv3-{}-{}.tar.gz".format(
             instance_name, ctx.message.created_at.strftime("%Y-%m-%d %H-%M-%S")
         )
@@ -1,4 +1,4 @@
-__all__ = ["get_driver"]
+__all__ = ["get_driver", "flush_pending_writes"]
 
 
 def get_driver(type, *args, **kwargs):
@@ -14,7 +14,7 @@ def get_driver(type, *args, **kwargs):
         should be.
 
     :param str type:
-        One of: json, mongo
+        One of: JSON, MongoDB, SQLite, Memory
     :param args:
         Dependent on driver type.
     :param kwargs:
@@ -30,4 +30,25 @@ def get_driver(type, *args, **kwargs):
         from .red_mongo import Mongo
 
         return Mongo(*args, **kwargs)
+    elif type == "SQLite":
+        from .red_sqlite import SQLite
+
+        return SQLite(*args, **kwargs)
+    elif type == "Memory":
+        from .red_memory import Memory
+
+        return Memory(*args, **kwargs)
     raise RuntimeError("Invalid driver type: '{}'".format(type))
+
+
+async def flush_pending_writes(cog_name: str = None):
+    """
+    Writes out any changes which drivers are holding back from storage.
+
+    :param str cog_name:
+        Only flush data for the cog with this name. Omit to flush data for
+        every cog.
+    """
+    from .red_json import flush_pending
+
+    await flush_pending(cog_name)
@@ -1,4 +1,81 @@
-__all__ = ["BaseDriver"]
+from collections.abc import Mapping
+
+__all__ = ["BaseDriver", "FrozenDict", "freeze", "thaw"]
+
+
+class FrozenDict(Mapping):
+    """A read-only view of a `dict` returned by a driver.
+
+    No data is copied to create the view. Nested dicts are wrapped in
+    another `FrozenDict` and lists are returned as tuples when they are
+    accessed.
+
+    A view can optionally fall back to a dict of defaults for keys which
+    are missing from the data it wraps. This is how `Config` mixes in
+    registered defaults without copying them.
+    """
+
+    __slots__ = ("_data", "_defaults")
+
+    def __init__(self, data: dict, defaults: dict = None):
+        self._data = data
+        self._defaults = defaults or {}
+
+    def __getitem__(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            return freeze(self._defaults[key])
+        default = self._defaults.get(key)
+        if isinstance(value, dict) and isinstance(default, dict):
+            return FrozenDict(value, default)
+        return freeze(value)
+
+    def __iter__(self):
+        yield from self._data
+        for key in self._defaults:
+            if key not in self._data:
+                yield key
+
+    def __len__(self):
+        return len(self._data) + sum(1 for k in self._defaults if k not in self._data)
+
+    def __contains__(self, key):
+        return key in self._data or key in self._defaults
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, thaw(self))
+
+    def with_defaults(self, defaults: dict) -> "FrozenDict":
+        """Get a view of the same data which falls back to ``defaults``."""
+        return FrozenDict(self._data, defaults)
+
+
+def freeze(value):
+    """Get a read-only version of a value from a driver without copying it."""
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    elif isinstance(value, list):
+        return tuple(map(freeze, value))
+    return value
+
+
+def thaw(value):
+    """Get a mutable copy of a value which was returned by `freeze`."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+def bounded(value, minimum=None, maximum=None):
+    """Clamp a number between the given bounds, where given."""
+    if minimum is not None and value < minimum:
+        return minimum
+    if maximum is not None and value > maximum:
+        return maximum
+    return value
 
 
 class BaseDriver:
@@ -22,6 +99,94 @@ class BaseDriver:
         """
         raise NotImplementedError
 
+    async def get_frozen(self, *identifiers: str):
+        """
+        Finds the value indicated by the given identifiers, as a read-only
+        view.
+
+        Drivers which can hand out their stored data without copying it
+        should override this. By default, this freezes the result of
+        `get`.
+
+        Parameters
+        ----------
+        identifiers
+            A list of identifiers that correspond to nested dict accesses.
+
+        Returns
+        -------
+        Any
+            Stored value, with any dicts wrapped in a `FrozenDict` and any
+            lists converted to tuples.
+        """
+        return freeze(await self.get(*identifiers))
+
+    async def iter_children(self, *identifiers: str, frozen: bool = False):
+        """
+        Iterates over the items of the dict indicated by the given
+        identifiers.
+
+        Drivers which can read the items one at a time, rather than reading
+        the whole dict at once, should override this. By default, this
+        iterates over the result of `get`. Nothing is yielded if there is
+        no value stored at the given identifiers.
+
+        Parameters
+        ----------
+        identifiers
+            A list of identifiers that correspond to nested dict accesses.
+        frozen : bool
+            Whether or not to yield read-only views, as returned by
+            `get_frozen`, instead of copies.
+
+        Yields
+        ------
+        Tuple[str, Any]
+            Each key in the dict and its value.
+        """
+        try:
+            if frozen:
+                data = await self.get_frozen(*identifiers)
+            else:
+                data = await self.get(*identifiers)
+        except KeyError:
+            return
+        for item in data.items():
+            yield item
+
+    async def get_many(self, paths, frozen: bool = False):
+        """
+        Finds the values indicated by several tuples of identifiers at once.
+
+        Drivers which can read several values in a single operation should
+        override this. By default, this calls `get` (or `get_frozen`) for
+        each path.
+
+        Parameters
+        ----------
+        paths
+            An iterable of tuples of identifiers.
+        frozen : bool
+            Whether or not to return read-only views, as returned by
+            `get_frozen`, instead of copies.
+
+        Returns
+        -------
+        dict
+            A dict mapping each path to its stored value. Paths with no
+            stored value are left out.
+        """
+        ret = {}
+        for identifiers in paths:
+            try:
+                if frozen:
+                    ret[identifiers] = await self.get_frozen(*identifiers)
+                else:
+                    ret[identifiers] = await self.get(*identifiers)
+            except KeyError:
+                pass
+        return ret
+
     def get_config_details(self):
         """
         Asks users for additional configuration information necessary
@@ -58,3 +223,84 @@ class BaseDriver:
             A list of identifiers that correspond to nested dict accesses.
         """
         raise NotImplementedError
+
+    async def apply_changes(self, sets: dict, clears):
+        """
+        Sets and clears several values at once.
+
+        None of the given paths overlap, so the changes can be applied in
+        any order. Drivers which can save several changes in a single
+        operation should override this. By default, this calls `set` and
+        `clear` for each change.
+
+        Parameters
+        ----------
+        sets : dict
+            A dict mapping each tuple of identifiers to the value to set
+            there.
+        clears
+            An iterable of tuples of identifiers to clear.
+        """
+        for identifiers, value in sets.items():
+            await self.set(*identifiers, value=value)
+        for identifiers in clears:
+            await self.clear(*identifiers)
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
+        """
+        Adds to the number indicated by the given identifiers.
+
+        Drivers should override this to make the change atomic, so that
+        concurrent increments are never lost. By default, this calls `get`
+        and then `set`.
+
+        Parameters
+        ----------
+        identifiers
+            A list of identifiers that correspond to nested dict accesses.
+        amount
+            The number to add, which may be negative.
+        default
+            The number to add to if there is no value stored yet.
+        minimum
+            If given, the result is raised to this if it would be lower.
+        maximum
+            If given, the result is lowered to this if it would be higher.
+
+        Returns
+        -------
+        Any
+            The new value.
+        """
+        try:
+            value = await self.get(*identifiers)
+        except KeyError:
+            value = default
+        value = bounded(value + amount, minimum, maximum)
+        await self.set(*identifiers, value=value)
+        return value
+
+    async def set_many(self, values: dict):
+        """
+        Sets several values at once.
+
+        This is the same as calling `apply_changes` with no clears, so
+        drivers which save a batch of changes in a single operation do so
+        here too.
+
+        Parameters
+        ----------
+        values : dict
+            A dict mapping each tuple of identifiers to the value to set
+            there. None of the paths may overlap.
+        """
+        await self.apply_changes(values, ())
+
+    async def flush(self):
+        """
+        Writes out any changes which this driver has not yet saved.
+
+        Drivers which save every change straight away have nothing to do
+        here.
+        """
+        pass
@@ -1,12 +1,25 @@
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple
+import asyncio
 import copy
+import functools
+import os
+import shutil
+import time
 import weakref
 import logging
+from urllib.parse import quote, unquote
 
-from ..json_io import JsonIO
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
-from .red_base import BaseDriver
+from ..json_io import JsonIO, MINIFIED, PRETTY, dumps, loads
+
+from . import stats
+from .red_base import BaseDriver, bounded, freeze
 
 __all__ = ["JSON"]
 
@@ -14,6 +27,11 @@ __all__ = ["JSON"]
 _shared_datastore = {}
 _driver_counts = {}
 _finalizers = []
+_pending_writes = {}
+_journals = {}
+_shards = {}
+_load_locks = {}
+_interprocess = {}
 
 log = logging.getLogger("redbot.json_driver")
 
@@ -25,6 +43,13 @@ def finalize_driver(cog_name):
     _driver_counts[cog_name] -= 1
 
     if _driver_counts[cog_name] == 0:
+        pending = _pending_writes.pop(cog_name, None)
+        if pending is not None:
+            pending.flush_now()
+        _journals.pop(cog_name, None)
+        _shards.pop(cog_name, None)
+        _load_locks.pop(cog_name, None)
+        _interprocess.pop(cog_name, None)
         if cog_name in _shared_datastore:
             del _shared_datastore[cog_name]
 
@@ -33,6 +58,576 @@ def finalize_driver(cog_name):
             _finalizers.remove(f)
 
 
+def _replace_path(partial: dict, identifiers: Tuple[str, ...], value) -> dict:
+    """Get a copy of ``partial`` with the value at ``identifiers`` replaced.
+
+    Only the dicts along the path are copied, so the original data (and any
+    views handed out of it) stays untouched.
+    """
+    ret = dict(partial)
+    first, rest = identifiers[0], identifiers[1:]
+    if rest:
+        ret[first] = _replace_path(partial.get(first, {}), rest, value)
+    else:
+        ret[first] = value
+    return ret
+
+
+def _remove_path(partial: dict, identifiers: Tuple[str, ...]) -> dict:
+    """Get a copy of ``partial`` with the value at ``identifiers`` removed.
+
+    Raises
+    ------
+    KeyError
+        If there is no value at ``identifiers``.
+
+    """
+    ret = dict(partial)
+    first, rest = identifiers[0], identifiers[1:]
+    if rest:
+        ret[first] = _remove_path(partial[first], rest)
+    else:
+        del ret[first]
+    return ret
+
+
+def _apply_record(data: dict, record: dict) -> dict:
+    path = tuple(record["path"])
+    if "value" in record:
+        return _replace_path(data, path, record["value"])
+    if "amount" in record:
+        try:
+            value = _find_path(data, path)
+        except KeyError:
+            value = record["default"]
+        value = bounded(value + record["amount"], record["minimum"], record["maximum"])
+        return _replace_path(data, path, value)
+    try:
+        return _remove_path(data, path)
+    except KeyError:
+        return data
+
+
+def read_data_file(path: Path) -> dict:
+    """Read a JSON driver's data file, including its journal and shards.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the data file (usually ``settings.json``).
+
+    Returns
+    -------
+    dict
+        The data which the JSON driver would load from this file.
+
+    """
+    data = _read_unsharded(path)
+    for key, value in _Shards.read_all(_Shards.root_for(path)).items():
+        data = _replace_path(data, key, value)
+    return data
+
+
+def _read_unsharded(path: Path) -> dict:
+    try:
+        data = JsonIO(path)._load_json()
+    except FileNotFoundError:
+        data = {}
+    data, _, _ = _Journal.replay(_Journal.path_for(path), data)
+    return data
+
+
+async def flush_pending(cog_name: str = None):
+    """Write out changes which are being held back by write-behind drivers.
+
+    Parameters
+    ----------
+    cog_name : str, optional
+        Only flush the data for this cog. Omit to flush every cog.
+
+    """
+    if cog_name is None:
+        pending = list(_pending_writes.values())
+    elif cog_name in _pending_writes:
+        pending = [_pending_writes[cog_name]]
+    else:
+        pending = []
+
+    for p in pending:
+        await p.flush()
+
+
+class _PendingWrites:
+    """Coalesces the saves for a single cog's data file.
+
+    Changes are marked as dirty instead of being saved straight away. The
+    file is then written out once, either when ``interval`` seconds have
+    passed since the first unsaved change, or when the estimated size of
+    the unsaved changes reaches ``threshold`` bytes.
+    """
+
+    def __init__(self, cog_name: str, json_io: JsonIO, interval: float, threshold: int):
+        self.cog_name = cog_name
+        self.json_io = json_io
+        self.interval = interval
+        self.threshold = threshold
+        self.dirty = False
+        self.dirty_bytes = 0
+        self._timer = None
+        self._flush_task = None
+
+    def mark_dirty(self, nbytes: int):
+        self.dirty = True
+        self.dirty_bytes += nbytes
+        if self.dirty_bytes >= self.threshold:
+            self._schedule_flush()
+        elif self._timer is None:
+            loop = asyncio.get_event_loop()
+            self._timer = loop.call_later(self.interval, self._schedule_flush)
+
+    def _schedule_flush(self):
+        self._timer = None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        try:
+            await self.flush()
+        except Exception:
+            log.exception("Failed to flush data for cog %s", self.cog_name)
+
+    def _take(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        data = _shared_datastore.get(self.cog_name)
+        if not self.dirty or data is None:
+            return None
+        self.dirty = False
+        self.dirty_bytes = 0
+        return data
+
+    async def flush(self):
+        data = self._take()
+        if data is None:
+            return
+        try:
+            await self.json_io._threadsafe_save_json(
+                data, snapshot=True, stats=stats.get_stats(self.cog_name, stats.ALL_SCOPES)
+            )
+        except Exception:
+            # Try again later
+            self.mark_dirty(0)
+            raise
+
+    def flush_now(self):
+        data = self._take()
+        if data is not None:
+            self.json_io._save_json(data)
+
+
+class _Journal:
+    """Append-only log of the changes made to a cog's data file.
+
+    Each change is appended to the journal as a single line holding its
+    identifier path and its new value, which keeps the cost of a write
+    proportional to the size of the change. The journal is replayed on top
+    of the data file when it is loaded, and compacted into a new data file
+    once it grows past ``compact_ratio`` times the size of the data file.
+    """
+
+    MIN_COMPACT_SIZE = 64 * 1024
+
+    def __init__(self, cog_name: str, json_io: JsonIO, compact_ratio: float):
+        self.cog_name = cog_name
+        self.json_io = json_io
+        self.path = self.path_for(json_io.path)
+        self.compact_ratio = compact_ratio
+        self.size = 0
+        self.snapshot_size = 0
+        self._compact_task = None
+
+    @staticmethod
+    def path_for(data_path: Path) -> Path:
+        return data_path.with_suffix(".journal")
+
+    @staticmethod
+    def replay(path: Path, data: dict) -> Tuple[dict, int, bool]:
+        """Apply the changes in the journal at ``path`` to ``data``.
+
+        Returns
+        -------
+        Tuple[dict, int, bool]
+            The updated data, the size of the journal in bytes and whether
+            or not the journal was cut short, which happens when Red stops
+            part way through appending a change.
+
+        """
+        size = 0
+        truncated = False
+        try:
+            f = path.open(encoding="utf-8", mode="r")
+        except FileNotFoundError:
+            return data, size, truncated
+        with f:
+            for line in f:
+                try:
+                    record = loads(line)
+                except ValueError:
+                    truncated = True
+                    break
+                data = _apply_record(data, record)
+                size += len(line.encode("utf-8"))
+        return data, size, truncated
+
+    def load(self, data: dict) -> dict:
+        try:
+            self.snapshot_size = self.json_io.path.stat().st_size
+        except FileNotFoundError:
+            self.snapshot_size = 0
+        data, self.size, truncated = self.replay(self.path, data)
+        if truncated or self._needs_compaction():
+            self._write_snapshot(data)
+        return data
+
+    def _needs_compaction(self) -> bool:
+        return self.size > max(self.MIN_COMPACT_SIZE, self.snapshot_size * self.compact_ratio)
+
+    def _write_snapshot(self, data: dict):
+        self.json_io._save_json(data)
+        with self.path.open(encoding="utf-8", mode="w") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self.size = 0
+        self.snapshot_size = self.json_io.path.stat().st_size
+
+    def _write_record(self, line: str):
+        with self.path.open(encoding="utf-8", mode="a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def append(self, *records: dict, scope_stats: stats.StorageStats):
+        line = "".join(dumps(r, MINIFIED) + "\n" for r in records)
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        async with self.json_io._lock:
+            acquired = time.perf_counter()
+            await loop.run_in_executor(None, functools.partial(self._write_record, line))
+        size = len(line.encode("utf-8"))
+        scope_stats.lock_wait.add(acquired - start)
+        scope_stats.save.add(time.perf_counter() - acquired)
+        scope_stats.bytes_serialized += size
+        self.size += size
+        if self._needs_compaction() and (self._compact_task is None or self._compact_task.done()):
+            self._compact_task = asyncio.ensure_future(self.compact())
+
+    async def compact(self):
+        loop = asyncio.get_event_loop()
+        async with self.json_io._lock:
+            # Changes which are applied to the data but still waiting to be
+            # appended will be replayed on top of this snapshot, which is
+            # harmless since replaying a change twice gives the same result.
+            data = _shared_datastore.get(self.cog_name)
+            if data is None:
+                return
+            await loop.run_in_executor(None, functools.partial(self._write_snapshot, data))
+        log.debug("Compacted journal for cog %s", self.cog_name)
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _InterProcess:
+    """Shares a cog's data file with other processes.
+
+    Every save takes an advisory lock on a file next to the data file. While
+    holding it, the data file is reloaded if another process has replaced
+    it since it was last read, and the changes being saved are applied on
+    top of that before it is written out. Reads reload the data file at
+    most once every ``reload_interval`` seconds, if it has changed.
+
+    A file counts as changed when its inode, modification time or size
+    differs from when it was last read or written. Files are always
+    replaced rather than modified, so a change always gives a new inode.
+    """
+
+    def __init__(self, cog_name: str, json_io: JsonIO, reload_interval: float):
+        self.cog_name = cog_name
+        self.json_io = json_io
+        self.lock_path = json_io.path.with_name(json_io.path.name + ".lock")
+        self.reload_interval = reload_interval
+        self.stamp = None
+        self._checked_at = time.monotonic()
+        self._lock = None
+
+    def _current_stamp(self):
+        try:
+            st = os.stat(str(self.json_io.path))
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def locked(self, func, *args):
+        """Call ``func`` while holding the lock shared with other processes."""
+        with open(str(self.lock_path), "a+") as f:
+            _lock_file(f)
+            try:
+                return func(*args)
+            finally:
+                _unlock_file(f)
+
+    def _read_if_changed(self):
+        stamp = self._current_stamp()
+        if stamp == self.stamp:
+            return None
+        try:
+            data = self.json_io._load_json()
+        except FileNotFoundError:
+            data = {}
+        self.stamp = stamp
+        return data
+
+    def _merge_and_save(self, data: dict, records: List[dict]) -> Tuple[dict, int]:
+        latest = self._read_if_changed()
+        if latest is not None:
+            data = latest
+        for record in records:
+            data = _apply_record(data, record)
+        size = self.json_io._save_json(data)
+        self.stamp = self._current_stamp()
+        return data, size
+
+    async def refresh(self):
+        """Reload the data if another process has changed it."""
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        lock = self._get_lock()
+        if lock.locked():
+            # The data is about to be brought up to date by a save
+            return
+        loop = asyncio.get_event_loop()
+        # Saves wait for the reload, so it can't replace data they saved
+        async with lock:
+            data = await loop.run_in_executor(None, self._read_if_changed)
+            if data is not None:
+                _shared_datastore[self.cog_name] = data
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def save(self, records: List[dict], scope_stats: stats.StorageStats) -> dict:
+        """Apply ``records`` to the latest data and save it.
+
+        Returns
+        -------
+        dict
+            The data which was saved.
+
+        """
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        async with self._get_lock():
+            acquired = time.perf_counter()
+            func = functools.partial(
+                self.locked, self._merge_and_save, _shared_datastore[self.cog_name], records
+            )
+            data, size = await loop.run_in_executor(None, func)
+            _shared_datastore[self.cog_name] = data
+        self._checked_at = time.monotonic()
+        scope_stats.lock_wait.add(acquired - start)
+        scope_stats.save.add(time.perf_counter() - acquired)
+        scope_stats.bytes_serialized += size
+        return data
+
+
+class _Shards:
+    """Splits a cog's data into one file per scope and primary key.
+
+    Data in the ``GLOBAL`` scope is kept in one file per cog identifier,
+    and data in every other scope is kept in one file per primary key (for
+    example, one file per guild). Shards are only read from disk the first
+    time their data is accessed, and each change only rewrites the shards it
+    touched.
+    """
+
+    def __init__(self, cog_name: str, root: Path, settings: dict = PRETTY):
+        self.cog_name = cog_name
+        self.root = root
+        self.settings = settings
+        self.loaded = set()
+        # Prefixes for which every shard below them has been loaded
+        self.complete = set()
+        self.lock = asyncio.Lock()
+        self._json_ios = {}
+
+    @staticmethod
+    def root_for(data_path: Path) -> Path:
+        return data_path.with_suffix("")
+
+    @staticmethod
+    def depth(identifiers: Tuple[str, ...]) -> int:
+        if len(identifiers) > 1 and identifiers[1] == "GLOBAL":
+            return 2
+        return 3
+
+    @staticmethod
+    def path_for(root: Path, key: Tuple[str, ...]) -> Path:
+        *dirs, name = (quote(k, safe="") for k in key)
+        return root.joinpath(*dirs, name + ".json")
+
+    @classmethod
+    def keys_in(cls, data, prefix: Tuple[str, ...]):
+        """Get the keys of the shards within ``data``, the value at ``prefix``."""
+        if len(prefix) >= cls.depth(prefix):
+            yield prefix
+        elif isinstance(data, dict):
+            for k, v in data.items():
+                yield from cls.keys_in(v, (*prefix, k))
+
+    @classmethod
+    def keys_on_disk(cls, root: Path, prefix: Tuple[str, ...] = ()):
+        """Get the keys of the shard files below ``prefix``."""
+        directory = root.joinpath(*(quote(k, safe="") for k in prefix))
+        try:
+            entries = list(directory.iterdir())
+        except FileNotFoundError:
+            return []
+        ret = []
+        for entry in entries:
+            if entry.is_dir():
+                ret.extend(cls.keys_on_disk(root, (*prefix, unquote(entry.name))))
+            elif entry.suffix == ".json":
+                ret.append((*prefix, unquote(entry.stem)))
+        return ret
+
+    @classmethod
+    def read_all(cls, root: Path) -> dict:
+        return {
+            key: JsonIO(cls.path_for(root, key))._load_json() for key in cls.keys_on_disk(root)
+        }
+
+    @classmethod
+    def split(cls, root: Path, data: dict, settings: dict = PRETTY):
+        """Write every shard in ``data`` out to its own file."""
+        for key in cls.keys_in(data, ()):
+            path = cls.path_for(root, key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            JsonIO(path, settings)._save_json(_find_path(data, key))
+
+    def _json_io(self, key: Tuple[str, ...]) -> JsonIO:
+        try:
+            return self._json_ios[key]
+        except KeyError:
+            ret = self._json_ios[key] = JsonIO(self.path_for(self.root, key), self.settings)
+            return ret
+
+    @staticmethod
+    def _read(json_ios):
+        ret = {}
+        for key, json_io in json_ios.items():
+            try:
+                ret[key] = json_io._load_json()
+            except FileNotFoundError:
+                pass
+        return ret
+
+    async def ensure_loaded(self, identifiers: Tuple[str, ...]):
+        """Load the shards holding the data at ``identifiers``."""
+        depth = self.depth(identifiers)
+        if len(identifiers) >= depth:
+            keys = [identifiers[:depth]]
+            if keys[0] in self.loaded:
+                return
+        elif identifiers in self.complete:
+            return
+        else:
+            keys = None
+
+        loop = asyncio.get_event_loop()
+        async with self.lock:
+            if keys is None:
+                keys = await loop.run_in_executor(
+                    None, functools.partial(self.keys_on_disk, self.root, identifiers)
+                )
+            missing = [k for k in keys if k not in self.loaded]
+            if missing:
+                # JsonIO needs to be created on the event loop's thread
+                json_ios = {k: self._json_io(k) for k in missing}
+                values = await loop.run_in_executor(None, functools.partial(self._read, json_ios))
+                data = _shared_datastore[self.cog_name]
+                for key in missing:
+                    if key in values:
+                        data = _replace_path(data, key, values[key])
+                    self.loaded.add(key)
+                _shared_datastore[self.cog_name] = data
+            if len(identifiers) < depth:
+                self.complete.add(identifiers)
+
+    async def save(self, *paths: Tuple[str, ...]):
+        """Write out the shards affected by changes to each of ``paths``."""
+        data = _shared_datastore[self.cog_name]
+        keys = set()
+        for identifiers in paths:
+            depth = self.depth(identifiers)
+            if len(identifiers) >= depth:
+                keys.add(identifiers[:depth])
+                continue
+            # Every shard below this path was loaded before it was changed
+            n = len(identifiers)
+            keys.update(k for k in self.loaded if k[:n] == identifiers)
+            try:
+                keys.update(self.keys_in(_find_path(data, identifiers), identifiers))
+            except KeyError:
+                pass
+
+        loop = asyncio.get_event_loop()
+        for key in keys:
+            self.loaded.add(key)
+            json_io = self._json_io(key)
+            try:
+                value = _find_path(data, key)
+            except KeyError:
+                async with json_io._lock:
+                    await loop.run_in_executor(None, functools.partial(_unlink, json_io.path))
+            else:
+                if not json_io.path.parent.exists():
+                    json_io.path.parent.mkdir(parents=True, exist_ok=True)
+                await json_io._threadsafe_save_json(
+                    value, snapshot=True, stats=stats.get_stats(self.cog_name, key[1])
+                )
+
+
+def _find_path(partial, identifiers: Tuple[str, ...]):
+    for i in identifiers:
+        partial = partial[i]
+    return partial
+
+
+def _unlink(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
 class JSON(BaseDriver):
     """
     Subclass of :py:class:`.red_base.BaseDriver`.
@@ -44,6 +639,89 @@ class JSON(BaseDriver):
     .. py:attribute:: data_path
 
         The path in which to store the file indicated by :py:attr:`file_name`.
+
+    The cog's data is never modified in place. Every change replaces the
+    dicts along its path with updated copies, so `get_frozen` can hand out
+    views of the stored data which will not change underneath the caller.
+
+    .. py:attribute:: write_behind
+
+        When :code:`True`, changes are not saved to disk immediately.
+        Instead, the file is marked as dirty and written out once
+        ``flush_interval`` seconds have passed, or once roughly
+        ``flush_threshold`` bytes of changes have built up, whichever
+        comes first. Pending changes are also written out when the bot
+        shuts down or the cog is unloaded.
+
+        This can be enabled for an instance by adding
+        :code:`"write_behind": true` to its ``STORAGE_DETAILS``.
+
+    .. py:attribute:: journal
+
+        When :code:`True`, each change is appended to a journal file next to
+        :py:attr:`file_name` instead of rewriting the whole file. The journal
+        is replayed when the data is loaded, and compacted into
+        :py:attr:`file_name` once it grows past ``compact_ratio`` times the
+        size of that file. This takes precedence over
+        :py:attr:`write_behind`.
+
+        This can be enabled for an instance by adding
+        :code:`"journal": true` to its ``STORAGE_DETAILS``.
+
+    .. py:attribute:: sharded
+
+        When :code:`True`, the data is split across a directory of files
+        next to :py:attr:`file_name`: one for each cog identifier's
+        ``GLOBAL`` data, and one for each primary key (such as a guild ID)
+        in every other scope. Each file is only loaded the first time its
+        data is accessed, and a change only rewrites the files it touched,
+        so the cost of a write is bounded by the size of that guild's data.
+        This takes precedence over :py:attr:`journal` and
+        :py:attr:`write_behind`.
+
+        Existing data is split up when this is turned on, and merged back
+        into :py:attr:`file_name` when it is turned off. This can be
+        enabled for an instance by adding :code:`"sharded": true` to its
+        ``STORAGE_DETAILS``.
+
+    .. py:attribute:: compact
+
+        When :code:`True`, files are saved without any indentation or
+        whitespace, which makes them several times smaller and quicker to
+        save. Files in the other format are still read: the data file is
+        converted the next time it is loaded, and each shard the next time
+        it is saved. This can be enabled for an instance by adding
+        :code:`"compact": true` to its ``STORAGE_DETAILS``.
+
+    .. py:attribute:: lazy_load
+
+        When :code:`True`, the data is not read when the driver is created.
+        Instead, it is read and parsed in an executor the first time it is
+        accessed, so loading a cog with a large data file doesn't block the
+        event loop. This can be enabled for an instance by adding
+        :code:`"lazy_load": true` to its ``STORAGE_DETAILS``.
+
+    .. py:attribute:: multiprocess
+
+        When :code:`True`, the data file can be shared by several processes,
+        such as groups of shards run separately against the same data
+        directory. Saves are made while holding an advisory lock on a
+        ``.lock`` file next to :py:attr:`file_name`, and are merged into the
+        latest version of the file, so changes made by other processes are
+        kept. Reads pick up changes made by other processes within
+        ``reload_interval`` seconds. Increments are applied to the latest
+        data while the lock is held, so they are never lost. This takes
+        precedence over :py:attr:`sharded`, :py:attr:`journal` and
+        :py:attr:`write_behind`.
+
+        This can be enabled for an instance by adding
+        :code:`"multiprocess": true` to its ``STORAGE_DETAILS``.
+
+    The time taken to load each cog's data is recorded in its
+    `storage statistics <redbot.core.drivers.stats>`.
+
+    Files are serialized with the fastest JSON library which is installed,
+    see `redbot.core.json_io.get_serializer`.
     """
 
     def __init__(
@@ -52,7 +730,17 @@ class JSON(BaseDriver):
         identifier,
         *,
         data_path_override: Path = None,
-        file_name_override: str = "settings.json"
+        file_name_override: str = "settings.json",
+        write_behind: bool = False,
+        flush_interval: float = 5.0,
+        flush_threshold: int = 1024 * 1024,
+        journal: bool = False,
+        compact_ratio: float = 1.0,
+        sharded: bool = False,
+        compact: bool = False,
+        lazy_load: bool = False,
+        multiprocess: bool = False,
+        reload_interval: float = 1.0
     ):
         super().__init__(cog_name, identifier)
         self.file_name = file_name_override
@@ -65,7 +753,21 @@ class JSON(BaseDriver):
 
         self.data_path = self.data_path / self.file_name
 
-        self.jsonIO = JsonIO(self.data_path)
+        self.settings = MINIFIED if compact else PRETTY
+        self.jsonIO = JsonIO(self.data_path, self.settings)
+
+        self.compact_ratio = compact_ratio
+        self.lazy_load = lazy_load
+        self.multiprocess = multiprocess
+        self.sharded = sharded and not multiprocess
+        self.journal = journal and not (sharded or multiprocess)
+        self.write_behind = write_behind and not (journal or sharded or multiprocess)
+        if multiprocess and cog_name not in _interprocess:
+            _interprocess[cog_name] = _InterProcess(cog_name, self.jsonIO, reload_interval)
+        if self.write_behind and cog_name not in _pending_writes:
+            _pending_writes[cog_name] = _PendingWrites(
+                cog_name, self.jsonIO, flush_interval, flush_threshold
+            )
 
         self._load_data()
 
@@ -84,44 +786,228 @@ class JSON(BaseDriver):
 
         _finalizers.append(weakref.finalize(self, finalize_driver, self.cog_name))
 
-        if self.data is not None:
+        if self.journal and self.cog_name not in _journals:
+            _journals[self.cog_name] = _Journal(self.cog_name, self.jsonIO, self.compact_ratio)
+
+        if self.sharded and self.cog_name not in _shards:
+            _shards[self.cog_name] = _Shards(
+                self.cog_name, _Shards.root_for(self.data_path), self.settings
+            )
+
+        if self.data is not None or self.lazy_load:
             return
 
+        start = time.perf_counter()
+        self.data = self._read_data()
+        self._record_load_time(time.perf_counter() - start)
+
+    async def _load_lazily(self):
+        lock = _load_locks.get(self.cog_name)
+        if lock is None:
+            lock = _load_locks[self.cog_name] = asyncio.Lock()
+        async with lock:
+            if self.data is not None:
+                return
+            loop = asyncio.get_event_loop()
+            start = time.perf_counter()
+            data = await loop.run_in_executor(None, self._read_data)
+            self._record_load_time(time.perf_counter() - start)
+            self.data = data
+
+    def _record_load_time(self, seconds: float):
+        stats.get_stats(self.cog_name, stats.ALL_SCOPES).load.add(seconds)
+        log.debug("Loaded data for cog %s in %.1f ms", self.cog_name, seconds * 1000)
+
+    def _read_data(self) -> dict:
+        """Read the data from disk, migrating it to the chosen layout and format.
+
+        This doesn't touch the event loop, so it can be run in an executor.
+        """
+        interprocess = _interprocess.get(self.cog_name) if self.multiprocess else None
+        if interprocess is None:
+            return self._read_data_file()
+        return interprocess.locked(self._read_shared_data_file, interprocess)
+
+    def _read_shared_data_file(self, interprocess: _InterProcess) -> dict:
+        data = self._read_data_file()
+        interprocess.stamp = interprocess._current_stamp()
+        return data
+
+    def _read_data_file(self) -> dict:
+        if self.sharded:
+            self._split_data()
+            return {}
+
         try:
-            self.data = self.jsonIO._load_json()
+            data = self.jsonIO._load_json()
         except FileNotFoundError:
-            self.data = {}
-            self.jsonIO._save_json(self.data)
+            data = {}
+            self.jsonIO._save_json(data)
+        else:
+            if data and self.jsonIO.loaded_settings is not self.settings:
+                # Convert the file to the chosen format
+                self.jsonIO._save_json(data)
+
+        if self.journal:
+            data = _journals[self.cog_name].load(data)
+        else:
+            journal_path = _Journal.path_for(self.data_path)
+            if journal_path.exists():
+                # The journal was turned off, so fold it back into the data file.
+                data, _, _ = _Journal.replay(journal_path, data)
+                self.jsonIO._save_json(data)
+                journal_path.unlink()
+
+        shard_root = _Shards.root_for(self.data_path)
+        if shard_root.exists():
+            # Sharding was turned off, so merge the shards back into the data file.
+            for key, value in _Shards.read_all(shard_root).items():
+                data = _replace_path(data, key, value)
+            self.jsonIO._save_json(data)
+            shutil.rmtree(str(shard_root))
+        return data
+
+    def _split_data(self):
+        # The data file is kept around (but emptied) so that tools looking
+        # for it can still find the cog's data.
+        data = _read_unsharded(self.data_path)
+        if data:
+            _Shards.split(_Shards.root_for(self.data_path), data, self.settings)
+        if data or not self.data_path.exists():
+            self.jsonIO._save_json({})
+        _unlink(_Journal.path_for(self.data_path))
+
+    async def _ensure_loaded(self, full_identifiers: Tuple[str, ...]):
+        if self.data is None:
+            await self._load_lazily()
+        elif self.multiprocess:
+            await _interprocess[self.cog_name].refresh()
+        shards = _shards.get(self.cog_name) if self.sharded else None
+        if shards is not None:
+            await shards.ensure_loaded(full_identifiers)
+
+    def _find(self, identifiers: Tuple[str, ...]):
+        return _find_path(self.data, (self.unique_cog_identifier, *identifiers))
 
     async def get(self, *identifiers: Tuple[str]):
-        partial = self.data
-        full_identifiers = (self.unique_cog_identifier, *identifiers)
-        for i in full_identifiers:
-            partial = partial[i]
-        return copy.deepcopy(partial)
+        await self._ensure_loaded((self.unique_cog_identifier, *identifiers))
+        return copy.deepcopy(self._find(identifiers))
+
+    async def get_frozen(self, *identifiers: str):
+        await self._ensure_loaded((self.unique_cog_identifier, *identifiers))
+        return freeze(self._find(identifiers))
+
+    async def get_many(self, paths, frozen: bool = False):
+        paths = list(paths)
+        for identifiers in paths:
+            await self._ensure_loaded((self.unique_cog_identifier, *identifiers))
+        ret = {}
+        for identifiers in paths:
+            try:
+                value = self._find(identifiers)
+            except KeyError:
+                continue
+            ret[identifiers] = freeze(value) if frozen else copy.deepcopy(value)
+        return ret
+
+    async def iter_children(self, *identifiers: str, frozen: bool = False):
+        await self._ensure_loaded((self.unique_cog_identifier, *identifiers))
+        try:
+            partial = self._find(identifiers)
+        except KeyError:
+            return
+        # Changes replace the stored dicts rather than modifying them, so this
+        # one can be walked while changes are made. Each value is only copied
+        # as it is reached.
+        for key, value in partial.items():
+            yield key, freeze(value) if frozen else copy.deepcopy(value)
 
     async def set(self, *identifiers: str, value=None):
-        partial = self.data
-        full_identifiers = (self.unique_cog_identifier, *identifiers)
-        for i in full_identifiers[:-1]:
-            if i not in partial:
-                partial[i] = {}
-            partial = partial[i]
-
-        partial[full_identifiers[-1]] = copy.deepcopy(value)
-        await self.jsonIO._threadsafe_save_json(self.data)
+        await self.apply_changes({identifiers: value}, ())
 
     async def clear(self, *identifiers: str):
-        partial = self.data
+        await self.apply_changes({}, (identifiers,))
+
+    async def apply_changes(self, sets: dict, clears):
+        sets = {(self.unique_cog_identifier, *k): v for k, v in sets.items()}
+        clears = [(self.unique_cog_identifier, *k) for k in clears]
+        for full_identifiers in (*sets, *clears):
+            await self._ensure_loaded(full_identifiers)
+
+        if self.multiprocess:
+            records = [{"path": k, "value": copy.deepcopy(v)} for k, v in sets.items()]
+            records.extend({"path": k} for k in clears)
+            if records:
+                await self._save_shared(records)
+            return
+
+        # Every change is applied before saving, so the whole batch is
+        # written out at once.
+        records = []
+        data = self.data
+        for full_identifiers, value in sets.items():
+            value = copy.deepcopy(value)
+            data = _replace_path(data, full_identifiers, value)
+            records.append({"path": full_identifiers, "value": value})
+        for full_identifiers in clears:
+            try:
+                data = _remove_path(data, full_identifiers)
+            except KeyError:
+                continue
+            records.append({"path": full_identifiers})
+        self.data = data
+        if records:
+            await self._save(records)
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
         full_identifiers = (self.unique_cog_identifier, *identifiers)
+        await self._ensure_loaded(full_identifiers)
+        if self.multiprocess:
+            record = {
+                "path": full_identifiers,
+                "amount": amount,
+                "default": default,
+                "minimum": minimum,
+                "maximum": maximum,
+            }
+            return _find_path(await self._save_shared([record]), full_identifiers)
+        # Nothing is awaited between reading the value and replacing it, so
+        # concurrent increments can't interleave.
         try:
-            for i in full_identifiers[:-1]:
-                partial = partial[i]
-            del partial[full_identifiers[-1]]
+            value = _find_path(self.data, full_identifiers)
         except KeyError:
-            pass
+            value = default
+        value = bounded(value + amount, minimum, maximum)
+        self.data = _replace_path(self.data, full_identifiers, value)
+        await self._save([{"path": full_identifiers, "value": value}])
+        return value
+
+    async def _save(self, records: List[dict]):
+        scope_stats = stats.get_stats(self.cog_name, stats.scope_of(records[0]["path"][1:]))
+        shards = _shards.get(self.cog_name) if self.sharded else None
+        if shards is not None:
+            await shards.save(*(tuple(r["path"]) for r in records))
+            return
+
+        journal = _journals.get(self.cog_name) if self.journal else None
+        if journal is not None:
+            await journal.append(*records, scope_stats=scope_stats)
+            return
+
+        pending = _pending_writes.get(self.cog_name) if self.write_behind else None
+        if pending is None:
+            await self.jsonIO._threadsafe_save_json(self.data, snapshot=True, stats=scope_stats)
         else:
-            await self.jsonIO._threadsafe_save_json(self.data)
+            # Serializing the new values also makes sure they can be saved,
+            # since the file itself will only be written some time later.
+            pending.mark_dirty(sum(len(dumps(r.get("value"), MINIFIED)) for r in records))
+
+    async def _save_shared(self, records: List[dict]) -> dict:
+        scope_stats = stats.get_stats(self.cog_name, stats.scope_of(records[0]["path"][1:]))
+        return await _interprocess[self.cog_name].save(records, scope_stats)
+
+    async def flush(self):
+        await flush_pending(self.cog_name)
 
     def get_config_details(self):
         return
@@ -0,0 +1,150 @@
+import asyncio
+import copy
+import random
+from typing import Optional, Tuple
+
+from .red_base import BaseDriver, bounded, freeze
+
+__all__ = ["Memory", "SimulatedFailure"]
+
+
+_stores = {}
+
+
+class SimulatedFailure(ConnectionError):
+    """Raised by the `Memory` driver when it simulates a failed operation."""
+
+
+def clear_stores(cog_name: str = None):
+    """Throw away the data held by memory drivers, for one cog or for every cog."""
+    if cog_name is None:
+        _stores.clear()
+    else:
+        _stores.pop(cog_name, None)
+
+
+class Memory(BaseDriver):
+    """
+    Subclass of :py:class:`.red_base.BaseDriver`.
+
+    Keeps all data in memory, shared between the drivers for the same cog,
+    and discards it when the process exits. This is meant for tests and
+    benchmarks rather than for running a bot.
+
+    Each operation can be slowed down and made to fail, to see how cogs
+    behave with slow or unreliable storage, such as a remote MongoDB
+    server. An operation which reads or writes several values at once
+    (like `get_many` or `apply_changes`) counts as a single round trip.
+
+    .. py:attribute:: latency
+
+        The number of seconds each operation takes.
+
+    .. py:attribute:: jitter
+
+        The most that each operation's delay randomly differs from
+        :py:attr:`latency`, in seconds.
+
+    .. py:attribute:: failure_rate
+
+        The chance (between 0 and 1) of each operation raising
+        `SimulatedFailure` after its delay, without having any effect.
+    """
+
+    def __init__(
+        self,
+        cog_name,
+        identifier,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(cog_name, identifier)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise SimulatedFailure("Simulated storage failure for cog {}".format(self.cog_name))
+
+    def _find(self, identifiers: Tuple[str, ...]):
+        partial = _stores.get(self.cog_name, {})
+        for i in (self.unique_cog_identifier, *identifiers):
+            if not isinstance(partial, dict):
+                raise KeyError(identifiers)
+            partial = partial[i]
+        return partial
+
+    def _set(self, identifiers: Tuple[str, ...], value):
+        *parents, last = (self.unique_cog_identifier, *identifiers)
+        partial = _stores.setdefault(self.cog_name, {})
+        for i in parents:
+            if not isinstance(partial.get(i), dict):
+                partial[i] = {}
+            partial = partial[i]
+        partial[last] = copy.deepcopy(value)
+
+    def _clear(self, identifiers: Tuple[str, ...]):
+        *parents, last = (self.unique_cog_identifier, *identifiers)
+        partial = _stores.get(self.cog_name, {})
+        for i in parents:
+            partial = partial.get(i)
+            if not isinstance(partial, dict):
+                return
+        partial.pop(last, None)
+
+    async def get(self, *identifiers: str):
+        await self._round_trip()
+        return copy.deepcopy(self._find(identifiers))
+
+    async def get_many(self, paths, frozen: bool = False):
+        await self._round_trip()
+        ret = {}
+        for identifiers in paths:
+            try:
+                ret[identifiers] = copy.deepcopy(self._find(identifiers))
+            except KeyError:
+                pass
+        if frozen:
+            return {k: freeze(v) for k, v in ret.items()}
+        return ret
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
+        await self._round_trip()
+        try:
+            value = self._find(identifiers)
+        except KeyError:
+            value = default
+        value = bounded(value + amount, minimum, maximum)
+        self._set(identifiers, value)
+        return value
+
+    async def set(self, *identifiers: str, value=None):
+        await self._round_trip()
+        self._set(identifiers, value)
+
+    async def clear(self, *identifiers: str):
+        await self._round_trip()
+        self._clear(identifiers)
+
+    async def apply_changes(self, sets: dict, clears):
+        await self._round_trip()
+        for identifiers, value in sets.items():
+            self._set(identifiers, value)
+        for identifiers in clears:
+            self._clear(identifiers)
+
+    def get_config_details(self):
+        return
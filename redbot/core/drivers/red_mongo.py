@@ -1,16 +1,30 @@
+import asyncio
+import copy
+import logging
 import re
-from typing import Match, Pattern
+from collections import OrderedDict
+from typing import Dict, Match, Pattern, Tuple
 from urllib.parse import quote_plus
 
 import motor.core
 import motor.motor_asyncio
+import pymongo.errors
+from pymongo import DeleteMany, DeleteOne, ReplaceOne, ReturnDocument, UpdateOne
 
-from .red_base import BaseDriver
+from . import stats
+from .red_base import BaseDriver, bounded, freeze
 
 __all__ = ["Mongo"]
 
 
 _conn = None
+_caches = {}
+_indexed_collections = set()
+
+log = logging.getLogger("redbot.mongo_driver")
+
+_MISSING = object()
+_NOT_FOUND = object()
 
 
 def _initialize(**kwargs):
@@ -37,9 +51,329 @@ def _initialize(**kwargs):
     _conn = motor.motor_asyncio.AsyncIOMotorClient(url)
 
 
+# The number of primary keys which identify a document in the split layout,
+# for each scope. Custom groups are split by their first identifier.
+_PRIMARY_KEY_COUNTS = {
+    "GLOBAL": 0,
+    "GUILD": 1,
+    "TEXTCHANNEL": 1,
+    "ROLE": 1,
+    "USER": 1,
+    "MEMBER": 2,
+}
+_ID_FIELDS = ("RED_scope", "RED_pk0", "RED_pk1")
+
+
+def _primary_key_count(scope: str) -> int:
+    return _PRIMARY_KEY_COUNTS.get(scope, 1)
+
+
+def _split_path(identifiers: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+    """Split identifiers into a document key and a path within that document.
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], Tuple[str, ...], bool]
+        The document key (the scope followed by its primary keys), the path
+        within the document, and whether or not the document key is
+        complete. An incomplete key is a prefix of several documents' keys.
+
+    """
+    if not identifiers:
+        return (), (), False
+    end = 1 + _primary_key_count(identifiers[0])
+    if len(identifiers) < end:
+        return identifiers, (), False
+    return identifiers[:end], identifiers[end:], True
+
+
+def _document_id(uuid: str, key: Tuple[str, ...]) -> dict:
+    # The fields are always in the same order, so that IDs compare equal
+    ret = {"RED_uuid": uuid}
+    for i, name in enumerate(_ID_FIELDS):
+        ret[name] = key[i] if i < len(key) else None
+    return ret
+
+
+def _key_from_id(document_id: dict) -> Tuple[str, ...]:
+    key = tuple(document_id[name] for name in _ID_FIELDS)
+    return key[: 1 + _primary_key_count(key[0])]
+
+
+def _prefix_filter(uuid: str, key_prefix: Tuple[str, ...]) -> dict:
+    ret = {"_id.RED_uuid": uuid}
+    for name, value in zip(_ID_FIELDS, key_prefix):
+        ret["_id." + name] = value
+    return ret
+
+
+def _split_value(key_prefix: Tuple[str, ...], value):
+    """Split the value at an incomplete document key into its documents."""
+    if key_prefix and len(key_prefix) == 1 + _primary_key_count(key_prefix[0]):
+        yield key_prefix, value
+        return
+    if not isinstance(value, dict):
+        raise ValueError(
+            "Only dicts can be stored above the level of a single document, "
+            "got {!r} at {}".format(value, key_prefix)
+        )
+    for k, v in value.items():
+        yield from _split_value((*key_prefix, k), v)
+
+
+def _find_in(document: dict, keys: Tuple[str, ...]):
+    partial = document
+    for k in keys:
+        if not isinstance(partial, dict):
+            raise KeyError(k)
+        partial = partial[k]
+    return partial
+
+
+async def _ensure_index(collection: motor.core.Collection):
+    if collection.name in _indexed_collections:
+        return
+    await collection.create_index(
+        [("_id.RED_uuid", 1)] + [("_id." + name, 1) for name in _ID_FIELDS]
+    )
+    _indexed_collections.add(collection.name)
+
+
+async def read_collection(collection: motor.core.Collection) -> Dict[str, dict]:
+    """Read all of the data in a cog's collection, in either layout.
+
+    Parameters
+    ----------
+    collection : motor.core.Collection
+        The cog's collection.
+
+    Returns
+    -------
+    dict
+        A dict mapping each cog identifier in the collection to its data.
+        This includes Config's hidden ``__EXPIRY__`` scope, so the data
+        keeps the times at which its values expire.
+
+    """
+    ret = {}
+    async for document in collection.find():
+        document_id = document.pop("_id")
+        if isinstance(document_id, dict):
+            partial = ret.setdefault(document_id["RED_uuid"], {})
+            *parents, last = _key_from_id(document_id)
+            for k in parents:
+                partial = partial.setdefault(k, {})
+            value = document.get("data", {})
+            partial[last] = Mongo._unescape_dict_keys(value) if isinstance(value, dict) else value
+        else:
+            ret.setdefault(document_id, {}).update(Mongo._unescape_dict_keys(document))
+    return ret
+
+
+async def migrate_to_split_layout(db: motor.core.Database):
+    """Split every cog's documents in ``db`` into one document per primary key.
+
+    Parameters
+    ----------
+    db : motor.core.Database
+        The database holding the data.
+
+    """
+    for collection_name in await db.list_collection_names():
+        collection = db[collection_name]
+        await _ensure_index(collection)
+        async for document in collection.find({"_id": {"$type": "string"}}):
+            uuid = document.pop("_id")
+            data = Mongo._unescape_dict_keys(document)
+            requests = [
+                ReplaceOne(
+                    {"_id": _document_id(uuid, key)},
+                    {"_id": _document_id(uuid, key), "data": Mongo._escape_value(value)},
+                    upsert=True,
+                )
+                for key, value in _split_value((), data)
+            ]
+            if requests:
+                await collection.bulk_write(requests)
+            await collection.delete_one({"_id": uuid})
+        log.info("Split the documents for cog %s", collection_name)
+
+
+def cache_stats(cog_name: str = None) -> dict:
+    """Get the hit and miss statistics for the read cache of each cog.
+
+    Parameters
+    ----------
+    cog_name : str, optional
+        Only get the statistics for this cog.
+
+    Returns
+    -------
+    dict
+        A dict mapping each cog name to its cache's statistics.
+
+    """
+    return {
+        name: cache.stats()
+        for name, cache in _caches.items()
+        if cog_name is None or name == cog_name
+    }
+
+
+def _overlaps(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+    n = min(len(a), len(b))
+    return a[:n] == b[:n]
+
+
+class _Cache:
+    """An LRU cache of the values read from a cog's collection.
+
+    Entries are keyed by their full identifier path, starting with the cog
+    identifier, and a missing value is cached as well so that repeatedly
+    reading unset data (such as a guild's prefix) stays cheap. Any entry
+    overlapping a changed path is dropped, and reads which started before a
+    change are not cached, since they may have fetched the old value.
+    """
+
+    def __init__(self, cog_name: str, max_size: int):
+        self.cog_name = cog_name
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        # Bumped on every invalidation, so that reads racing a change can
+        # tell their result may already be stale.
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._watch_task = None
+
+    def get(self, path: Tuple[str, ...]):
+        """Get the cached value at ``path``, or ``_MISSING`` if it isn't cached.
+
+        Raises
+        ------
+        KeyError
+            If the value is cached as not existing.
+
+        """
+        for i in range(len(path), 0, -1):
+            prefix = path[:i]
+            try:
+                value = self.entries[prefix]
+            except KeyError:
+                continue
+            self.entries.move_to_end(prefix)
+            self.hits += 1
+            for key in path[i:]:
+                if not isinstance(value, dict) or key not in value:
+                    value = _NOT_FOUND
+                    break
+                value = value[key]
+            if value is _NOT_FOUND:
+                raise KeyError(path)
+            return value
+        self.misses += 1
+        return _MISSING
+
+    def put(self, path: Tuple[str, ...], value, generation: int):
+        """Cache ``value``, unless the data changed since ``generation``."""
+        if generation != self.generation:
+            return
+        self.entries[path] = value
+        self.entries.move_to_end(path)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, path: Tuple[str, ...]):
+        self.generation += 1
+        stale = [k for k in self.entries if _overlaps(k, path)]
+        for k in stale:
+            del self.entries[k]
+        self.invalidations += len(stale)
+
+    def clear(self):
+        self.generation += 1
+        self.invalidations += len(self.entries)
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def start_watching(self, collection: motor.core.Collection):
+        if self._watch_task is None:
+            self._watch_task = asyncio.ensure_future(self._watch(collection))
+
+    async def _watch(self, collection: motor.core.Collection):
+        """Drop cached values which are changed by other processes.
+
+        Once the change stream ends, for whatever reason, other processes'
+        changes can no longer be seen, so the cache is disabled.
+        """
+        try:
+            async with collection.watch() as stream:
+                async for change in stream:
+                    self._handle_change(change)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Error watching for changes to cog %s.", self.cog_name)
+        finally:
+            log.warning(
+                "Stopped watching for changes to cog %s, its read cache is now disabled.",
+                self.cog_name,
+            )
+            self.max_size = 0
+            self.clear()
+
+    def _handle_change(self, change: dict):
+        if "documentKey" not in change:
+            # Events such as drop, rename and invalidate affect the whole
+            # collection
+            self.clear()
+            return
+        uuid = change["documentKey"]["_id"]
+        if isinstance(uuid, dict):
+            self.invalidate((uuid["RED_uuid"], *_key_from_id(uuid)))
+            return
+        description = change.get("updateDescription")
+        if change["operationType"] != "update" or description is None:
+            self.invalidate((uuid,))
+            return
+        for field in (*description["updatedFields"], *description["removedFields"]):
+            path = tuple(Mongo._unescape_key(k) for k in field.split("."))
+            self.invalidate((uuid, *path))
+
+
 class Mongo(BaseDriver):
     """
     Subclass of :py:class:`.red_base.BaseDriver`.
+
+    Reads can be served from an in-process LRU cache, which is enabled by
+    adding :code:`"CACHE_SIZE"` (the maximum number of cached values per
+    cog) to the instance's ``STORAGE_DETAILS``. Cached values are dropped
+    whenever they are changed through this driver. When other processes
+    also write to the database, add :code:`"CACHE_WATCH": true` as well to
+    watch a change stream for their changes; this needs MongoDB to be
+    running as a replica set. Hit and miss statistics are available from
+    `cache_stats`.
+
+    With :code:`"LAYOUT": "split"` in ``STORAGE_DETAILS`` (the default for
+    new instances), data is stored as one document per cog identifier,
+    scope and primary key, such as one document per guild or per member,
+    with a compound index over those keys. This keeps documents well below
+    MongoDB's size limit, and reading every member in a guild becomes an
+    indexed query. Otherwise, all of a cog identifier's data is kept in a
+    single document. Existing data can be converted with
+    `migrate_to_split_layout`.
     """
 
     def __init__(self, cog_name, identifier, **kwargs):
@@ -48,6 +382,19 @@ class Mongo(BaseDriver):
         if _conn is None:
             _initialize(**kwargs)
 
+        cache_size = kwargs.get("CACHE_SIZE", 0)
+        if cache_size > 0 and cog_name not in _caches:
+            _caches[cog_name] = _Cache(cog_name, cache_size)
+        self._watch = kwargs.get("CACHE_WATCH", False)
+        self.split = kwargs.get("LAYOUT") == "split"
+
+    @property
+    def cache(self):
+        cache = _caches.get(self.cog_name)
+        if cache is not None and cache.max_size > 0:
+            return cache
+        return None
+
     @property
     def db(self) -> motor.core.Database:
         """
@@ -83,6 +430,77 @@ class Mongo(BaseDriver):
         return uuid, identifiers
 
     async def get(self, *identifiers: str):
+        if self.cache is None:
+            return await self._fetch(identifiers)
+        return copy.deepcopy(await self._get_cached(identifiers))
+
+    async def get_frozen(self, *identifiers: str):
+        # Cached values are never modified in place, so they can be handed out as is
+        return freeze(await self._get_cached(identifiers))
+
+    async def get_many(self, paths, frozen: bool = False):
+        cache = self.cache
+        ret = {}
+        missing = []
+        for identifiers in paths:
+            if cache is None:
+                missing.append(identifiers)
+                continue
+            try:
+                value = cache.get((self.unique_cog_identifier, *identifiers))
+            except KeyError:
+                continue
+            if value is _MISSING:
+                missing.append(identifiers)
+            else:
+                ret[identifiers] = value
+
+        if missing:
+            if cache is not None and self._watch:
+                cache.start_watching(self.get_collection())
+            generation = cache.generation if cache is not None else None
+            fetched = await self._fetch_many(missing)
+            if cache is not None:
+                for identifiers in missing:
+                    path = (self.unique_cog_identifier, *identifiers)
+                    cache.put(path, fetched.get(identifiers, _NOT_FOUND), generation)
+            ret.update(fetched)
+
+        if frozen:
+            return {k: freeze(v) for k, v in ret.items()}
+        if cache is not None:
+            return copy.deepcopy(ret)
+        return ret
+
+    async def _get_cached(self, identifiers: Tuple[str, ...]):
+        cache = self.cache
+        if cache is None:
+            return await self._fetch(identifiers)
+        path = (self.unique_cog_identifier, *identifiers)
+        value = cache.get(path)
+        if value is not _MISSING:
+            return value
+
+        if self._watch:
+            cache.start_watching(self.get_collection())
+        generation = cache.generation
+        try:
+            value = await self._fetch(identifiers)
+        except KeyError:
+            cache.put(path, _NOT_FOUND, generation)
+            raise
+        cache.put(path, value, generation)
+        return value
+
+    def _invalidate(self, *paths: Tuple[str, ...]):
+        cache = self.cache
+        if cache is not None:
+            for identifiers in paths:
+                cache.invalidate((self.unique_cog_identifier, *identifiers))
+
+    async def _fetch(self, identifiers: Tuple[str, ...]):
+        if self.split:
+            return await self._fetch_split(identifiers)
         mongo_collection = self.get_collection()
 
         identifiers = (*map(self._escape_key, identifiers),)
@@ -101,29 +519,299 @@ class Mongo(BaseDriver):
             return self._unescape_dict_keys(partial)
         return partial
 
-    async def set(self, *identifiers: str, value=None):
-        dot_identifiers = ".".join(map(self._escape_key, identifiers))
-        if isinstance(value, dict):
-            value = self._escape_dict_keys(value)
+    async def _fetch_split(self, identifiers: Tuple[str, ...]):
+        mongo_collection = self.get_collection()
+        await _ensure_index(mongo_collection)
+        key, inner, complete = _split_path(identifiers)
+        inner = (*map(self._escape_key, inner),)
+
+        if complete:
+            document = await mongo_collection.find_one(
+                filter={"_id": _document_id(self.unique_cog_identifier, key)},
+                projection={".".join(("data", *inner)): True},
+            )
+            if document is None or "data" not in document:
+                raise KeyError("No matching document was found and Config expects a KeyError.")
+            partial = document["data"]
+            for i in inner:
+                partial = partial[i]
+            if isinstance(partial, dict):
+                return self._unescape_dict_keys(partial)
+            return partial
+
+        ret = {}
+        found = False
+        async for document in mongo_collection.find(
+            _prefix_filter(self.unique_cog_identifier, key)
+        ):
+            found = True
+            partial = ret
+            *parents, last = _key_from_id(document["_id"])[len(key) :]
+            for k in parents:
+                partial = partial.setdefault(k, {})
+            partial[last] = self._unescape_value(document.get("data", {}))
+        if not found:
+            raise KeyError("No matching document was found and Config expects a KeyError.")
+        return ret
+
+    async def _fetch_many(self, paths) -> dict:
+        if self.split:
+            return await self._fetch_many_split(paths)
+        mongo_collection = self.get_collection()
+        escaped = {identifiers: (*map(self._escape_key, identifiers),) for identifiers in paths}
+
+        # Projecting a path and a path nested below it is an error, so
+        # only the outermost paths are projected.
+        projection = {}
+        for keys in sorted(escaped.values()):
+            if not keys:
+                projection = None
+                break
+            if not any(keys[:i] in projection for i in range(1, len(keys))):
+                projection[keys] = True
+        if projection is not None:
+            projection = {".".join(keys): True for keys in projection}
+
+        document = await mongo_collection.find_one(
+            filter={"_id": self.unique_cog_identifier}, projection=projection
+        )
+        if document is None:
+            return {}
+        ret = {}
+        for identifiers, keys in escaped.items():
+            try:
+                ret[identifiers] = self._unescape_value(_find_in(document, keys))
+            except KeyError:
+                pass
+        return ret
 
+    async def _fetch_many_split(self, paths) -> dict:
         mongo_collection = self.get_collection()
+        await _ensure_index(mongo_collection)
+        ret = {}
+        complete = {}
+        for identifiers in paths:
+            key, inner, is_complete = _split_path(identifiers)
+            if is_complete:
+                complete[identifiers] = (key, (*map(self._escape_key, inner),))
+                continue
+            try:
+                ret[identifiers] = await self._fetch_split(identifiers)
+            except KeyError:
+                pass
+        if not complete:
+            return ret
+
+        document_ids = []
+        for key, _ in complete.values():
+            document_id = _document_id(self.unique_cog_identifier, key)
+            if document_id not in document_ids:
+                document_ids.append(document_id)
+        documents = {}
+        async for document in mongo_collection.find({"_id": {"$in": document_ids}}):
+            if "data" in document:
+                documents[_key_from_id(document["_id"])] = document["data"]
+        for identifiers, (key, inner) in complete.items():
+            try:
+                ret[identifiers] = self._unescape_value(_find_in(documents[key], inner))
+            except KeyError:
+                pass
+        return ret
+
+    async def iter_children(self, *identifiers: str, frozen: bool = False):
+        key, inner, complete = _split_path(identifiers)
+        if not self.split or complete:
+            async for item in super().iter_children(*identifiers, frozen=frozen):
+                yield item
+            return
 
-        await mongo_collection.update_one(
-            {"_id": self.unique_cog_identifier},
-            update={"$set": {dot_identifiers: value}},
-            upsert=True,
+        # Each child is spread over one or more documents, which the index
+        # returns next to each other.
+        mongo_collection = self.get_collection()
+        await _ensure_index(mongo_collection)
+        depth = len(key)
+        cursor = mongo_collection.find(_prefix_filter(self.unique_cog_identifier, key)).sort(
+            [("_id." + name, 1) for name in _ID_FIELDS[depth:]]
         )
+        child, value = None, _MISSING
+        async for document in cursor:
+            next_child, *rest = _key_from_id(document["_id"])[depth:]
+            if next_child != child:
+                if value is not _MISSING:
+                    yield child, freeze(value) if frozen else value
+                child, value = next_child, {}
+            data = self._unescape_value(document.get("data", {}))
+            if not rest:
+                value = data
+                continue
+            partial = value
+            for k in rest[:-1]:
+                partial = partial.setdefault(k, {})
+            partial[rest[-1]] = data
+        if value is not _MISSING:
+            yield child, freeze(value) if frozen else value
+
+    async def set(self, *identifiers: str, value=None):
+        await self.apply_changes({identifiers: value}, ())
 
     async def clear(self, *identifiers: str):
-        dot_identifiers = ".".join(map(self._escape_key, identifiers))
+        await self.apply_changes({}, (identifiers,))
+
+    async def apply_changes(self, sets: dict, clears):
+        clears = list(clears)
+        try:
+            with stats.timed(self.cog_name, next(iter((*sets, *clears)), ()), "save"):
+                if self.split:
+                    await self._apply_split_changes(sets, clears)
+                else:
+                    await self._apply_document_changes(sets, clears)
+        finally:
+            # Cached values are only dropped once the change is visible, so
+            # that reads can't cache the old value in the meantime.
+            self._invalidate(*sets, *clears)
+
+    async def _apply_split_changes(self, sets: dict, clears: list):
         mongo_collection = self.get_collection()
-
-        if len(identifiers) > 0:
-            await mongo_collection.update_one(
-                {"_id": self.unique_cog_identifier}, update={"$unset": {dot_identifiers: 1}}
+        await _ensure_index(mongo_collection)
+        uuid = self.unique_cog_identifier
+
+        requests = []
+        updates = {}
+        for identifiers, value in sets.items():
+            key, inner, complete = _split_path(identifiers)
+            if complete:
+                field = ".".join(("data", *map(self._escape_key, inner)))
+                value = self._escape_value(value)
+                updates.setdefault(key, {}).setdefault("$set", {})[field] = value
+                continue
+            requests.append(DeleteMany(_prefix_filter(uuid, key)))
+            for doc_key, doc_value in _split_value(key, value):
+                document_id = _document_id(uuid, doc_key)
+                requests.append(
+                    ReplaceOne(
+                        {"_id": document_id},
+                        {"_id": document_id, "data": self._escape_value(doc_value)},
+                        upsert=True,
+                    )
+                )
+        for identifiers in clears:
+            key, inner, complete = _split_path(identifiers)
+            if not complete:
+                requests.append(DeleteMany(_prefix_filter(uuid, key)))
+            elif not inner:
+                requests.append(DeleteOne({"_id": _document_id(uuid, key)}))
+            else:
+                field = ".".join(("data", *map(self._escape_key, inner)))
+                updates.setdefault(key, {}).setdefault("$unset", {})[field] = 1
+        for key, update in updates.items():
+            requests.append(
+                UpdateOne({"_id": _document_id(uuid, key)}, update, upsert="$set" in update)
             )
+
+        if requests:
+            await mongo_collection.bulk_write(requests)
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
+        mongo_collection = self.get_collection()
+        if self.split:
+            await _ensure_index(mongo_collection)
+            key, inner, complete = _split_path(identifiers)
+            if not (complete and inner):
+                raise ValueError("Only values within a single document can be incremented")
+            document_id = _document_id(self.unique_cog_identifier, key)
+            keys = ("data", *map(self._escape_key, inner))
         else:
+            if not identifiers:
+                raise ValueError("The whole document can't be incremented")
+            document_id = self.unique_cog_identifier
+            keys = (*map(self._escape_key, identifiers),)
+        try:
+            with stats.timed(self.cog_name, identifiers, "save"):
+                return await self._inc(
+                    mongo_collection, document_id, keys, amount, default, minimum, maximum
+                )
+        finally:
+            self._invalidate(identifiers)
+
+    @staticmethod
+    async def _inc(mongo_collection, document_id, keys, amount, default, minimum, maximum):
+        field = ".".join(keys)
+        # Matches the values which stay within bounds once incremented
+        condition = {"$type": "number"}
+        if minimum is not None:
+            condition["$gte"] = minimum - amount
+        if maximum is not None:
+            condition["$lte"] = maximum - amount
+        while True:
+            document = await mongo_collection.find_one_and_update(
+                {"_id": document_id, field: condition},
+                {"$inc": {field: amount}},
+                projection={field: True},
+                return_document=ReturnDocument.AFTER,
+            )
+            if document is not None:
+                return _find_in(document, keys)
+
+            # The value is missing or would go out of bounds, so the new
+            # value is worked out here, and only saved if nothing else has
+            # changed the value in the meantime.
+            document = await mongo_collection.find_one(
+                {"_id": document_id}, projection={field: True}
+            )
+            try:
+                current = _find_in(document or {}, keys)
+            except KeyError:
+                current = _MISSING
+            if current is _MISSING:
+                value = bounded(default + amount, minimum, maximum)
+                expected = {"$exists": False}
+            else:
+                value = bounded(current + amount, minimum, maximum)
+                expected = current
+            try:
+                result = await mongo_collection.update_one(
+                    {"_id": document_id, field: expected},
+                    {"$set": {field: value}},
+                    upsert=current is _MISSING,
+                )
+            except pymongo.errors.DuplicateKeyError:
+                # The document was created by someone else
+                continue
+            if result.matched_count or result.upserted_id is not None:
+                return value
+
+    async def _apply_document_changes(self, sets: dict, clears: list):
+        mongo_collection = self.get_collection()
+
+        # Changes never overlap, so a change to the whole document is the only one
+        if () in sets:
+            document = sets[()]
+            document = self._escape_dict_keys(document) if isinstance(document, dict) else {}
+            document["_id"] = self.unique_cog_identifier
+            await mongo_collection.replace_one(
+                {"_id": self.unique_cog_identifier}, document, upsert=True
+            )
+            return
+        if () in clears:
             await mongo_collection.delete_one({"_id": self.unique_cog_identifier})
+            return
+
+        update = {}
+        if sets:
+            update["$set"] = {
+                ".".join(map(self._escape_key, identifiers)): (
+                    self._escape_dict_keys(value) if isinstance(value, dict) else value
+                )
+                for identifiers, value in sets.items()
+            }
+        if clears:
+            update["$unset"] = {
+                ".".join(map(self._escape_key, identifiers)): 1 for identifiers in clears
+            }
+        if update:
+            await mongo_collection.update_one(
+                {"_id": self.unique_cog_identifier}, update=update, upsert=bool(sets)
+            )
 
     @staticmethod
     def _escape_key(key: str) -> str:
@@ -144,6 +832,14 @@ class Mongo(BaseDriver):
             ret[key] = value
         return ret
 
+    @classmethod
+    def _escape_value(cls, value):
+        return cls._escape_dict_keys(value) if isinstance(value, dict) else value
+
+    @classmethod
+    def _unescape_value(cls, value):
+        return cls._unescape_dict_keys(value) if isinstance(value, dict) else value
+
     @classmethod
     def _unescape_dict_keys(cls, data: dict) -> dict:
         """Recursively unescape all keys in a dict."""
@@ -215,5 +911,6 @@ def get_config_details():
         "PASSWORD": admin_password,
         "DB_NAME": db_name,
         "URI": uri,
+        "LAYOUT": "split",
     }
     return ret
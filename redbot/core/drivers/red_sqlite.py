@@ -0,0 +1,328 @@
+import asyncio
+import functools
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from . import stats
+from .red_base import BaseDriver, bounded, freeze
+
+__all__ = ["SQLite"]
+
+
+# Every database is only ever touched from this thread, so connections can be
+# kept open and reused without any extra locking.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="red_sqlite")
+_connections = {}
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS red_config ("
+    "identifier TEXT NOT NULL, "
+    "path TEXT NOT NULL, "
+    "value TEXT NOT NULL, "
+    "PRIMARY KEY (identifier, path)"
+    ") WITHOUT ROWID"
+)
+
+
+def _get_connection(db_path: Path) -> sqlite3.Connection:
+    try:
+        return _connections[db_path]
+    except KeyError:
+        pass
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    with conn:
+        conn.execute(_CREATE_TABLE)
+    _connections[db_path] = conn
+    return conn
+
+
+def _encode_path(identifiers: Tuple[str, ...]) -> str:
+    # ensure_ascii keeps every character below \x7f, which _child_range relies on
+    return json.dumps(list(identifiers))
+
+
+def _child_range(identifiers: Tuple[str, ...]) -> Tuple[str, str]:
+    """Get the bounds of the encoded paths which are nested below ``identifiers``."""
+    if identifiers:
+        lower = _encode_path(identifiers)[:-1] + ","
+    else:
+        lower = '["'
+    return lower, lower + "\x7f"
+
+
+def _flatten(identifiers: Tuple[str, ...], value) -> List[Tuple[str, str]]:
+    """Split a value into rows, one for every non-dict (or empty dict) value."""
+    if isinstance(value, dict) and value:
+        ret = []
+        for k, v in value.items():
+            ret.extend(_flatten((*identifiers, k), v))
+        return ret
+    return [(_encode_path(identifiers), json.dumps(value))]
+
+
+def _rebuild(identifiers: Tuple[str, ...], rows) -> Dict[str, Any]:
+    """Rebuild the nested dict for the rows below ``identifiers``."""
+    ret = {}
+    depth = len(identifiers)
+    for path, value in rows:
+        keys = json.loads(path)[depth:]
+        partial = ret
+        for k in keys[:-1]:
+            partial = partial.setdefault(k, {})
+        partial[keys[-1]] = json.loads(value)
+    return ret
+
+
+def _value_from_rows(identifiers: Tuple[str, ...], rows):
+    encoded = _encode_path(identifiers)
+    for path, value in rows:
+        if path == encoded:
+            return json.loads(value)
+    return _rebuild(identifiers, rows)
+
+
+def read_database(db_path: Path) -> Dict[str, dict]:
+    """Read all of the data stored in an SQLite driver's database.
+
+    Parameters
+    ----------
+    db_path : pathlib.Path
+        The path to the database file (usually ``settings.db``).
+
+    Returns
+    -------
+    dict
+        A dict mapping each cog identifier in the database to its data.
+
+    """
+    conn = sqlite3.connect(str(db_path))
+    try:
+        cursor = conn.execute("SELECT identifier, path, value FROM red_config ORDER BY identifier")
+        ret = {}
+        for identifier, path, value in cursor:
+            ret.setdefault(identifier, []).append((path, value))
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
+    return {k: _rebuild((), rows) for k, rows in ret.items()}
+
+
+class SQLite(BaseDriver):
+    """
+    Subclass of :py:class:`.red_base.BaseDriver`.
+
+    Each leaf value is stored as its own row, indexed by its identifier path,
+    so reading or writing a value only touches the rows below its path. The
+    database uses write-ahead logging, and all queries run on a single
+    dedicated thread.
+
+    .. py:attribute:: file_name
+
+        The name of the database file.
+
+    .. py:attribute:: data_path
+
+        The path to the database file indicated by :py:attr:`file_name`.
+    """
+
+    # The number of rows fetched at a time when iterating over a dict
+    PAGE_SIZE = 1000
+
+    def __init__(
+        self,
+        cog_name,
+        identifier,
+        *,
+        data_path_override: Path = None,
+        file_name_override: str = "settings.db",
+        **kwargs
+    ):
+        super().__init__(cog_name, identifier)
+        self.file_name = file_name_override
+        if data_path_override:
+            self.data_path = data_path_override
+        else:
+            self.data_path = Path.cwd() / "cogs" / ".data" / self.cog_name
+
+        self.data_path.mkdir(parents=True, exist_ok=True)
+
+        self.data_path = self.data_path / self.file_name
+
+    async def _execute(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(_executor, functools.partial(func, *args))
+
+    def _select(self, conn: sqlite3.Connection, identifiers: Tuple[str, ...]):
+        lower, upper = _child_range(identifiers)
+        return conn.execute(
+            "SELECT path, value FROM red_config WHERE identifier = ? "
+            "AND (path = ? OR (path > ? AND path < ?))",
+            (self.unique_cog_identifier, _encode_path(identifiers), lower, upper),
+        ).fetchall()
+
+    def _delete(self, conn: sqlite3.Connection, identifiers: Tuple[str, ...]) -> int:
+        lower, upper = _child_range(identifiers)
+        cursor = conn.execute(
+            "DELETE FROM red_config WHERE identifier = ? "
+            "AND (path = ? OR (path > ? AND path < ?))",
+            (self.unique_cog_identifier, _encode_path(identifiers), lower, upper),
+        )
+        return cursor.rowcount
+
+    def _exists(self, conn: sqlite3.Connection, identifiers: Tuple[str, ...]) -> bool:
+        lower, upper = _child_range(identifiers)
+        cursor = conn.execute(
+            "SELECT 1 FROM red_config WHERE identifier = ? "
+            "AND (path = ? OR (path > ? AND path < ?)) LIMIT 1",
+            (self.unique_cog_identifier, _encode_path(identifiers), lower, upper),
+        )
+        return cursor.fetchone() is not None
+
+    def _get(self, identifiers: Tuple[str, ...]):
+        conn = _get_connection(self.data_path)
+        rows = self._select(conn, identifiers)
+        if not rows:
+            raise KeyError(identifiers)
+        return _value_from_rows(identifiers, rows)
+
+    def _get_many(self, paths: List[Tuple[str, ...]]):
+        conn = _get_connection(self.data_path)
+        ret = {}
+        for identifiers in paths:
+            rows = self._select(conn, identifiers)
+            if rows:
+                ret[identifiers] = _value_from_rows(identifiers, rows)
+        return ret
+
+    def _select_page(self, identifiers: Tuple[str, ...], after: str):
+        _, upper = _child_range(identifiers)
+        conn = _get_connection(self.data_path)
+        return conn.execute(
+            "SELECT path, value FROM red_config WHERE identifier = ? "
+            "AND path > ? AND path < ? ORDER BY path LIMIT ?",
+            (self.unique_cog_identifier, after, upper, self.PAGE_SIZE),
+        ).fetchall()
+
+    def _set_rows(self, conn: sqlite3.Connection, identifiers: Tuple[str, ...], value) -> int:
+        self._delete(conn, identifiers)
+        # Any value stored above this one must have been an empty dict or
+        # a value which is about to be replaced by a dict.
+        conn.executemany(
+            "DELETE FROM red_config WHERE identifier = ? AND path = ?",
+            (
+                (self.unique_cog_identifier, _encode_path(identifiers[:i]))
+                for i in range(len(identifiers))
+            ),
+        )
+        rows = _flatten(identifiers, value)
+        conn.executemany(
+            "INSERT INTO red_config (identifier, path, value) VALUES (?, ?, ?)",
+            ((self.unique_cog_identifier, path, encoded) for path, encoded in rows),
+        )
+        return sum(len(path) + len(encoded) for path, encoded in rows)
+
+    def _clear_rows(self, conn: sqlite3.Connection, identifiers: Tuple[str, ...]):
+        deleted = self._delete(conn, identifiers)
+        parent = identifiers[:-1]
+        if deleted and len(parent) > 0 and not self._exists(conn, parent):
+            # Keep the now empty dict which held this value, like a
+            # dict's ``del`` would.
+            conn.execute(
+                "INSERT INTO red_config (identifier, path, value) VALUES (?, ?, ?)",
+                (self.unique_cog_identifier, _encode_path(parent), "{}"),
+            )
+
+    def _apply(self, sets: dict, clears) -> int:
+        conn = _get_connection(self.data_path)
+        size = 0
+        with conn:
+            for identifiers, value in sets.items():
+                size += self._set_rows(conn, identifiers, value)
+            for identifiers in clears:
+                self._clear_rows(conn, identifiers)
+        return size
+
+    def _inc(self, identifiers: Tuple[str, ...], amount, default, minimum, maximum):
+        conn = _get_connection(self.data_path)
+        row = conn.execute(
+            "SELECT value FROM red_config WHERE identifier = ? AND path = ?",
+            (self.unique_cog_identifier, _encode_path(identifiers)),
+        ).fetchone()
+        value = default if row is None else json.loads(row[0])
+        value = bounded(value + amount, minimum, maximum)
+        with conn:
+            size = self._set_rows(conn, identifiers, value)
+        return value, size
+
+    async def get(self, *identifiers: str):
+        return await self._execute(self._get, identifiers)
+
+    async def inc(self, *identifiers: str, amount, default=0, minimum=None, maximum=None):
+        # Every query runs on the same thread, so nothing can change the
+        # value between reading and writing it.
+        scope_stats = stats.get_stats(self.cog_name, stats.scope_of(identifiers))
+        start = time.perf_counter()
+        value, size = await self._execute(
+            self._inc, identifiers, amount, default, minimum, maximum
+        )
+        scope_stats.save.add(time.perf_counter() - start)
+        scope_stats.bytes_serialized += size
+        return value
+
+    async def get_many(self, paths, frozen: bool = False):
+        ret = await self._execute(self._get_many, list(paths))
+        if frozen:
+            return {k: freeze(v) for k, v in ret.items()}
+        return ret
+
+    async def iter_children(self, *identifiers: str, frozen: bool = False):
+        # Rows are read a page at a time, picking up after the last row of the
+        # previous page. Each child's rows are contiguous, since they share
+        # the child's path as a prefix.
+        depth = len(identifiers)
+        after, _ = _child_range(identifiers)
+        child, rows = None, []
+        while True:
+            page = await self._execute(self._select_page, identifiers, after)
+            for path, value in page:
+                key = json.loads(path)[depth]
+                if key != child:
+                    if rows:
+                        yield self._child_item(identifiers, child, rows, frozen)
+                    child, rows = key, []
+                rows.append((path, value))
+            if len(page) < self.PAGE_SIZE:
+                break
+            after = page[-1][0]
+        if rows:
+            yield self._child_item(identifiers, child, rows, frozen)
+
+    @staticmethod
+    def _child_item(identifiers: Tuple[str, ...], child: str, rows, frozen: bool):
+        value = _value_from_rows((*identifiers, child), rows)
+        return child, freeze(value) if frozen else value
+
+    async def set(self, *identifiers: str, value=None):
+        await self.apply_changes({identifiers: value}, ())
+
+    async def clear(self, *identifiers: str):
+        await self.apply_changes({}, (identifiers,))
+
+    async def apply_changes(self, sets: dict, clears):
+        clears = list(clears)
+        scope_stats = stats.get_stats(
+            self.cog_name, stats.scope_of(next(iter((*sets, *clears)), ()))
+        )
+        start = time.perf_counter()
+        size = await self._execute(self._apply, sets, clears)
+        scope_stats.save.add(time.perf_counter() - start)
+        scope_stats.bytes_serialized += size
+
+    def get_config_details(self):
+        return
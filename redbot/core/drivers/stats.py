@@ -0,0 +1,155 @@
+"""Counters and latency histograms for storage operations.
+
+Statistics are kept per cog and per scope. `Config` records the latency of
+every get, set and clear it makes, while the drivers record the work done to
+persist those changes: the number of bytes serialized, the time spent saving
+in an executor and the time spent waiting for a file's lock. Saves are
+attributed to the scope of the change which caused them. The time taken to
+load a cog's data is attributed to every scope (`ALL_SCOPES`).
+"""
+import contextlib
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+__all__ = ["Histogram", "StorageStats", "get_stats", "scope_of", "timed", "snapshot", "reset"]
+
+# Used for operations which are not limited to a single scope
+ALL_SCOPES = "*"
+
+
+class Histogram:
+    """A latency histogram with power-of-two buckets.
+
+    Bucket ``i`` counts the samples which took less than ``2 ** i``
+    microseconds (and at least ``2 ** (i - 1)``). The last bucket also holds
+    every sample longer than that.
+    """
+
+    BUCKETS = 24
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * self.BUCKETS
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        index = int(seconds * 1000000).bit_length()
+        self.buckets[min(index, self.BUCKETS - 1)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """Get an upper bound for the given percentile, in seconds."""
+        if not self.count:
+            return 0.0
+        rank = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.buckets[:-1]):
+            seen += count
+            if seen >= rank:
+                return min((1 << index) / 1000000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": list(self.buckets),
+        }
+
+
+class StorageStats:
+    """The statistics for a single cog's scope."""
+
+    __slots__ = ("get", "set", "clear", "save", "lock_wait", "load", "bytes_serialized")
+
+    def __init__(self):
+        self.get = Histogram()
+        self.set = Histogram()
+        self.clear = Histogram()
+        self.save = Histogram()
+        self.lock_wait = Histogram()
+        self.load = Histogram()
+        self.bytes_serialized = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "get": self.get.to_dict(),
+            "set": self.set.to_dict(),
+            "clear": self.clear.to_dict(),
+            "save": self.save.to_dict(),
+            "lock_wait": self.lock_wait.to_dict(),
+            "load": self.load.to_dict(),
+            "bytes_serialized": self.bytes_serialized,
+        }
+
+
+_stats: Dict[Tuple[str, str], StorageStats] = {}
+
+
+def get_stats(cog_name: str, scope: str) -> StorageStats:
+    """Get the statistics for a cog's scope, creating them if needed."""
+    try:
+        return _stats[(cog_name, scope)]
+    except KeyError:
+        ret = _stats[(cog_name, scope)] = StorageStats()
+        return ret
+
+
+def scope_of(identifiers: Iterable[str]) -> str:
+    """Get the scope which a path of identifiers lies in.
+
+    The identifiers must not include the cog's unique identifier.
+    """
+    for scope in identifiers:
+        return scope
+    return ALL_SCOPES
+
+
+@contextlib.contextmanager
+def timed(cog_name: str, identifiers: Tuple[str, ...], operation: str):
+    """Record the time taken by the wrapped block as an operation on ``identifiers``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        getattr(get_stats(cog_name, scope_of(identifiers)), operation).add(elapsed)
+
+
+def snapshot(cog_name: Optional[str] = None) -> Dict[str, Dict[str, dict]]:
+    """Get the current statistics as plain data.
+
+    Parameters
+    ----------
+    cog_name : Optional[str]
+        Only include statistics for this cog.
+
+    Returns
+    -------
+    Dict[str, Dict[str, dict]]
+        The statistics for every scope, keyed by cog name and then scope.
+
+    """
+    ret = {}
+    for (name, scope), stats in _stats.items():
+        if cog_name is None or name == cog_name:
+            ret.setdefault(name, {})[scope] = stats.to_dict()
+    return ret
+
+
+def reset(cog_name: Optional[str] = None):
+    """Discard the statistics for one cog, or for every cog."""
+    if cog_name is None:
+        _stats.clear()
+        return
+    for key in [k for k in _stats if k[0] == cog_name]:
+        del _stats[key]
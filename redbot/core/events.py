@@ -126,7 +126,7 @@ def init_events(bot, cli_flags):
                 )
         INFO2 = []
 
-        mongo_enabled = storage_type() != "JSON"
+        mongo_enabled = storage_type() == "MongoDB"
         reqs_installed = {"docs": None, "test": None}
         for key in reqs_installed.keys():
             reqs = [x.name for x in red_pkg._dep_map[key]]
@@ -3,12 +3,14 @@ import json
 import os
 import asyncio
 import logging
+import time
 from copy import deepcopy
 from uuid import uuid4
 
 # This is basically our old DataIO and just a base for much more elaborate classes
 # This still isn't completely threadsafe, (do not use config in threads)
 from pathlib import Path
+from typing import Optional
 
 log = logging.getLogger("red")
 
@@ -16,18 +18,153 @@ PRETTY = {"indent": 4, "sort_keys": False, "separators": (",", " : ")}
 MINIFIED = {"sort_keys": False, "separators": (",", ":")}
 
 
+class Serializer:
+    """Converts data to and from JSON text using the standard library.
+
+    Subclasses use faster third-party libraries. They fall back to the
+    standard library for data which their library can't handle, such as
+    integers wider than 64 bits.
+    """
+
+    name = "json"
+
+    def dumps(self, data, settings=PRETTY) -> str:
+        return json.dumps(data, **settings)
+
+    def loads(self, text: str):
+        return json.loads(text)
+
+
+class _OrjsonSerializer(Serializer):
+    """Uses orjson. Pretty files are indented by 2 spaces rather than 4."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data, settings=PRETTY) -> str:
+        option = self._orjson.OPT_INDENT_2 if settings.get("indent") else 0
+        if settings.get("sort_keys"):
+            option |= self._orjson.OPT_SORT_KEYS
+        try:
+            return self._orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            return super().dumps(data, settings)
+
+    def loads(self, text: str):
+        try:
+            return self._orjson.loads(text)
+        except ValueError:
+            return super().loads(text)
+
+
+class _UjsonSerializer(Serializer):
+    """Uses ujson."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, data, settings=PRETTY) -> str:
+        try:
+            return self._ujson.dumps(
+                data,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                indent=settings.get("indent", 0),
+                sort_keys=settings.get("sort_keys", False),
+            )
+        except (OverflowError, TypeError):
+            return super().dumps(data, settings)
+
+    def loads(self, text: str):
+        try:
+            return self._ujson.loads(text)
+        except ValueError:
+            return super().loads(text)
+
+
+# In order of preference
+_SERIALIZERS = (_OrjsonSerializer, _UjsonSerializer, Serializer)
+
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+    """Get a JSON serializer.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        The name of the library to use: ``"orjson"``, ``"ujson"`` or
+        ``"json"``. Omit to use the fastest one which is installed.
+
+    Raises
+    ------
+    ImportError
+        If the requested library is not installed.
+    ValueError
+        If there is no serializer with the given name.
+
+    """
+    for cls in _SERIALIZERS:
+        if name is not None and cls.name != name:
+            continue
+        try:
+            return cls()
+        except ImportError:
+            if name is not None:
+                raise
+    raise ValueError("Unknown serializer: '{}'".format(name))
+
+
+# Chosen once at startup and used for every file
+serializer = get_serializer()
+
+
+def set_serializer(name: Optional[str] = None):
+    """Change the serializer used by every `JsonIO` (see `get_serializer`)."""
+    global serializer
+    serializer = get_serializer(name)
+
+
+def dumps(data, settings=PRETTY) -> str:
+    """Serialize ``data`` with the current serializer."""
+    return serializer.dumps(data, settings)
+
+
+def loads(text: str):
+    """Deserialize ``text`` with the current serializer."""
+    return serializer.loads(text)
+
+
+def detect_settings(text: str) -> dict:
+    """Detect whether JSON text was saved with `PRETTY` or `MINIFIED` settings."""
+    # Pretty files always start a non-empty object or list with a newline,
+    # and minified files never contain one outside of strings.
+    return PRETTY if text[1:2] == "\n" else MINIFIED
+
+
 class JsonIO:
     """Basic functions for atomic saving / loading of json files"""
 
-    def __init__(self, path: Path = Path.cwd()):
+    def __init__(self, path: Path = Path.cwd(), settings: dict = PRETTY):
         """
         :param path: Full path to file.
+        :param settings: The settings to save the file with, `PRETTY` or `MINIFIED`.
         """
         self._lock = asyncio.Lock()
         self.path = path
+        self.settings = settings
+        # The settings which the file was in when it was last loaded
+        self.loaded_settings = None
 
     # noinspection PyUnresolvedReferences
-    def _save_json(self, data, settings=PRETTY):
+    def _save_json(self, data, settings=None):
         """
         This fsync stuff here is entirely neccessary. 
         
@@ -48,11 +185,13 @@ class JsonIO:
             https://www.mjmwired.net/kernel/Documentation/filesystems/ext4.txt#310
         """
         log.debug("Saving file {}".format(self.path))
+        text = serializer.dumps(data, settings or self.settings)
         filename = self.path.stem
         tmp_file = "{}-{}.tmp".format(filename, uuid4().fields[0])
         tmp_path = self.path.parent / tmp_file
         with tmp_path.open(encoding="utf-8", mode="w") as f:
-            json.dump(data, f, **settings)
+            f.write(text)
+            size = f.tell()
             f.flush()  # This does get closed on context exit, ...
             os.fsync(f.fileno())  #  but that needs to happen prior to this line
 
@@ -67,23 +206,35 @@ class JsonIO:
         finally:
             if fd is not None:
                 os.close(fd)
+        return size
 
-    async def _threadsafe_save_json(self, data, settings=PRETTY):
+    async def _threadsafe_save_json(self, data, settings=None, *, snapshot=False, stats=None):
         loop = asyncio.get_event_loop()
         # the deepcopy is needed here. otherwise,
         # the dict can change during serialization
         # and this will break the encoder.
-        data_copy = deepcopy(data)
+        # Callers which never mutate their data in place can pass snapshot=True.
+        data_copy = data if snapshot else deepcopy(data)
         func = functools.partial(self._save_json, data_copy, settings)
+        if stats is None:
+            async with self._lock:
+                await loop.run_in_executor(None, func)
+            return
+        start = time.perf_counter()
         async with self._lock:
-            await loop.run_in_executor(None, func)
+            acquired = time.perf_counter()
+            size = await loop.run_in_executor(None, func)
+        stats.lock_wait.add(acquired - start)
+        stats.save.add(time.perf_counter() - acquired)
+        stats.bytes_serialized += size
 
     # noinspection PyUnresolvedReferences
     def _load_json(self):
         log.debug("Reading file {}".format(self.path))
         with self.path.open(encoding="utf-8", mode="r") as f:
-            data = json.load(f)
-        return data
+            text = f.read()
+        self.loaded_settings = detect_settings(text)
+        return serializer.loads(text)
 
     async def _threadsafe_load_json(self, path):
         loop = asyncio.get_event_loop()
@@ -7,7 +7,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from redbot.core import Config
 from redbot.core.bot import Red
 
-from redbot.core.drivers import red_json
+from redbot.core.drivers import red_json, red_memory
 
 __all__ = [
     "monkeysession",
@@ -16,6 +16,8 @@ __all__ = [
     "json_driver",
     "config",
     "config_fr",
+    "memory_driver_factory",
+    "memory_config_factory",
     "red",
     "guild_factory",
     "empty_guild",
@@ -87,6 +89,37 @@ def config_fr(json_driver):
     conf._defaults = {}
 
 
+@pytest.fixture()
+def memory_driver_factory():
+    """
+    Creates in-memory drivers, which take the same keyword arguments as
+    `redbot.core.drivers.red_memory.Memory` (such as ``latency``).
+    """
+    import uuid
+
+    def factory(**kwargs):
+        return red_memory.Memory("PyTest", identifier=str(uuid.uuid4()), **kwargs)
+
+    yield factory
+    red_memory.clear_stores("PyTest")
+
+
+@pytest.fixture()
+def memory_config_factory(memory_driver_factory):
+    """
+    Creates config objects backed by in-memory drivers, to see how code
+    behaves with slow or unreliable storage.
+    """
+
+    def factory(**kwargs):
+        driver = memory_driver_factory(**kwargs)
+        return Config(
+            cog_name="PyTest", unique_identifier=driver.unique_cog_identifier, driver=driver
+        )
+
+    return factory
+
+
 # region Dpy Mocks
 @pytest.fixture()
 def guild_factory():
@@ -19,7 +19,7 @@ from redbot.core.data_manager import (
 )
 from redbot.core.json_io import JsonIO
 from redbot.core.utils import safe_delete
-from redbot.core.drivers.red_json import JSON
+from redbot.core.drivers.red_json import JSON, read_data_file
 
 config_dir = None
 appdir = appdirs.AppDirs("Red-DiscordBot")
@@ -108,13 +108,14 @@ def get_data_dir():
 
 
 def get_storage_type():
-    storage_dict = {1: "JSON", 2: "MongoDB"}
+    storage_dict = {1: "JSON", 2: "MongoDB", 3: "SQLite"}
     storage = None
     while storage is None:
         print()
         print("Please choose your storage backend (if you're unsure, choose 1).")
         print("1. JSON (file storage, requires no database).")
         print("2. MongoDB (not recommended, currently unstable)")
+        print("3. SQLite (file storage, requires no database server)")
         storage = input("> ")
         try:
             storage = int(storage)
@@ -153,7 +154,7 @@ def basic_setup():
 
     storage = get_storage_type()
 
-    storage_dict = {1: "JSON", 2: "MongoDB"}
+    storage_dict = {1: "JSON", 2: "MongoDB", 3: "SQLite"}
     default_dirs["STORAGE_TYPE"] = storage_dict.get(storage, 1)
 
     if storage_dict.get(storage, 1) == "MongoDB":
@@ -178,23 +179,21 @@ async def json_to_mongo(current_data_dir: Path, storage_details: dict):
 
     core_data_file = current_data_dir / "core" / "settings.json"
     driver = Mongo(cog_name="Core", identifier="0", **storage_details)
-    with core_data_file.open(mode="r") as f:
-        core_data = json.loads(f.read())
+    core_data = read_data_file(core_data_file)
     data = core_data.get("0", {})
     for key, value in data.items():
         await driver.set(key, value=value)
     for p in current_data_dir.glob("cogs/**/settings.json"):
         cog_name = p.parent.stem
-        with p.open(mode="r") as f:
-            cog_data = json.load(f)
+        cog_data = read_data_file(p)
         for identifier, data in cog_data.items():
             driver = Mongo(cog_name, identifier, **storage_details)
             for key, value in data.items():
                 await driver.set(key, value=value)
 
 
-async def mongo_to_json(current_data_dir: Path, storage_details: dict):
-    from redbot.core.drivers.red_mongo import Mongo
+async def mongo_to_json(current_data_dir: Path, storage_details: dict, driver_cls=JSON):
+    from redbot.core.drivers.red_mongo import Mongo, read_collection
 
     m = Mongo("Core", "0", **storage_details)
     db = m.db
@@ -207,16 +206,84 @@ async def mongo_to_json(current_data_dir: Path, storage_details: dict):
         c_data_path.mkdir(parents=True, exist_ok=True)
         # Every cog name has its own collection
         collection = db[collection_name]
-        async for document in collection.find():
-            # Every cog has its own document.
-            # This means if two cogs have the same name but different identifiers, they will
-            # be two separate documents in the same collection
-            cog_id = document.pop("_id")
-            driver = JSON(collection_name, cog_id, data_path_override=c_data_path)
-            for key, value in document.items():
+        # This means if two cogs have the same name but different identifiers, their data
+        # will be kept separately in the same collection
+        for cog_id, data in (await read_collection(collection)).items():
+            driver = driver_cls(collection_name, cog_id, data_path_override=c_data_path)
+            for key, value in data.items():
+                await driver.set(key, value=value)
+
+
+async def mongo_to_split_layout(storage_details: dict):
+    from redbot.core.drivers.red_mongo import Mongo, migrate_to_split_layout
+
+    m = Mongo("Core", "0", **storage_details)
+    await migrate_to_split_layout(m.db)
+
+
+async def mongo_to_sqlite(current_data_dir: Path, storage_details: dict):
+    from redbot.core.drivers.red_sqlite import SQLite
+
+    await mongo_to_json(current_data_dir, storage_details, driver_cls=SQLite)
+
+
+def _sqlite_databases(current_data_dir: Path):
+    from redbot.core.drivers.red_sqlite import read_database
+
+    core_db = current_data_dir / "core" / "settings.db"
+    if core_db.exists():
+        yield "Core", core_db.parent, read_database(core_db)
+    for p in current_data_dir.glob("cogs/**/settings.db"):
+        yield p.parent.stem, p.parent, read_database(p)
+
+
+def _json_data_files(current_data_dir: Path):
+    core_data_file = current_data_dir / "core" / "settings.json"
+    if core_data_file.exists():
+        yield "Core", core_data_file.parent, read_data_file(core_data_file)
+    for p in current_data_dir.glob("cogs/**/settings.json"):
+        yield p.parent.stem, p.parent, read_data_file(p)
+
+
+async def _copy_cog_data(cog_data_sources, make_driver):
+    # Every scope is copied, including the hidden __EXPIRY__ scope, so values
+    # set to expire still do after being converted
+    for cog_name, data_path, cog_data in cog_data_sources:
+        for identifier, data in cog_data.items():
+            driver = make_driver(cog_name, identifier, data_path)
+            for key, value in data.items():
                 await driver.set(key, value=value)
 
 
+async def sqlite_to_mongo(current_data_dir: Path, storage_details: dict):
+    from redbot.core.drivers.red_mongo import Mongo
+
+    await _copy_cog_data(
+        _sqlite_databases(current_data_dir),
+        lambda cog_name, identifier, _: Mongo(cog_name, identifier, **storage_details),
+    )
+
+
+async def json_to_sqlite(current_data_dir: Path):
+    from redbot.core.drivers.red_sqlite import SQLite
+
+    await _copy_cog_data(
+        _json_data_files(current_data_dir),
+        lambda cog_name, identifier, data_path: SQLite(
+            cog_name, identifier, data_path_override=data_path
+        ),
+    )
+
+
+async def sqlite_to_json(current_data_dir: Path):
+    await _copy_cog_data(
+        _sqlite_databases(current_data_dir),
+        lambda cog_name, identifier, data_path: JSON(
+            cog_name, identifier, data_path_override=data_path
+        ),
+    )
+
+
 async def edit_instance():
     instance_list = load_existing_config()
     if not instance_list:
@@ -260,7 +327,7 @@ async def edit_instance():
     if confirm("Would you like to change the storage type? (y/n):"):
         storage = get_storage_type()
 
-        storage_dict = {1: "JSON", 2: "MongoDB"}
+        storage_dict = {1: "JSON", 2: "MongoDB", 3: "SQLite"}
         default_dirs["STORAGE_TYPE"] = storage_dict[storage]
         if storage_dict.get(storage, 1) == "MongoDB":
             from redbot.core.drivers.red_mongo import get_config_details
@@ -271,12 +338,41 @@ async def edit_instance():
             if instance_data["STORAGE_TYPE"] == "JSON":
                 if confirm("Would you like to import your data? (y/n) "):
                     await json_to_mongo(current_data_dir, storage_details)
+            elif instance_data["STORAGE_TYPE"] == "SQLite":
+                if confirm("Would you like to import your data? (y/n) "):
+                    await sqlite_to_mongo(current_data_dir, storage_details)
+        elif storage_dict.get(storage, 1) == "SQLite":
+            storage_details = instance_data["STORAGE_DETAILS"]
+            default_dirs["STORAGE_DETAILS"] = {}
+            if instance_data["STORAGE_TYPE"] == "JSON":
+                if confirm("Would you like to import your data? (y/n) "):
+                    await json_to_sqlite(current_data_dir)
+            elif instance_data["STORAGE_TYPE"] == "MongoDB":
+                if confirm("Would you like to import your data? (y/n) "):
+                    await mongo_to_sqlite(current_data_dir, storage_details)
         else:
             storage_details = instance_data["STORAGE_DETAILS"]
             default_dirs["STORAGE_DETAILS"] = {}
             if instance_data["STORAGE_TYPE"] == "MongoDB":
                 if confirm("Would you like to import your data? (y/n) "):
                     await mongo_to_json(current_data_dir, storage_details)
+            elif instance_data["STORAGE_TYPE"] == "SQLite":
+                if confirm("Would you like to import your data? (y/n) "):
+                    await sqlite_to_json(current_data_dir)
+    else:
+        default_dirs["STORAGE_TYPE"] = instance_data["STORAGE_TYPE"]
+        storage_details = instance_data["STORAGE_DETAILS"]
+        default_dirs["STORAGE_DETAILS"] = storage_details
+        if (
+            instance_data["STORAGE_TYPE"] == "MongoDB"
+            and storage_details.get("LAYOUT") != "split"
+            and confirm(
+                "Would you like to split your MongoDB data into one document per guild,"
+                " member, etc.? (y/n) "
+            )
+        ):
+            await mongo_to_split_layout(storage_details)
+            storage_details["LAYOUT"] = "split"
 
     if name != selected:
         save_config(selected, {}, remove=True)
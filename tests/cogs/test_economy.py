@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from redbot.pytest.economy import *
 
@@ -81,3 +83,147 @@ async def test_nonint_transaction_amount(bank, member_factory):
         await bank.withdraw_credits(mbr1, 1.0)
     with pytest.raises(TypeError):
         await bank.transfer_credits(mbr1, mbr2, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_bank_leaderboard(bank, member_factory):
+    mbr1 = member_factory.get()
+    mbr2 = member_factory.get()._replace(guild=mbr1.guild)
+    mbr3 = member_factory.get()._replace(guild=mbr1.guild)
+    await bank.set_balance(mbr1, 100)
+    await bank.set_balance(mbr2, 300)
+    assert await bank.get_leaderboard_position(mbr2) == 1
+    assert await bank.get_leaderboard_position(mbr3) is None
+
+    # The leaderboard is kept up to date once it has been loaded
+    await bank.set_balance(mbr3, 200)
+    await bank.set_balance(mbr2, 50)
+    leaderboard = await bank.get_leaderboard(guild=mbr1.guild)
+    assert [(user_id, acc["balance"]) for user_id, acc in leaderboard] == [
+        (mbr3.id, 200),
+        (mbr1.id, 100),
+        (mbr2.id, 50),
+    ]
+    assert await bank.get_leaderboard(1, mbr1.guild) == leaderboard[:1]
+    assert await bank.get_leaderboard_position(mbr2) == 3
+
+
+@pytest.mark.asyncio
+async def test_bank_get_account(bank, member_factory):
+    mbr = member_factory.get()
+    await bank._conf.member(mbr).balance.set(42)
+    acc = await bank.get_account(mbr)
+    assert (acc.name, acc.balance) == ("", 42)
+
+    other = member_factory.get()
+    acc = await bank.get_account(other)
+    assert acc.name == other.display_name
+    assert acc.balance == await bank.get_default_balance(other.guild)
+
+
+@pytest.mark.asyncio
+async def test_bank_ledger(bank, member_factory):
+    mbr1 = member_factory.get()
+    mbr2 = member_factory.get()._replace(guild=mbr1.guild)
+    mbr3 = member_factory.get()._replace(guild=mbr1.guild)
+    for mbr in (mbr1, mbr2, mbr3):
+        await bank.set_balance(mbr, 100)
+
+    # Changes are only saved to Config in the background
+    assert await bank._conf.member(mbr1).balance() == 0
+    await bank._ledger.flush()
+    assert await bank._conf.member(mbr1).balance() == 100
+
+    await asyncio.gather(
+        *(
+            bank.transfer_credits(a, b, 10)
+            for a, b in [(mbr1, mbr2), (mbr2, mbr3), (mbr3, mbr1)] * 5
+        ),
+        *(bank.deposit_credits(mbr1, 1) for _ in range(10)),
+    )
+    assert [await bank.get_balance(mbr) for mbr in (mbr1, mbr2, mbr3)] == [110, 100, 100]
+    await bank._ledger.flush()
+
+    # Changes which weren't saved before Red stopped are recovered from the journal
+    await bank.withdraw_credits(mbr1, 60)
+    await bank.transfer_credits(mbr2, mbr3, 30)
+    bank._ledger = bank._Ledger()
+    assert [await bank._conf.member(mbr).balance() for mbr in (mbr1, mbr2, mbr3)] == [
+        110,
+        100,
+        100,
+    ]
+    assert [await bank.get_balance(mbr) for mbr in (mbr1, mbr2, mbr3)] == [50, 70, 130]
+    assert [await bank._conf.member(mbr).balance() for mbr in (mbr1, mbr2, mbr3)] == [50, 70, 130]
+
+
+@pytest.mark.asyncio
+async def test_bank_ledger_write_through(bank, member_factory):
+    mbr = member_factory.get()
+    # As when the bank's data is shared with other processes
+    await bank._ledger.recover()
+    bank._ledger.write_through = True
+
+    await bank.set_balance(mbr, 100)
+    assert await bank._conf.member(mbr).balance() == 100
+    await bank._conf.member(mbr).balance.set(40)
+    assert await bank.deposit_credits(mbr, 10) == 50
+    assert await bank.get_leaderboard_position(mbr) == 1
+
+
+@pytest.mark.asyncio
+async def test_bank_wipe(bank, member_factory):
+    mbr = member_factory.get()
+    default = await bank.get_default_balance(mbr.guild)
+    await bank.set_balance(mbr, 500)
+    await asyncio.gather(bank.deposit_credits(mbr, 10), bank.wipe_bank(mbr.guild))
+    assert await bank.get_balance(mbr) == default
+
+    # Changes made before the wipe aren't replayed after a restart
+    bank._ledger = bank._Ledger()
+    assert await bank.get_balance(mbr) == default
+
+
+@pytest.mark.asyncio
+async def test_bank_bulk_operations(bank, member_factory):
+    # Members are used as dict keys, so must be hashable
+    guild = member_factory.get().guild._replace(members=())
+    mbr1, mbr2, mbr3 = (member_factory.get()._replace(guild=guild) for _ in range(3))
+    default = await bank.get_default_balance(mbr1.guild)
+    await bank.set_balance(mbr1, 10)
+
+    assert await bank.bulk_deposit({mbr1: 5, mbr2: 20}) == {mbr1: 15, mbr2: default + 20}
+    assert await bank.bulk_set_balance({mbr2: 1, mbr3: 2}) == {mbr2: 1, mbr3: 2}
+    assert [await bank.get_balance(m) for m in (mbr1, mbr2, mbr3)] == [15, 1, 2]
+
+    # Either every change is made, or none are
+    with pytest.raises(bank.errors.BalanceTooHigh):
+        await bank.bulk_deposit({mbr1: 1, mbr2: bank.MAX_BALANCE})
+    with pytest.raises(ValueError):
+        await bank.bulk_set_balance({mbr1: 1, mbr2: -1})
+    assert [await bank.get_balance(m) for m in (mbr1, mbr2, mbr3)] == [15, 1, 2]
+    assert await bank.get_leaderboard_position(mbr1) == 1
+
+
+@pytest.mark.asyncio
+async def test_bank_settings_cache(bank, guild_factory):
+    guild = guild_factory.get()
+    assert await bank.get_currency_name(guild) == "credits"
+    assert bank._settings[guild.id]["currency"] == "credits"
+
+    await bank.set_currency_name("coins", guild)
+    await bank.set_default_balance(5, guild)
+    assert await bank.get_currency_name(guild) == "coins"
+    assert await bank.get_default_balance(guild) == 5
+
+    # Changes made to Config directly are picked up too
+    await bank._conf.guild(guild).bank_name.set("Vault")
+    assert await bank.get_bank_name(guild) == "Vault"
+
+    await bank.set_global(True)
+    assert await bank.is_global() is True
+    await bank.set_bank_name("World bank")
+    assert await bank.get_bank_name(guild) == "World bank"
+    assert await bank.get_currency_name(guild) == "credits"
+    await bank.set_global(False)
+    assert await bank.get_currency_name(guild) == "coins"
@@ -413,7 +413,7 @@ async def test_ctxmgr_no_shared_default(config, member_factory):
 async def test_ctxmgr_no_unnecessary_write(config):
     config.register_global(foo=[])
     foo_value_obj = config.foo
-    with patch.object(foo_value_obj, "set") as set_method:
+    with patch.object(type(foo_value_obj), "set") as set_method:
         async with foo_value_obj() as foo:
             pass
         set_method.assert_not_called()
@@ -490,3 +490,341 @@ async def test_cast_str_nested(config):
     config.register_global(foo={})
     await config.foo.set({123: True, 456: {789: False}})
     assert await config.foo() == {"123": True, "456": {"789": False}}
+
+
+@pytest.fixture()
+def frozen_config(json_driver):
+    from redbot.core import Config
+
+    conf = Config(
+        cog_name="PyTest",
+        unique_identifier=json_driver.unique_cog_identifier,
+        driver=json_driver,
+        frozen_reads=True,
+    )
+    yield conf
+    conf._defaults = {}
+
+
+@pytest.mark.asyncio
+async def test_frozen_reads_are_immutable_snapshots(frozen_config):
+    frozen_config.register_global(foo={"bar": [1, 2]}, baz=True)
+    await frozen_config.foo.set_raw("qux", value={"a": 1})
+
+    foo = await frozen_config.foo()
+    assert foo["bar"] == (1, 2)
+    assert foo["qux"]["a"] == 1
+    with pytest.raises(TypeError):
+        foo["bar"] = []
+
+    await frozen_config.foo.qux.set({"a": 2})
+    assert foo["qux"]["a"] == 1
+    assert (await frozen_config.foo())["qux"]["a"] == 2
+
+
+@pytest.mark.asyncio
+async def test_frozen_reads_ctxmgr_is_mutable(frozen_config):
+    frozen_config.register_global(foo=[])
+    async with frozen_config.foo() as foo:
+        foo.append(1)
+    assert await frozen_config.foo() == (1,)
+
+
+@pytest.mark.asyncio
+async def test_frozen_reads_all_members(frozen_config, empty_member):
+    frozen_config.register_member(foo=False, bar=0)
+    await frozen_config.member(empty_member).foo.set(True)
+
+    all_members = await frozen_config.all_members(empty_member.guild)
+    assert dict(all_members[empty_member.id]) == {"foo": True, "bar": 0}
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_once(config, empty_member):
+    config.register_member(balance=0, name="")
+    member = config.member(empty_member)
+    with patch.object(config.driver, "apply_changes", wraps=config.driver.apply_changes) as apply:
+        async with config.transaction():
+            await member.balance.set(10)
+            await member.name.set("foo")
+            assert await member.balance() == 10
+            assert apply.call_count == 0
+        assert apply.call_count == 1
+    assert await member.all() == {"balance": 10, "name": "foo"}
+
+
+@pytest.mark.asyncio
+async def test_transaction_discards_on_error(config):
+    config.register_global(foo={})
+    await config.foo.set({"a": 1})
+    with pytest.raises(RuntimeError):
+        async with config.foo.batch():
+            await config.foo.set_raw("b", value=2)
+            await config.foo.clear_raw("a")
+            assert await config.foo() == {"b": 2}
+            raise RuntimeError
+    assert await config.foo() == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_transaction_folds_nested_changes(config):
+    config.register_global(foo={})
+    await config.foo.set({"a": 1})
+    async with config.transaction():
+        await config.foo.clear()
+        await config.foo.set_raw("b", "c", value=2)
+        async with config.transaction():
+            await config.foo.set_raw("b", "d", value=3)
+        assert await config.foo() == {"b": {"c": 2, "d": 3}}
+    assert await config.foo() == {"b": {"c": 2, "d": 3}}
+
+
+@pytest.mark.asyncio
+async def test_iter_members(config, member_factory):
+    config.register_member(foo=False, bar=0)
+    first = member_factory.get()
+    second = member_factory.get()
+    await config.member(first).foo.set(True)
+    await config.member(second).bar.set(1)
+
+    members = [item async for item in config.iter_members(first.guild)]
+    assert members == [(first.id, {"foo": True, "bar": 0})]
+    members = {(g, m): data async for g, m, data in config.iter_members()}
+    assert members == await _flat_all_members(config)
+
+
+async def _flat_all_members(config):
+    return {
+        (guild_id, member_id): data
+        for guild_id, guild_data in (await config.all_members()).items()
+        for member_id, data in guild_data.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_guilds_in_transaction(config, guild_factory):
+    config.register_guild(foo=0)
+    guild = guild_factory.get()
+    await config.guild(guild).foo.set(1)
+    async with config.transaction():
+        await config.guild(guild).foo.set(2)
+        assert [item async for item in config.iter_guilds()] == [(guild.id, {"foo": 2})]
+    assert [item async for item in config.iter_guilds()] == [(guild.id, {"foo": 2})]
+
+
+@pytest.mark.asyncio
+async def test_defaults_are_not_shared(config, empty_guild):
+    config.register_guild(foo=[], bar={"baz": [], "qux": 1})
+    guild = config.guild(empty_guild)
+    (await guild.foo()).append(1)
+    (await guild.all())["bar"]["baz"].append(1)
+    (await guild.get_raw("bar", "baz")).append(1)
+    assert await guild.all() == {"foo": [], "bar": {"baz": [], "qux": 1}}
+    assert config.defaults["GUILD"] == {"foo": [], "bar": {"baz": [], "qux": 1}}
+
+
+@pytest.mark.asyncio
+async def test_defaults_merge_missing_keys(config, empty_guild):
+    config.register_guild(foo=0, bar={"baz": 1, "qux": 2})
+    guild = config.guild(empty_guild)
+    await guild.bar.baz.set(3)
+    await guild.set_raw("extra", value=True)
+    assert await guild.all() == {"foo": 0, "bar": {"baz": 3, "qux": 2}, "extra": True}
+    assert await guild.get_raw("bar") == {"baz": 3, "qux": 2}
+
+
+def test_group_handles_are_reused(config, empty_guild):
+    config.register_guild(foo=0, bar={"baz": 1})
+    guild = config.guild(empty_guild)
+    assert config.guild(empty_guild) is guild
+    assert guild.foo is guild.foo
+    assert guild.bar.baz is guild.bar.baz
+    assert not hasattr(guild.foo, "__dict__")
+
+    config.register_guild(qux=True)
+    assert config.guild(empty_guild) is not guild
+    assert config.guild(empty_guild).qux.default is True
+
+
+@pytest.mark.asyncio
+async def test_storage_stats(config, empty_guild):
+    from redbot.core.drivers import stats
+
+    stats.reset("PyTest")
+    config.register_global(foo=0)
+    config.register_guild(bar=0)
+    await config.foo.set(1)
+    await config.foo()
+    await config.guild(empty_guild).bar.set(2)
+    await config.guild(empty_guild).clear()
+    await config.all_guilds()
+
+    recorded = stats.snapshot("PyTest")["PyTest"]
+    assert recorded["GLOBAL"]["set"]["count"] == 1
+    assert recorded["GLOBAL"]["get"]["count"] == 1
+    assert recorded["GLOBAL"]["save"]["count"] == 1
+    assert recorded["GLOBAL"]["bytes_serialized"] > 0
+    assert recorded["GUILD"]["set"]["count"] == 1
+    assert recorded["GUILD"]["clear"]["count"] == 1
+    assert recorded["GUILD"]["get"]["count"] == 1
+    assert recorded["GUILD"]["lock_wait"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_raw(config, empty_guild, empty_member):
+    config.register_global(foo=0, bar={"baz": 1, "qux": 2})
+    config.register_member(balance=0)
+    await config.set_many_raw({("foo",): 1, ("bar", "baz"): 3, ("extra",): True})
+    assert await config.get_many_raw(("foo",), ("bar",), ("bar", "qux")) == [
+        1,
+        {"baz": 3, "qux": 2},
+        2,
+    ]
+    assert await config.get_many_raw(("missing",), default=None) == [None]
+    with pytest.raises(KeyError):
+        await config.get_many_raw(("foo",), ("missing",))
+
+    await config.member(empty_member).balance.set(5)
+    async with config.transaction():
+        await config.foo.set(2)
+        assert await config.get_many(
+            config.foo, config.bar, config.member(empty_member).balance, config.guild(empty_guild)
+        ) == [2, {"baz": 3, "qux": 2}, 5, {}]
+
+
+@pytest.mark.asyncio
+async def test_value_inc_dec(tmpdir, empty_guild):
+    import asyncio
+    from pathlib import Path
+    from redbot.core import Config
+    from redbot.core.drivers.red_json import JSON
+
+    # The driver's lock must be created in this test's event loop, since
+    # the increments run concurrently
+    driver = JSON("PyTest", identifier="inc", data_path_override=Path(str(tmpdir)))
+    config = Config(cog_name="PyTest", unique_identifier="inc", driver=driver)
+    config.register_guild(counter=5)
+    counter = config.guild(empty_guild).counter
+    await asyncio.gather(*(counter.inc() for _ in range(20)))
+    assert await counter() == 25
+    assert await counter.inc(10, maximum=30) == 30
+    assert await counter.dec(40, minimum=0) == 0
+
+    async with config.transaction():
+        assert await counter.inc(2) == 2
+        assert await counter.inc(2) == 4
+    assert await counter() == 4
+
+    # Increments made in concurrent transactions aren't lost
+    async def add(amount):
+        async with config.transaction():
+            await counter.inc(amount)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(add(1), add(2))
+    assert await counter() == 7
+
+
+@pytest.mark.asyncio
+async def test_on_change(config, empty_guild):
+    from redbot.core import Config
+
+    config.register_guild(words=[], count=0)
+    guild_id = str(empty_guild.id)
+    changes = []
+
+    async def on_words(identifiers):
+        changes.append(identifiers)
+
+    config.on_change(Config.GUILD, [empty_guild.id, "words"], on_words)
+    try:
+        await config.guild(empty_guild).words.set(["a"])
+        await config.guild(empty_guild).count.set(1)
+        async with config.guild(empty_guild).words() as words:
+            words.append("b")
+        await config.guild(empty_guild).clear_raw("words")
+        await config.guild(empty_guild).clear()
+        assert changes == [
+            ("GUILD", guild_id, "words"),
+            ("GUILD", guild_id, "words"),
+            ("GUILD", guild_id, "words"),
+            ("GUILD", guild_id),
+        ]
+
+        changes.clear()
+        async with config.transaction():
+            await config.guild(empty_guild).words.set(["c"])
+            assert changes == []
+        assert changes == [("GUILD", guild_id, "words")]
+    finally:
+        config.remove_change_listener(Config.GUILD, [empty_guild.id, "words"], on_words)
+
+    changes.clear()
+    await config.guild(empty_guild).words.set([])
+    assert changes == []
+
+
+@pytest.mark.asyncio
+async def test_expiring_values(config, empty_member, monkeypatch):
+    import asyncio
+    import datetime
+    import time
+    from redbot.core import config as config_module
+
+    config.register_member(cooldown=False, count=0)
+    member = config.member(empty_member)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    await member.cooldown.set(True, expire_after=60)
+    await member.count.set(3, expire_after=datetime.timedelta(minutes=1))
+    await member.count.set(4)
+    assert await member.cooldown() is True
+
+    # Expiry times are saved with the data, so they are loaded again
+    del config_module._expiries[(config.driver.cog_name, config.driver.unique_cog_identifier)]
+    now += 61
+    assert await member.all() == {"cooldown": False, "count": 4}
+    with pytest.raises(KeyError):
+        await config.driver.get(*member.cooldown.identifiers)
+
+    await member.cooldown.set(True, expire_after=60)
+    await member.clear()
+    assert await config.driver.get("__EXPIRY__", "MEMBER") == {}
+
+    monkeypatch.undo()
+    await member.cooldown.set(True, expire_after=0.01)
+    await asyncio.sleep(0.1)
+    with pytest.raises(KeyError):
+        await config.driver.get(*member.cooldown.identifiers)
+
+
+@pytest.mark.asyncio
+async def test_inc_updates_expiry(config, empty_member):
+    config.register_member(count=0)
+    member = config.member(empty_member)
+
+    assert await member.count.inc(expire_after=60) == 1
+    assert await config.driver.get("__EXPIRY__", "MEMBER") != {}
+    # Like setting it, incrementing the value without expire_after stops it expiring
+    assert await member.count.inc() == 2
+    assert await config.driver.get("__EXPIRY__", "MEMBER") == {}
+    assert await member.count.dec(expire_after=60) == 1
+    assert await config.driver.get("__EXPIRY__", "MEMBER") != {}
+
+
+@pytest.mark.asyncio
+async def test_expiry_discarded_with_transaction(config, empty_member):
+    import asyncio
+
+    config.register_member(cooldown=False)
+    member = config.member(empty_member)
+    await member.cooldown.set(True)
+
+    with pytest.raises(RuntimeError):
+        async with config.transaction():
+            await member.cooldown.set(True, expire_after=0.01)
+            raise RuntimeError
+    await asyncio.sleep(0.1)
+    assert await member.cooldown() is True
+    assert await config.driver.get(*member.cooldown.identifiers) is True
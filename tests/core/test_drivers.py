@@ -0,0 +1,537 @@
+import copy
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from redbot.core.drivers import red_json, flush_pending_writes
+
+
+@pytest.fixture()
+def write_behind_driver(tmpdir_factory):
+    path = Path(str(tmpdir_factory.mktemp(str(uuid.uuid4()))))
+    driver = red_json.JSON(
+        str(uuid.uuid4()),
+        identifier="0",
+        data_path_override=path,
+        write_behind=True,
+        flush_interval=60,
+        flush_threshold=100,
+    )
+    yield driver
+    red_json._pending_writes.pop(driver.cog_name, None)
+
+
+def _saved_data(driver):
+    with driver.data_path.open() as f:
+        return json.load(f)
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces(write_behind_driver):
+    for i in range(5):
+        await write_behind_driver.set("GLOBAL", "foo", value=i)
+    assert _saved_data(write_behind_driver) == {}
+    assert await write_behind_driver.get("GLOBAL", "foo") == 4
+
+    await flush_pending_writes(write_behind_driver.cog_name)
+    assert _saved_data(write_behind_driver) == {"0": {"GLOBAL": {"foo": 4}}}
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_threshold(write_behind_driver):
+    await write_behind_driver.set("GLOBAL", "foo", value="x" * 200)
+    pending = red_json._pending_writes[write_behind_driver.cog_name]
+    await pending._flush_task
+    assert _saved_data(write_behind_driver)["0"]["GLOBAL"]["foo"] == "x" * 200
+
+
+@pytest.fixture()
+def journal_driver_factory(tmpdir_factory):
+    path = Path(str(tmpdir_factory.mktemp(str(uuid.uuid4()))))
+    cog_name = str(uuid.uuid4())
+
+    def factory(**kwargs):
+        # Drop the shared data so that each driver loads from disk
+        red_json._shared_datastore.pop(cog_name, None)
+        red_json._journals.pop(cog_name, None)
+        return red_json.JSON(
+            cog_name, identifier="0", data_path_override=path, journal=True, **kwargs
+        )
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_journal_replays_changes(journal_driver_factory):
+    driver = journal_driver_factory()
+    await driver.set("GLOBAL", "foo", value={"bar": 1})
+    await driver.set("GLOBAL", "foo", "baz", value=2)
+    await driver.clear("GLOBAL", "foo", "bar")
+    assert _saved_data(driver) == {}
+
+    driver = journal_driver_factory()
+    assert await driver.get("GLOBAL", "foo") == {"baz": 2}
+    assert red_json.read_data_file(driver.data_path) == {"0": {"GLOBAL": {"foo": {"baz": 2}}}}
+
+
+@pytest.mark.asyncio
+async def test_journal_compacts(journal_driver_factory):
+    driver = journal_driver_factory()
+    journal = red_json._journals[driver.cog_name]
+    journal.MIN_COMPACT_SIZE = 0
+    await driver.set("GLOBAL", "foo", value="x" * 100)
+    await journal._compact_task
+
+    assert _saved_data(driver) == {"0": {"GLOBAL": {"foo": "x" * 100}}}
+    assert journal.size == 0
+    assert journal.path.read_text() == ""
+
+
+@pytest.mark.asyncio
+async def test_journal_ignores_partial_record(journal_driver_factory):
+    driver = journal_driver_factory()
+    await driver.set("GLOBAL", "foo", value=1)
+    with red_json._Journal.path_for(driver.data_path).open("a") as f:
+        f.write('{"path":["0","GLOBAL","foo"],"val')
+
+    driver = journal_driver_factory()
+    assert await driver.get("GLOBAL", "foo") == 1
+    await driver.set("GLOBAL", "foo", value=2)
+
+    driver = journal_driver_factory()
+    assert await driver.get("GLOBAL", "foo") == 2
+
+
+@pytest.fixture()
+def sqlite_driver(tmpdir_factory):
+    from redbot.core.drivers.red_sqlite import SQLite
+
+    path = Path(str(tmpdir_factory.mktemp(str(uuid.uuid4()))))
+    return SQLite("PyTest", identifier="0", data_path_override=path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_nested_values(sqlite_driver):
+    await sqlite_driver.set("GUILD", "1", value={"foo": {"bar": 1, "baz": []}, "qux": {}})
+    await sqlite_driver.set("GUILD", "1", "foo", "bar", value=2)
+    await sqlite_driver.set("GUILD", "2", "foo", value="x")
+
+    assert await sqlite_driver.get("GUILD", "1") == {"foo": {"bar": 2, "baz": []}, "qux": {}}
+    assert await sqlite_driver.get("GUILD", "1", "foo", "bar") == 2
+    assert await sqlite_driver.get("GUILD") == {
+        "1": {"foo": {"bar": 2, "baz": []}, "qux": {}},
+        "2": {"foo": "x"},
+    }
+    with pytest.raises(KeyError):
+        await sqlite_driver.get("GUILD", "3")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_replace_and_clear(sqlite_driver):
+    await sqlite_driver.set("GLOBAL", "foo", value={})
+    await sqlite_driver.set("GLOBAL", "foo", "bar", value=1)
+    assert await sqlite_driver.get("GLOBAL", "foo") == {"bar": 1}
+
+    await sqlite_driver.clear("GLOBAL", "foo", "bar")
+    assert await sqlite_driver.get("GLOBAL", "foo") == {}
+
+    await sqlite_driver.clear("GLOBAL")
+    with pytest.raises(KeyError):
+        await sqlite_driver.get("GLOBAL")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_config(sqlite_driver, member_factory):
+    from redbot.core import Config
+
+    conf = Config(cog_name="PyTest", unique_identifier="0", driver=sqlite_driver)
+    conf.register_member(foo=False, bar=0)
+    member = member_factory.get()
+    await conf.member(member).foo.set(True)
+
+    assert await conf.member(member).all() == {"foo": True, "bar": 0}
+    assert await conf.all_members(member.guild) == {member.id: {"foo": True, "bar": 0}}
+
+
+@pytest.fixture()
+def json_driver_factory(tmpdir_factory):
+    path = Path(str(tmpdir_factory.mktemp(str(uuid.uuid4()))))
+    cog_name = str(uuid.uuid4())
+
+    def factory(**kwargs):
+        # Each driver is made with only the options it's given, and loads from disk
+        red_json._shared_datastore.pop(cog_name, None)
+        red_json._shards.pop(cog_name, None)
+        return red_json.JSON(cog_name, identifier="0", data_path_override=path, **kwargs)
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_sharded_writes_only_touched_shard(json_driver_factory):
+    driver = json_driver_factory(sharded=True)
+    await driver.set("GUILD", "1", value={"foo": 1})
+    await driver.set("GUILD", "2", value={"foo": 2})
+    await driver.set("GLOBAL", "bar", value=True)
+
+    root = driver.data_path.with_suffix("")
+    guild_2 = root / "0" / "GUILD" / "2.json"
+    mtime = guild_2.stat().st_mtime_ns
+    await driver.set("GUILD", "1", "foo", value=3)
+    assert guild_2.stat().st_mtime_ns == mtime
+    assert json.loads((root / "0" / "GUILD" / "1.json").read_text()) == {"foo": 3}
+    assert json.loads((root / "0" / "GLOBAL.json").read_text()) == {"bar": True}
+
+    await driver.clear("GUILD", "2")
+    assert not guild_2.exists()
+
+
+@pytest.mark.asyncio
+async def test_sharded_loads_lazily(json_driver_factory):
+    driver = json_driver_factory(sharded=True)
+    await driver.set("GUILD", "1", value={"foo": 1})
+    await driver.set("GUILD", "2", value={"foo": 2})
+
+    driver = json_driver_factory(sharded=True)
+    assert await driver.get("GUILD", "1") == {"foo": 1}
+    assert driver.data == {"0": {"GUILD": {"1": {"foo": 1}}}}
+    assert await driver.get("GUILD") == {"1": {"foo": 1}, "2": {"foo": 2}}
+    with pytest.raises(KeyError):
+        await driver.get("GUILD", "3")
+
+
+@pytest.mark.asyncio
+async def test_sharded_migration(json_driver_factory):
+    driver = json_driver_factory()
+    await driver.set("GUILD", "1", value={"foo": 1})
+
+    driver = json_driver_factory(sharded=True)
+    assert _saved_data(driver) == {}
+    assert await driver.get("GUILD", "1", "foo") == 1
+    assert red_json.read_data_file(driver.data_path) == {"0": {"GUILD": {"1": {"foo": 1}}}}
+
+    driver = json_driver_factory()
+    assert _saved_data(driver) == {"0": {"GUILD": {"1": {"foo": 1}}}}
+    assert not driver.data_path.with_suffix("").exists()
+
+
+@pytest.fixture()
+def cached_mongo_driver(monkeypatch):
+    red_mongo = pytest.importorskip("redbot.core.drivers.red_mongo")
+
+    class FakeCollection:
+        async def update_one(self, *args, **kwargs):
+            pass
+
+    stored = {"GUILD": {"1": {"prefix": ["!"]}, "2": {}, "3": {}}}
+    fetched = []
+
+    async def fetch(identifiers):
+        fetched.append(identifiers)
+        partial = stored
+        for i in identifiers:
+            partial = partial[i]
+        return copy.deepcopy(partial)
+
+    # Prevent connecting to a database
+    monkeypatch.setattr(red_mongo, "_conn", object())
+    cog_name = str(uuid.uuid4())
+    driver = red_mongo.Mongo(cog_name, "0", CACHE_SIZE=2)
+    monkeypatch.setattr(driver, "_fetch", fetch)
+    monkeypatch.setattr(driver, "get_collection", FakeCollection)
+    driver.fetched = fetched
+    yield driver
+    red_mongo._caches.pop(cog_name, None)
+
+
+@pytest.mark.asyncio
+async def test_mongo_cache_hits(cached_mongo_driver):
+    driver = cached_mongo_driver
+    assert await driver.get("GUILD", "1") == {"prefix": ["!"]}
+    assert await driver.get("GUILD", "1", "prefix") == ["!"]
+    (await driver.get("GUILD", "1", "prefix")).append("?")
+    assert await driver.get_frozen("GUILD", "1", "prefix") == ("!",)
+    with pytest.raises(KeyError):
+        await driver.get("GUILD", "1", "embeds")
+    assert driver.fetched == [("GUILD", "1")]
+    assert driver.cache.stats()["hits"] == 4
+    assert driver.cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_mongo_cache_invalidation(cached_mongo_driver):
+    driver = cached_mongo_driver
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            await driver.get("GUILD", "4")
+    await driver.get("GUILD", "1")
+    await driver.set("GUILD", "1", "prefix", value=["?"])
+    await driver.get("GUILD", "1")
+    assert driver.fetched == [("GUILD", "4"), ("GUILD", "1"), ("GUILD", "1")]
+
+    await driver.get("GUILD", "2")
+    await driver.get("GUILD", "3")
+    assert driver.cache.stats()["evictions"] == 2
+    assert driver.cache.stats()["size"] == 2
+
+
+@pytest.fixture()
+def split_mongo_driver(monkeypatch):
+    red_mongo = pytest.importorskip("redbot.core.drivers.red_mongo")
+
+    class FakeCollection:
+        name = "PyTest"
+        documents = []
+        requests = []
+
+        async def create_index(self, *args, **kwargs):
+            pass
+
+        async def bulk_write(self, requests):
+            self.requests.append(requests)
+
+        async def find(self, filter):
+            for document in self.documents:
+                if all(document["_id"][k[4:]] == v for k, v in filter.items()):
+                    yield document
+
+    monkeypatch.setattr(red_mongo, "_conn", object())
+    driver = red_mongo.Mongo("PyTest", "0", LAYOUT="split")
+    collection = FakeCollection()
+    monkeypatch.setattr(driver, "get_collection", lambda: collection)
+    driver.collection = collection
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_mongo_split_writes(split_mongo_driver):
+    from pymongo import DeleteMany, ReplaceOne, UpdateOne
+    from redbot.core.drivers.red_mongo import _document_id
+
+    member_id = _document_id("0", ("MEMBER", "1", "2"))
+    await split_mongo_driver.apply_changes(
+        {("MEMBER", "1", "2", "balance"): 10, ("GUILD",): {"1": {"a.b": 1}}},
+        [("MEMBER", "1", "2", "name")],
+    )
+    assert split_mongo_driver.collection.requests == [
+        [
+            DeleteMany({"_id.RED_uuid": "0", "_id.RED_scope": "GUILD"}),
+            ReplaceOne(
+                {"_id": _document_id("0", ("GUILD", "1"))},
+                {"_id": _document_id("0", ("GUILD", "1")), "data": {"a\\U0000002Eb": 1}},
+                upsert=True,
+            ),
+            UpdateOne(
+                {"_id": member_id},
+                {"$set": {"data.balance": 10}, "$unset": {"data.name": 1}},
+                upsert=True,
+            ),
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mongo_split_reads_scope(split_mongo_driver):
+    from redbot.core.drivers.red_mongo import _document_id
+
+    split_mongo_driver.collection.documents = [
+        {"_id": _document_id("0", ("MEMBER", "1", "2")), "data": {"balance": 10}},
+        {"_id": _document_id("0", ("MEMBER", "1", "3")), "data": {"balance": 20}},
+        {"_id": _document_id("0", ("MEMBER", "4", "2")), "data": {"balance": 30}},
+    ]
+    assert await split_mongo_driver.get("MEMBER", "1") == {
+        "2": {"balance": 10},
+        "3": {"balance": 20},
+    }
+    assert await split_mongo_driver.get("MEMBER") == {
+        "1": {"2": {"balance": 10}, "3": {"balance": 20}},
+        "4": {"2": {"balance": 30}},
+    }
+    with pytest.raises(KeyError):
+        await split_mongo_driver.get("MEMBER", "5")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_iter_children(sqlite_driver):
+    sqlite_driver.PAGE_SIZE = 2
+    await sqlite_driver.set(
+        "MEMBER", value={"1": {"2": {"a": 1, "b": [1]}, "3": {}}, "10": {"2": {"a": 2}}}
+    )
+    assert [item async for item in sqlite_driver.iter_children("MEMBER")] == [
+        ("1", {"2": {"a": 1, "b": [1]}, "3": {}}),
+        ("10", {"2": {"a": 2}}),
+    ]
+    assert [item async for item in sqlite_driver.iter_children("MEMBER", "1", frozen=True)] == [
+        ("2", {"a": 1, "b": (1,)}),
+        ("3", {}),
+    ]
+    assert [item async for item in sqlite_driver.iter_children("GUILD")] == []
+
+
+def test_stats_histogram():
+    from redbot.core.drivers.stats import Histogram
+
+    histogram = Histogram()
+    for seconds in (0.000001, 0.000003, 0.001, 100):
+        histogram.add(seconds)
+    assert histogram.count == 4
+    assert histogram.max == 100
+    assert histogram.buckets[1] == 1
+    assert histogram.buckets[2] == 1
+    assert histogram.buckets[10] == 1
+    assert histogram.buckets[-1] == 1
+    assert histogram.percentile(50) == 0.000004
+    assert histogram.percentile(100) == 100
+
+
+def test_compact_converts_existing_file(json_driver_factory):
+    from redbot.core.json_io import MINIFIED, PRETTY, JsonIO
+
+    driver = json_driver_factory()
+    driver.jsonIO._save_json({"0": {"GLOBAL": {"foo": [1, 2]}}})
+    assert JsonIO(driver.data_path)._load_json() == {"0": {"GLOBAL": {"foo": [1, 2]}}}
+
+    driver = json_driver_factory(compact=True)
+    assert driver.data_path.read_text() == '{"0":{"GLOBAL":{"foo":[1,2]}}}'
+    json_io = JsonIO(driver.data_path)
+    json_io._load_json()
+    assert json_io.loaded_settings is MINIFIED
+
+    driver = json_driver_factory()
+    json_io._load_json()
+    assert json_io.loaded_settings is PRETTY
+
+
+@pytest.mark.parametrize("name", ["json", "ujson", "orjson"])
+def test_serializers_round_trip(name):
+    from redbot.core.json_io import MINIFIED, PRETTY, get_serializer
+
+    if name != "json":
+        pytest.importorskip(name)
+    serializer = get_serializer(name)
+    data = {"a/b": ["é", 1.5, None, True], "big": 2 ** 70, "nested": {"x": {}}}
+    for settings in (PRETTY, MINIFIED):
+        assert serializer.loads(serializer.dumps(data, settings)) == data
+    assert "\n" not in serializer.dumps(data, MINIFIED)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_get_many(sqlite_driver):
+    await sqlite_driver.set_many({("GUILD", "1"): {"foo": [1]}, ("GUILD", "2", "foo"): 2})
+    assert await sqlite_driver.get_many(
+        [("GUILD", "1"), ("GUILD", "2", "foo"), ("GUILD", "3")], frozen=True
+    ) == {("GUILD", "1"): {"foo": (1,)}, ("GUILD", "2", "foo"): 2}
+
+
+@pytest.mark.asyncio
+async def test_mongo_get_many_projects_once(monkeypatch):
+    red_mongo = pytest.importorskip("redbot.core.drivers.red_mongo")
+
+    class FakeCollection:
+        projections = []
+
+        async def find_one(self, filter, projection):
+            self.projections.append(projection)
+            return {"_id": "0", "GUILD": {"1": {"a\\U0000002Eb": 1, "c": {"d": 2}}}}
+
+    monkeypatch.setattr(red_mongo, "_conn", object())
+    driver = red_mongo.Mongo("PyTest", "0")
+    collection = FakeCollection()
+    monkeypatch.setattr(driver, "get_collection", lambda: collection)
+    assert await driver.get_many(
+        [("GUILD", "1", "c", "d"), ("GUILD", "1", "c"), ("GUILD", "1", "a.b"), ("GUILD", "2")]
+    ) == {("GUILD", "1", "c", "d"): 2, ("GUILD", "1", "c"): {"d": 2}, ("GUILD", "1", "a.b"): 1}
+    assert collection.projections == [
+        {"GUILD.1.a\\U0000002Eb": True, "GUILD.1.c": True, "GUILD.2": True}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_memory_driver(memory_driver_factory):
+    driver = memory_driver_factory()
+    with pytest.raises(KeyError):
+        await driver.get()
+    value = {"foo": [1]}
+    await driver.set("GUILD", "1", value=value)
+    value["foo"].append(2)
+    (await driver.get("GUILD", "1", "foo")).append(3)
+    await driver.apply_changes({("GUILD", "2"): {}}, [("GUILD", "1", "foo")])
+    assert await driver.get("GUILD") == {"1": {}, "2": {}}
+    assert driver.round_trips == 5
+
+
+@pytest.mark.asyncio
+async def test_memory_driver_failures(memory_config_factory):
+    from redbot.core.drivers.red_memory import SimulatedFailure
+
+    config = memory_config_factory(latency=0.01, jitter=0.005, failure_rate=0.5, seed=0)
+    config.register_global(foo=0)
+    results = []
+    for i in range(20):
+        try:
+            await config.foo.set(i)
+        except SimulatedFailure:
+            results.append(False)
+        else:
+            results.append(True)
+    assert True in results and False in results
+    config.driver.failure_rate = 0
+    assert await config.foo() == max(i for i, ok in enumerate(results) if ok)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_inc(sqlite_driver):
+    assert await sqlite_driver.inc("GUILD", "1", "count", amount=2, default=10) == 12
+    assert await sqlite_driver.inc("GUILD", "1", "count", amount=-20, minimum=0) == 0
+    assert await sqlite_driver.get("GUILD", "1") == {"count": 0}
+
+
+@pytest.mark.asyncio
+async def test_lazy_load(json_driver_factory):
+    from redbot.core.drivers import stats
+
+    driver = json_driver_factory()
+    await driver.set("GUILD", "1", value={"foo": 1})
+
+    stats.reset(driver.cog_name)
+    driver = json_driver_factory(lazy_load=True)
+    assert driver.data is None
+    assert await driver.get("GUILD", "1", "foo") == 1
+    assert driver.data == {"0": {"GUILD": {"1": {"foo": 1}}}}
+    assert stats.snapshot(driver.cog_name)[driver.cog_name]["*"]["load"]["count"] == 1
+
+
+_INC_SCRIPT = """
+import asyncio, sys
+from pathlib import Path
+from redbot.core.drivers.red_json import JSON
+
+driver = JSON(sys.argv[1], "0", data_path_override=Path(sys.argv[2]), multiprocess=True)
+loop = asyncio.get_event_loop()
+loop.run_until_complete(driver.set("GUILD", "2", value={"foo": 1}))
+for _ in range(20):
+    loop.run_until_complete(driver.inc("GLOBAL", "count", amount=1))
+"""
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_merges_changes(tmpdir):
+    import subprocess
+    import sys
+
+    path = Path(str(tmpdir))
+    cog_name = str(uuid.uuid4())
+    driver = red_json.JSON(
+        cog_name, "0", data_path_override=path, multiprocess=True, reload_interval=0
+    )
+    await driver.set("GUILD", "1", value={"foo": 1})
+    child = subprocess.Popen([sys.executable, "-c", _INC_SCRIPT, cog_name, str(path)])
+    for _ in range(20):
+        await driver.inc("GLOBAL", "count", amount=1)
+    assert child.wait(timeout=60) == 0
+
+    assert await driver.get("GLOBAL", "count") == 40
+    assert await driver.get("GUILD") == {"1": {"foo": 1}, "2": {"foo": 1}}
+    assert _saved_data(driver)["0"]["GLOBAL"] == {"count": 40}
@@ -0,0 +1,89 @@
+"""Measure how the cost of bank operations grows with the number of accounts.
+
+Each operation is timed against banks of increasing size, held by the
+in-memory driver. Operations on a single account should take about the same
+time however many accounts there are.
+
+Usage: python tools/bench_bank.py [--accounts N ...] [--calls N]
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from redbot.core import Config, bank, data_manager  # noqa: E402
+from redbot.core.drivers import red_memory  # noqa: E402
+
+Guild = namedtuple("Guild", "id")
+Member = namedtuple("Member", "id guild display_name")
+
+
+def _use_memory_bank(data_path: str):
+    # The bank's journal is kept in the core data path
+    data_manager.basic_config = {**data_manager.basic_config_default, "DATA_PATH": data_path}
+    driver = red_memory.Memory("Bank", "0")
+    config = Config(cog_name="Bank", unique_identifier="0", driver=driver)
+    get_conf = Config.get_conf
+    Config.get_conf = lambda *args, **kwargs: config
+    try:
+        bank._init()
+    finally:
+        Config.get_conf = get_conf
+    return config
+
+
+async def get_balance(member):
+    await bank.get_balance(member)
+
+
+async def deposit(member):
+    await bank.deposit_credits(member, 1)
+
+
+async def position(member):
+    await bank.get_leaderboard_position(member)
+
+
+OPERATIONS = {"get_balance": get_balance, "deposit": deposit, "position": position}
+
+
+async def run(account_counts, calls: int):
+    print("{:<12} {:>10} {:>14}".format("Operation", "Accounts", "Per call (us)"))
+    for count in account_counts:
+        red_memory.clear_stores("Bank")
+        config = _use_memory_bank(tempfile.mkdtemp())
+        guild = Guild(1)
+        members = [Member(i, guild, "Member {}".format(i)) for i in range(count)]
+        async with config.transaction():
+            for member in members:
+                await config.member(member).set({"name": member.display_name, "balance": 100})
+        for name, operation in OPERATIONS.items():
+            start = time.perf_counter()
+            for i in range(calls):
+                await operation(members[i % count])
+            elapsed = time.perf_counter() - start
+            print("{:<12} {:>10} {:>14.1f}".format(name, count, elapsed / calls * 1000000))
+    red_memory.clear_stores("Bank")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--accounts",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Numbers of accounts in the bank.",
+    )
+    parser.add_argument("--calls", type=int, default=500, help="Calls per measurement.")
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(run(args.accounts, args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure how Config access patterns behave with slow storage.
+
+Each scenario runs against the in-memory driver with a range of simulated
+round trip latencies, which shows how much of a cog's time would be spent
+waiting on storage, and how much batching saves.
+
+Usage: python tools/bench_config.py [--members N] [--latency MS ...]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from redbot.core import Config  # noqa: E402
+from redbot.core.drivers import red_memory  # noqa: E402
+
+Guild = namedtuple("Guild", "id")
+Member = namedtuple("Member", "id guild")
+
+
+async def read_each(config: Config, members):
+    for member in members:
+        await config.member(member).balance()
+
+
+async def read_many(config: Config, members):
+    await config.get_many(*(config.member(m).balance for m in members))
+
+
+async def read_all(config: Config, members):
+    await config.all_members(members[0].guild)
+
+
+async def write_each(config: Config, members):
+    for member in members:
+        await config.member(member).balance.set(member.id)
+
+
+async def write_batched(config: Config, members):
+    async with config.transaction():
+        for member in members:
+            await config.member(member).balance.set(member.id)
+
+
+SCENARIOS = {
+    "read each": read_each,
+    "get_many": read_many,
+    "all_members": read_all,
+    "write each": write_each,
+    "transaction": write_batched,
+}
+
+
+async def run(member_count: int, latencies):
+    guild = Guild(1)
+    members = [Member(i, guild) for i in range(member_count)]
+    print("{:<12} {:>12} {:>12} {:>12}".format("Scenario", "Latency (ms)", "Time (ms)", "Trips"))
+    for latency in latencies:
+        driver = red_memory.Memory("Benchmark", "0", latency=latency / 1000)
+        config = Config(cog_name="Benchmark", unique_identifier="0", driver=driver)
+        config.register_member(balance=0)
+        await write_batched(config, members)
+        for name, scenario in SCENARIOS.items():
+            driver.round_trips = 0
+            start = time.perf_counter()
+            await scenario(config, members)
+            elapsed = time.perf_counter() - start
+            print(
+                "{:<12} {:>12.1f} {:>12.1f} {:>12}".format(
+                    name, latency, elapsed * 1000, driver.round_trips
+                )
+            )
+        red_memory.clear_stores("Benchmark")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=200, help="Number of members.")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        nargs="+",
+        default=[0.0, 0.5, 2.0],
+        help="Simulated round trip latencies, in milliseconds.",
+    )
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(run(args.members, args.latency))
+
+
+if __name__ == "__main__":
+    main()
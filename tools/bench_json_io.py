@@ -0,0 +1,148 @@
+"""Compare the JSON serializers available to JsonIO.
+
+Each installed serializer is timed encoding and decoding data shaped like
+real settings files, in both the pretty and the minified format.
+
+Usage: python tools/bench_json_io.py [--repeat N]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from redbot.core.json_io import MINIFIED, PRETTY, _SERIALIZERS  # noqa: E402
+
+
+def _snowflake(rng: random.Random) -> str:
+    return str(rng.randrange(100000000000000000, 999999999999999999))
+
+
+def core_settings(rng: random.Random) -> dict:
+    """Core's settings: a few globals and a handful of keys per guild."""
+    guilds = {
+        _snowflake(rng): {
+            "prefix": ["!"],
+            "admin_role": _snowflake(rng),
+            "mod_role": _snowflake(rng),
+            "embeds": None,
+            "use_bot_color": False,
+            "whitelist": [],
+            "blacklist": [_snowflake(rng) for _ in range(rng.randrange(3))],
+        }
+        for _ in range(2000)
+    }
+    return {
+        "0": {
+            "GLOBAL": {
+                "token": "x" * 59,
+                "prefix": ["[p]"],
+                "packages": ["general", "economy", "trivia", "audio"],
+                "owner": _snowflake(rng),
+                "whitelist": [],
+                "blacklist": [],
+                "locale": "en-US",
+            },
+            "GUILD": guilds,
+        }
+    }
+
+
+def economy_settings(rng: random.Random) -> dict:
+    """Economy's settings: many members per guild, each with a few small values."""
+    members = {
+        _snowflake(rng): {
+            _snowflake(rng): {
+                "balance": rng.randrange(10 ** 6),
+                "next_payday": rng.randrange(1500000000, 1600000000),
+                "name": "Member {}".format(i),
+                "created_at": rng.randrange(1500000000, 1600000000),
+            }
+            for i in range(500)
+        }
+        for _ in range(40)
+    }
+    return {"1256844281": {"MEMBER": members, "GUILD": {g: {} for g in members}}}
+
+
+def trivia_settings(rng: random.Random) -> dict:
+    """Trivia's settings: per guild options and nested per member statistics."""
+    guilds = {
+        _snowflake(rng): {
+            "max_score": 10,
+            "timeout": 120.0,
+            "delay": 15.0,
+            "bot_plays": False,
+            "reveal_answer": True,
+            "payout_multiplier": 0.0,
+            "allow_override": True,
+        }
+        for _ in range(500)
+    }
+    members = {
+        guild_id: {
+            _snowflake(rng): {
+                "wins": rng.randrange(20),
+                "games": rng.randrange(20, 100),
+                "total_score": rng.randrange(1000),
+            }
+            for _ in range(100)
+        }
+        for guild_id in guilds
+    }
+    return {"2340993744": {"GUILD": guilds, "MEMBER": members}}
+
+
+SHAPES = {"core": core_settings, "economy": economy_settings, "trivia": trivia_settings}
+
+
+def _best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per measurement.")
+    args = parser.parse_args()
+
+    serializers = []
+    for cls in _SERIALIZERS:
+        try:
+            serializers.append(cls())
+        except ImportError:
+            print("{} is not installed, skipping it.".format(cls.name))
+
+    rng = random.Random(0)
+    print(
+        "{:<8} {:<7} {:<9} {:>12} {:>12} {:>12}".format(
+            "Shape", "Library", "Format", "Size (KiB)", "Dump (ms)", "Load (ms)"
+        )
+    )
+    for shape, factory in SHAPES.items():
+        data = factory(rng)
+        for serializer in serializers:
+            for format_name, settings in (("pretty", PRETTY), ("minified", MINIFIED)):
+                text = serializer.dumps(data, settings)
+                dump = _best_time(lambda: serializer.dumps(data, settings), args.repeat)
+                load = _best_time(lambda: serializer.loads(text), args.repeat)
+                print(
+                    "{:<8} {:<7} {:<9} {:>12.1f} {:>12.2f} {:>12.2f}".format(
+                        shape,
+                        serializer.name,
+                        format_name,
+                        len(text.encode("utf-8")) / 1024,
+                        dump * 1000,
+                        load * 1000,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()